@@ -1,23 +1,432 @@
 """
 This implements a dispatcher which listens to localhost:8550, and proxies
 requests via qrexec to the service qubes.EthSign on a target domain
+
+Identical concurrent read requests (see COALESCED_METHODS) are sent across
+qrexec only once, and all callers get the same response with their own id.
+
+With --workers N, a parent process forks N workers which share the port via
+SO_REUSEPORT, and restarts them when they die. Requests are only coalesced
+within a worker. With --unix PATH, local clients can also connect over a
+Unix domain socket, which is shared by all workers.
+
+Bodies larger than PARSE_LIMIT, such as typed data to sign or big batches,
+are never parsed or held in memory: they are streamed between the client
+socket and the qrexec pipes, using splice(2) where available.
+
+With several --domain options, requests are spread over several signer
+domains (see Domains): those for an account always go to the same domain,
+others to the least busy one, and failing domains are taken out of rotation
+until they answer again.
 """
 
+import argparse
+import bisect
+import errno
+import hashlib
 import http.server
+import json
+import os
+import re
+import signal
+import socket
 import socketserver,subprocess
+import sys
+import threading
+import time
 
 PORT=8550
 TARGET_DOMAIN= 'debian-work'
 
+# Requests which do not change anything in the signer, so that one answer
+# can serve every caller asking the same at the same time.
+COALESCED_METHODS = {'account_list', 'account_version'}
+
+# Requests to coalesce are tiny, so larger bodies are relayed unparsed.
+PARSE_LIMIT = 4096
+RELAY_CHUNK = 1 << 16
+
+QREXEC_CLIENT = '/usr/bin/qrexec-client-vm'
+SERVICE = 'qubes.Clefsign'
+
+# Points per domain on the hash ring
+VNODES = 64
+# A domain failing this many times in a row is ejected for EJECT_SECONDS
+EJECT_AFTER = 3
+EJECT_SECONDS = 30
+HEALTH_REQUEST = b'{"jsonrpc":"2.0","id":0,"method":"account_version","params":[]}'
+
+ADDRESS = re.compile(r'0x[0-9a-fA-F]{40}\Z')
+# The account of a request too large to parse, if it is near the start
+ACCOUNT_IN_HEAD = re.compile(rb'"params"\s*:\s*\[\s*(?:"[^"]*"\s*,\s*)?(?:"(0x[0-9a-fA-F]{40})"|\{[^{}]*?"from"\s*:\s*"(0x[0-9a-fA-F]{40})")')
+
+def ring_hash(key):
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], 'big')
+
+def account_of(request):
+    """The account a request acts on: the first address among its first two
+    params, or the sender of a transaction"""
+    if not isinstance(request, dict) or not isinstance(request.get('params'), list):
+        return None
+    for param in request['params'][:2]:
+        if isinstance(param, dict):
+            param = param.get('from')
+        if isinstance(param, str) and ADDRESS.match(param):
+            return param.lower()
+    return None
+
+class Domain:
+    def __init__(self, name):
+        self.name = name
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0
+
+    def cmd(self):
+        return [QREXEC_CLIENT,self.name,SERVICE]
+
+class Domains:
+    """
+    The signer domains requests are sent to. Requests for an account go to
+    the same domain, chosen by consistent hashing of its address, so that
+    adding a domain only moves the accounts it takes over. Other requests go
+    to the domain with the fewest requests in flight.
+
+    A domain failing EJECT_AFTER times in a row, in requests or in the
+    account_version health checks, gets no requests for EJECT_SECONDS or
+    until it passes a health check. Its accounts meanwhile go to the next
+    domain on the ring.
+    """
+    def __init__(self, names, health_interval=0):
+        self.domains = [Domain(name) for name in names]
+        self.health_interval = health_interval
+        self.lock = threading.Lock()
+        self.ring = sorted(((ring_hash('%s#%d' % (d.name, i)), d) for d in self.domains for i in range(VNODES)),
+                           key=lambda point: point[0])
+        self.points = [h for h, _ in self.ring]
+
+    def pick(self, account):
+        now = time.monotonic()
+        with self.lock:
+            healthy = [d for d in self.domains if d.ejected_until <= now] or self.domains
+            if account is None:
+                domain = min(healthy, key=lambda d: d.outstanding)
+            else:
+                i = bisect.bisect(self.points, ring_hash(account))
+                for j in range(len(self.ring)):
+                    domain = self.ring[(i + j) % len(self.ring)][1]
+                    if domain in healthy:
+                        break
+            domain.outstanding += 1
+            return domain
+
+    def done(self, domain, ok):
+        with self.lock:
+            domain.outstanding -= 1
+            self._outcome(domain, ok)
+
+    def _outcome(self, domain, ok):
+        if ok:
+            if domain.ejected_until:
+                print("Domain", domain.name, "is back", file=sys.stderr)
+            domain.failures = 0
+            domain.ejected_until = 0
+            return
+        domain.failures += 1
+        if domain.failures >= EJECT_AFTER and domain.ejected_until <= time.monotonic():
+            print("Ejecting domain", domain.name, "after", domain.failures, "failures", file=sys.stderr)
+            domain.ejected_until = time.monotonic() + EJECT_SECONDS
+
+    def call(self, data, account=None):
+        domain = self.pick(account)
+        ok = False
+        try:
+            p = subprocess.Popen(domain.cmd(),stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            output = p.communicate(data)[0]
+            ok = p.returncode == 0 and len(output) > 0
+            return output
+        finally:
+            self.done(domain, ok)
+
+    def start_health_checks(self):
+        # With a single domain there is nothing to fail over to
+        if self.health_interval > 0 and len(self.domains) > 1:
+            threading.Thread(target=self._check_health, daemon=True).start()
+
+    def _check_health(self):
+        while True:
+            time.sleep(self.health_interval)
+            for domain in self.domains:
+                try:
+                    output = subprocess.run(domain.cmd(), input=HEALTH_REQUEST, stdout=subprocess.PIPE,
+                                            timeout=self.health_interval).stdout
+                    ok = 'result' in json.loads(output)
+                except (OSError, ValueError, TypeError, subprocess.TimeoutExpired):
+                    ok = False
+                with self.lock:
+                    self._outcome(domain, ok)
+
+domains = Domains([TARGET_DOMAIN])
+
+def write_all(fd, data):
+    data = memoryview(data)
+    while data:
+        data = data[os.write(fd, data):]
+
+def splice(src, dst, count):
+    """Move up to count bytes from src to dst in the kernel. Returns None
+    if splice(2) cannot be used for this pair of descriptors."""
+    if not hasattr(os, 'splice'):
+        return None
+    try:
+        return os.splice(src, dst, count)
+    except OSError as e:
+        if e.errno in (errno.EINVAL, errno.ENOSYS):
+            return None
+        raise
+
+def copy_in(sock, fd, count):
+    """Copy count bytes from a socket to a pipe"""
+    while count:
+        moved = splice(sock.fileno(), fd, min(count, RELAY_CHUNK))
+        if moved is None:
+            break
+        if not moved:
+            return
+        count -= moved
+    buf = memoryview(bytearray(min(count, RELAY_CHUNK)))
+    while count:
+        got = sock.recv_into(buf, min(count, len(buf)))
+        if not got:
+            return
+        write_all(fd, buf[:got])
+        count -= got
+
+def copy_out(fd, sock):
+    """Copy everything from a pipe to a socket"""
+    while True:
+        moved = splice(fd, sock.fileno(), RELAY_CHUNK)
+        if moved is None:
+            break
+        if not moved:
+            return
+    buf = memoryview(bytearray(RELAY_CHUNK))
+    while True:
+        got = os.readv(fd, [buf])
+        if not got:
+            return
+        sock.sendall(buf[:got])
+
+class Flight:
+    """A request in flight, which callers with the same key wait for"""
+    def __init__(self):
+        self.done = threading.Event()
+        self.output = None
+
+flights = {}
+flights_lock = threading.Lock()
+
+def coalesce_key(request):
+    """The key of a request which can share a flight, or None"""
+    if not isinstance(request, dict) or request.get('method') not in COALESCED_METHODS:
+        return None
+    return json.dumps([request['method'], request.get('params')], sort_keys=True, separators=(',', ':'))
+
+def single_flight(key, data):
+    with flights_lock:
+        flight = flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = flights[key] = Flight()
+    if not leader:
+        flight.done.wait()
+        if flight.output is not None:
+            return flight.output
+        # The leader failed, try on our own
+        return domains.call(data)
+    try:
+        flight.output = domains.call(data)
+    finally:
+        with flights_lock:
+            del flights[key]
+        flight.done.set()
+    return flight.output
+
+def with_id(output, id):
+    """Rewrite the id of a JSON-RPC response, if it differs"""
+    try:
+        response = json.loads(output)
+    except ValueError:
+        return output
+    if not isinstance(response, dict) or response.get('id') == id:
+        return output
+    response['id'] = id
+    return json.dumps(response).encode() + b'\n'
+
 class Dispatcher(http.server.BaseHTTPRequestHandler):
     def do_POST(self):
-        post_data = self.rfile.read(int(self.headers['Content-Length']))
-        p = subprocess.Popen(['/usr/bin/qrexec-client-vm',TARGET_DOMAIN,'qubes.Clefsign'],stdin=subprocess.PIPE, stdout=subprocess.PIPE)
-        output = p.communicate(post_data)[0]
+        length = int(self.headers['Content-Length'])
+        if length > PARSE_LIMIT:
+            self.relay(length)
+            return
+        post_data = self.rfile.read(length)
+        try:
+            request = json.loads(post_data)
+        except ValueError:
+            request = None
+        key = coalesce_key(request)
+        if key is None:
+            output = domains.call(post_data, account_of(request))
+        else:
+            output = with_id(single_flight(key, post_data), request.get('id'))
         self.wfile.write(output)
 
+    def relay(self, length):
+        """Stream the body to qrexec and the output back to the client"""
+        # Only the head is read, to find the account to route by
+        head = self.rfile.read(PARSE_LIMIT)
+        m = ACCOUNT_IN_HEAD.search(head)
+        account = (m.group(1) or m.group(2)).decode().lower() if m else None
+        domain = domains.pick(account)
+        ok = False
+        try:
+            # A domain which qrexec cannot be started for counts as failing,
+            # and its request as no longer outstanding
+            p = subprocess.Popen(domain.cmd(),stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+            feeder = threading.Thread(target=self.feed, args=(p.stdin, head, length - len(head)))
+            feeder.start()
+            try:
+                copy_out(p.stdout.fileno(), self.connection)
+            finally:
+                feeder.join()
+                p.stdout.close()
+                p.wait()
+            ok = p.returncode == 0
+        finally:
+            domains.done(domain, ok)
+
+    def feed(self, stdin, head, length):
+        try:
+            write_all(stdin.fileno(), head)
+            # More of the body may already be buffered with the headers
+            buffered = self.rfile.peek(length)[:length] if length else b''
+            self.rfile.read(len(buffered))
+            write_all(stdin.fileno(), buffered)
+            copy_in(self.connection, stdin.fileno(), length - len(buffered))
+        except OSError:
+            # qrexec went away; its output tells the client what happened
+            pass
+        finally:
+            stdin.close()
+
+class Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    # Dapps open many connections at startup; a short backlog would delay
+    # some of them past the flight they could have joined.
+    request_queue_size = 128
+    allow_reuse_address = True
+    reuse_port = False
 
-with socketserver.TCPServer(("",PORT), Dispatcher) as httpd:
-    print("Serving at port", PORT)
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        # Created private, chmod after bind would leave a window in which
+        # other users can connect
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def get_request(self):
+        # Unix sockets have no peer address, which the request log expects
+        request, _ = self.socket.accept()
+        return request, (self.server_address, 0)
+
+def serve(port, reuse_port, unix_server):
+    """Run one worker: the TCP listener, and the inherited Unix listener"""
+    Server.reuse_port = reuse_port
+    httpd = Server(("",port), Dispatcher)
+    domains.start_health_checks()
+    if unix_server is not None:
+        threading.Thread(target=unix_server.serve_forever, daemon=True).start()
     httpd.serve_forever()
 
+def spawn(port, unix_server):
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        try:
+            serve(port, True, unix_server)
+        finally:
+            os._exit(1)
+    return pid
+
+def supervise(workers, port, unix_server):
+    """Fork the workers and restart them when they exit, backing off when
+    they keep dying right after being started."""
+    children = {}
+    backoff = 1
+
+    def stop(signum, frame):
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+        if unix_server is not None:
+            os.unlink(unix_server.server_address)
+        sys.exit(0)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        children[spawn(port, unix_server)] = time.monotonic()
+    while True:
+        pid, status = os.wait()
+        started = children.pop(pid, None)
+        if started is None:
+            continue
+        print("Worker %d exited with status %d" % (pid, os.waitstatus_to_exitcode(status)), file=sys.stderr)
+        if time.monotonic() - started < 60:
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+        else:
+            backoff = 1
+        children[spawn(port, unix_server)] = time.monotonic()
+
+def main():
+    global domains, QREXEC_CLIENT
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=PORT, help='TCP port to listen on')
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes sharing the port')
+    parser.add_argument('--unix', metavar='PATH', help='also listen on a Unix domain socket')
+    parser.add_argument('--domain', action='append', dest='domains', metavar='NAME',
+                        help='signer domain to send requests to, can be repeated (default: %s)' % TARGET_DOMAIN)
+    parser.add_argument('--health-interval', type=float, default=10,
+                        help='seconds between health checks of the domains, 0 to disable')
+    parser.add_argument('--qrexec-client', default=QREXEC_CLIENT,
+                        help='program to reach a domain with, called as PROGRAM DOMAIN %s' % SERVICE)
+    args = parser.parse_args()
+
+    QREXEC_CLIENT = args.qrexec_client
+    domains = Domains(args.domains or [TARGET_DOMAIN], args.health_interval)
+
+    unix_server = UnixServer(args.unix, Dispatcher) if args.unix else None
+    print("Serving at port", args.port, flush=True)
+    if unix_server is not None:
+        print("Serving at", args.unix, flush=True)
+    if args.workers > 1:
+        supervise(args.workers, args.port, unix_server)
+    else:
+        serve(args.port, False, unix_server)
+
+if __name__ == '__main__':
+    main()
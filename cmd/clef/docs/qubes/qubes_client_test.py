@@ -0,0 +1,286 @@
+import collections
+import importlib.util
+import json
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+import unittest
+
+spec = importlib.util.spec_from_file_location(
+    "qubes_client", os.path.join(os.path.dirname(__file__), "qubes-client.py"))
+qubes_client = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(qubes_client)
+
+
+class QuietServer(qubes_client.Server):
+    def handle_error(self, request, client_address):
+        pass
+
+
+# A signer domain, answering with its name after the request is read. It
+# fails while a file fail-DOMAIN exists, and waits while a file hold exists.
+SIGNER = """
+cd '%s'
+echo "$1" >> calls
+if [ -e "fail-$1" ]; then exit 1; fi
+while [ -e hold ]; do sleep 0.01; done
+cat > /dev/null
+echo '{"jsonrpc":"2.0","id":0,"result":"'"$1"'"}'
+"""
+
+
+class StandInTest(unittest.TestCase):
+    """Runs the proxy against a stand-in for qrexec-client-vm"""
+    DOMAINS = ["a", "b"]
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.saved = (qubes_client.QREXEC_CLIENT, qubes_client.domains)
+        qubes_client.domains = qubes_client.Domains(self.DOMAINS)
+        self.httpd = QuietServer(("127.0.0.1", 0), qubes_client.Dispatcher)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        qubes_client.QREXEC_CLIENT, qubes_client.domains = self.saved
+        self.dir.cleanup()
+
+    def qrexec_client(self, script):
+        path = os.path.join(self.dir.name, "qrexec-client-vm")
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n" + script + "\n")
+        os.chmod(path, 0o755)
+        qubes_client.QREXEC_CLIENT = path
+
+    def post(self, body):
+        """POST body and return everything the proxy sends back"""
+        with socket.create_connection(self.httpd.server_address) as s:
+            s.sendall(b"POST / HTTP/1.0\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+            chunks = []
+            while True:
+                chunk = s.recv(65536)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+
+    def outstanding(self):
+        return [d.outstanding for d in qubes_client.domains.domains]
+
+    def touch(self, name):
+        open(os.path.join(self.dir.name, name), "w").close()
+
+    def remove(self, name):
+        os.unlink(os.path.join(self.dir.name, name))
+
+    def calls(self):
+        try:
+            with open(os.path.join(self.dir.name, "calls")) as f:
+                return f.read().split()
+        except FileNotFoundError:
+            return []
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 10
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+
+class FailedSpawnTest(StandInTest):
+    def test_relay_spawn_fails(self):
+        qubes_client.QREXEC_CLIENT = os.path.join(self.dir.name, "missing")
+        body = b'{"jsonrpc":"2.0","id":1,"method":"account_signData","params":["' + \
+            b"a" * (2 * qubes_client.PARSE_LIMIT) + b'"]}'
+        for _ in range(qubes_client.EJECT_AFTER):
+            self.assertEqual(self.post(body), b"")
+            self.assertEqual(self.outstanding(), [0, 0])
+        # Requests are no longer sent to a domain failing to start
+        self.assertGreater(sum(d.ejected_until for d in qubes_client.domains.domains), 0)
+
+    def test_call_spawn_fails(self):
+        qubes_client.QREXEC_CLIENT = os.path.join(self.dir.name, "missing")
+        with self.assertRaises(OSError):
+            qubes_client.domains.call(b"{}")
+        self.assertEqual(self.outstanding(), [0, 0])
+        self.assertEqual(sum(d.failures for d in qubes_client.domains.domains), 1)
+
+    def test_relay_after_failed_spawn(self):
+        qubes_client.QREXEC_CLIENT = os.path.join(self.dir.name, "missing")
+        body = b'{"params":["' + b"a" * (2 * qubes_client.PARSE_LIMIT) + b'"]}'
+        self.post(body)
+        self.qrexec_client("exec cat")
+        self.assertEqual(self.post(body), body)
+        self.assertEqual(self.outstanding(), [0, 0])
+
+
+ACCOUNTS = ["0x%040x" % (i * 7919) for i in range(1000)]
+
+
+def owners(names):
+    """The domain each of ACCOUNTS is sent to"""
+    domains = qubes_client.Domains(names)
+    result = {}
+    for account in ACCOUNTS:
+        domain = domains.pick(account)
+        domains.done(domain, True)
+        result[account] = domain.name
+    return result
+
+
+class RingTest(unittest.TestCase):
+    def test_same_domain(self):
+        self.assertEqual(owners(["a", "b", "c"]), owners(["c", "a", "b"]))
+
+    def test_spread(self):
+        shares = collections.Counter(owners(["a", "b", "c"]).values())
+        self.assertEqual(sorted(shares), ["a", "b", "c"])
+        self.assertGreater(min(shares.values()), len(ACCOUNTS) // 6)
+
+    def test_remove_domain(self):
+        before = owners(["a", "b", "c"])
+        after = owners(["a", "c"])
+        moved = [account for account in ACCOUNTS if before[account] != after[account]]
+        self.assertEqual(moved, [account for account in ACCOUNTS if before[account] == "b"])
+
+
+class RoutingTest(StandInTest):
+    def setUp(self):
+        super().setUp()
+        self.qrexec_client(SIGNER % self.dir.name)
+        self.saved_eject_seconds = qubes_client.EJECT_SECONDS
+
+    def tearDown(self):
+        qubes_client.EJECT_SECONDS = self.saved_eject_seconds
+        super().tearDown()
+
+    def domain(self, name):
+        return next(d for d in qubes_client.domains.domains if d.name == name)
+
+    def sign(self, account):
+        """Send a request for account, returns the domain answering it"""
+        body = b'{"jsonrpc":"2.0","id":1,"method":"account_signTransaction","params":[{"from":"%s"}]}' % \
+            account.encode()
+        output = self.post(body)
+        return json.loads(output)["result"] if output else None
+
+    def eject(self, name):
+        """Fail requests of an account of domain name until it is ejected"""
+        account = next(a for a, owner in owners(self.DOMAINS).items() if owner == name)
+        self.touch("fail-" + name)
+        for _ in range(qubes_client.EJECT_AFTER):
+            self.assertIsNone(self.sign(account))
+        self.assertGreater(self.domain(name).ejected_until, 0)
+        # Its accounts go to the next domain meanwhile
+        self.assertEqual(self.sign(account), "b" if name == "a" else "a")
+        self.remove("fail-" + name)
+        return account
+
+    def test_least_outstanding(self):
+        body = b'{"jsonrpc":"2.0","id":1,"method":"account_signData","params":[]}'
+        self.touch("hold")
+        answers = []
+        threads = [threading.Thread(target=lambda: answers.append(json.loads(self.post(body))["result"]))
+                   for _ in range(2)]
+        for n, thread in enumerate(threads, 1):
+            thread.start()
+            self.wait_for(lambda: len(self.calls()) == n)
+        # The second request went to the domain the first is not waiting on
+        self.assertEqual(sorted(self.calls()), ["a", "b"])
+        self.assertEqual(self.outstanding(), [1, 1])
+        self.remove("hold")
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(sorted(answers), ["a", "b"])
+        self.assertEqual(self.outstanding(), [0, 0])
+
+    def test_readmitted_after_window(self):
+        qubes_client.EJECT_SECONDS = 0.2
+        account = self.eject("a")
+        self.wait_for(lambda: self.domain("a").ejected_until <= time.monotonic())
+        self.assertEqual(self.sign(account), "a")
+        self.assertEqual((self.domain("a").failures, self.domain("a").ejected_until), (0, 0))
+
+    def test_readmitted_after_health_check(self):
+        account = self.eject("a")
+        domains = qubes_client.domains
+        domains.health_interval = 0.05
+        domains.start_health_checks()
+        # Stops the checks of the stand-in once the test is over
+        self.addCleanup(setattr, domains, "domains", [])
+        self.wait_for(lambda: self.domain("a").ejected_until == 0)
+        self.assertEqual(self.sign(account), "a")
+
+
+class CountingEvent(threading.Event):
+    def __init__(self):
+        super().__init__()
+        self.waiters = 0
+
+    def wait(self, timeout=None):
+        self.waiters += 1
+        return super().wait(timeout)
+
+
+class CountedFlight(qubes_client.Flight):
+    """A flight counting the callers waiting for it"""
+    def __init__(self):
+        super().__init__()
+        self.done = CountingEvent()
+
+
+class CoalescingTest(StandInTest):
+    CALLERS = 8
+
+    def setUp(self):
+        super().setUp()
+        self.qrexec_client(SIGNER % self.dir.name)
+        self.saved_flight = qubes_client.Flight
+        qubes_client.Flight = CountedFlight
+
+    def tearDown(self):
+        qubes_client.Flight = self.saved_flight
+        super().tearDown()
+
+    def test_one_spawn_for_identical_requests(self):
+        self.touch("hold")
+        responses = {}
+
+        def call(id):
+            body = b'{"jsonrpc":"2.0","id":%d,"method":"account_list","params":[]}' % id
+            responses[id] = json.loads(self.post(body))
+
+        threads = [threading.Thread(target=call, args=(id,)) for id in range(1, self.CALLERS + 1)]
+        threads[0].start()
+        self.wait_for(lambda: len(self.calls()) == 1)
+        flight = next(iter(qubes_client.flights.values()))
+        for thread in threads[1:]:
+            thread.start()
+        self.wait_for(lambda: flight.done.waiters == self.CALLERS - 1)
+        self.remove("hold")
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(len(self.calls()), 1)
+        self.assertEqual(qubes_client.flights, {})
+        # Every caller gets the one answer, with its own id
+        self.assertEqual(responses, {id: {"jsonrpc": "2.0", "id": id, "result": responses[1]["result"]}
+                                     for id in range(1, self.CALLERS + 1)})
+
+
+
+class UnixServerTest(unittest.TestCase):
+    def test_socket_private(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "clef.sock")
+            server = qubes_client.UnixServer(path, qubes_client.Dispatcher)
+            try:
+                self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+            finally:
+                server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
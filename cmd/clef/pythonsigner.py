@@ -1,8 +1,32 @@
+import argparse
+import atexit
+import base64
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import heapq
+import itertools
+import json
+import math
+import mmap
+import os
+import queue
+import re
+import socketserver
+import struct
 import sys
 import subprocess
+import threading
+import time
+import zlib
+from collections.abc import Mapping
 
+from tinyrpc.exc import RPCError
 from tinyrpc.transports import ServerTransport
-from tinyrpc.protocols.jsonrpc import JSONRPCProtocol
+from tinyrpc.protocols.jsonrpc import JSONRPCParseError, JSONRPCProtocol
 from tinyrpc.dispatch import public, RPCDispatcher
 from tinyrpc.server import RPCServer
 
@@ -19,6 +43,38 @@ where an attacker can access process memory.
 To make this work install all the requirements:
 
   pip install -r requirements.txt
+
+With --instances N the UI supervises N clef processes instead of one, each
+with its own keystore, config directory and audit log below --shard-dir,
+and answers all of them from the same handler. Crashed instances are
+restarted with exponential backoff, and the number of requests waiting for
+an answer is reported per instance.
+
+The hash of every sign data request is recomputed from its raw data before
+it is shown. Install pycryptodome for a faster keccak256 than the built-in
+pure-Python one.
+
+Requests are decoded lazily: only the fields a handler reads are turned into
+Python objects, using orjson or ujson if installed.
+
+With --approval-socket PATH transactions are not rejected but queued by
+priority for reviewers, who claim and answer them over a Unix socket; see
+ApprovalRequestHandler for the protocol.
+
+With --audit-log every approval decision is appended to a durable log, which
+can be printed with --dump-audit-log.
+
+With --account-history PATH the number of approved and rejected transactions
+per sending account is kept across restarts, in a snapshot which is mapped
+on startup instead of being read, and shown with every transaction.
+
+With --listing-allowlist PATH account listings are answered with the accounts
+the allowlist grants the calling origin, instead of being denied.
+
+With --deadline SECONDS every request is expected to be answered within that
+time of its arrival: hash verification is skipped and transactions are
+rejected without review when too little time is left, and histograms of the
+budget used and deadlines missed are reported every --stats-interval.
 """
 
 try:
@@ -26,6 +82,398 @@ try:
 except ImportError:
     import urllib as urlparse
 
+try:
+    # pycryptodome releases the GIL while hashing and reads any buffer
+    # without copying it, so a thread pool is enough.
+    from Crypto.Hash import keccak as _keccak
+
+    def keccak256(data):
+        return _keccak.new(data=data, digest_bits=256).digest()
+
+    HashPool = concurrent.futures.ThreadPoolExecutor
+except ImportError:
+    # Pure-Python fallback, so that the UI also works offline. It holds the
+    # GIL, so hashing runs in worker processes instead.
+    _KECCAK_RC = [
+        0x0000000000000001, 0x0000000000008082, 0x800000000000808A,
+        0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
+        0x8000000080008081, 0x8000000000008009, 0x000000000000008A,
+        0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+        0x000000008000808B, 0x800000000000008B, 0x8000000000008089,
+        0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
+        0x000000000000800A, 0x800000008000000A, 0x8000000080008081,
+        0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+    ]
+    # Rotation offsets, indexed by x + 5 * y.
+    _KECCAK_ROT = [
+        0, 1, 62, 28, 27,
+        36, 44, 6, 55, 20,
+        3, 10, 43, 25, 39,
+        41, 45, 15, 21, 8,
+        18, 2, 61, 56, 14,
+    ]
+    _MASK = (1 << 64) - 1
+
+    def _keccak_f(a):
+        for rc in _KECCAK_RC:
+            c = [a[x] ^ a[x + 5] ^ a[x + 10] ^ a[x + 15] ^ a[x + 20]
+                 for x in range(5)]
+            d = [c[(x - 1) % 5] ^ (((c[(x + 1) % 5] << 1) |
+                                   (c[(x + 1) % 5] >> 63)) & _MASK)
+                 for x in range(5)]
+            b = [0] * 25
+            for x in range(5):
+                for y in range(5):
+                    v = a[x + 5 * y] ^ d[x]
+                    r = _KECCAK_ROT[x + 5 * y]
+                    b[y + 5 * ((2 * x + 3 * y) % 5)] = \
+                        ((v << r) | (v >> (64 - r))) & _MASK
+            for y in range(0, 25, 5):
+                row = b[y:y + 5]
+                for x in range(5):
+                    a[y + x] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+            a[0] ^= rc
+
+    def keccak256(data):
+        rate = 136
+        data = memoryview(data).cast("B")
+        a = [0] * 25
+        full = len(data) - len(data) % rate
+        for off in range(0, full, rate):
+            block = data[off:off + rate]
+            for i in range(rate // 8):
+                a[i] ^= int.from_bytes(block[8 * i:8 * i + 8], "little")
+            _keccak_f(a)
+        block = bytearray(data[full:])
+        block += bytes(rate - len(block))
+        block[len(data) - full] ^= 0x01
+        block[rate - 1] ^= 0x80
+        for i in range(rate // 8):
+            a[i] ^= int.from_bytes(block[8 * i:8 * i + 8], "little")
+        _keccak_f(a)
+        return b"".join(a[i].to_bytes(8, "little") for i in range(4))
+
+    HashPool = concurrent.futures.ProcessPoolExecutor
+
+
+def _rlp_is_single_list(data):
+    """Whether data is exactly one RLP encoded list."""
+    if len(data) == 0 or data[0] < 0xC0:
+        return False
+    if data[0] <= 0xF7:
+        return 1 + data[0] - 0xC0 == len(data)
+    n = data[0] - 0xF7
+    if len(data) < 1 + n or data[1] == 0:
+        return False
+    return 1 + n + int.from_bytes(data[1:1 + n], "big") == len(data)
+
+
+def _text_message_ok(data):
+    """Whether data is "\\x19Ethereum Signed Message:\\n" followed by the
+    decimal length of the message and the message."""
+    prefix = b"\x19Ethereum Signed Message:\n"
+    if bytes(data[:len(prefix)]) != prefix:
+        return False
+    rest = bytes(data[len(prefix):])
+    # The message itself may start with digits, so try every split.
+    for i in range(1, len(rest) + 1):
+        if not rest[:i].isdigit():
+            break
+        if int(rest[:i]) == len(rest) - i:
+            return True
+    return False
+
+
+def check_sign_data(content_type, raw_data):
+    """
+    Recompute the hash clef is asking to sign from the raw data, which is
+    the preimage for every content type:
+
+      text/plain: keccak256("\\x19Ethereum Signed Message:\\n" len message)
+      data/validator: keccak256("\\x19\\x00" validator data) (EIP-191)
+      data/typed: keccak256("\\x19\\x01" domainSeparator hashStruct(message))
+      application/x-clique-header: keccak256(rlp(header without seal))
+
+    :return: the computed hash and a description of a malformed preimage,
+    or None
+    """
+    data = memoryview(raw_data)
+    if content_type == "text/plain":
+        ok = _text_message_ok(data)
+    elif content_type == "data/validator":
+        ok = bytes(data[:2]) == b"\x19\x00" and len(data) >= 22
+    elif content_type == "data/typed":
+        ok = bytes(data[:2]) == b"\x19\x01" and len(data) == 66
+    elif content_type == "application/x-clique-header":
+        ok = _rlp_is_single_list(data)
+    else:
+        ok = True
+    problem = None if ok else "malformed {} data".format(content_type)
+    return keccak256(data), problem
+
+
+class SignDataVerifier:
+    """Checks the hash of sign data requests in a pool of workers, so that
+    large payloads do not hold up the requests of other instances."""
+
+    TIMEOUT = 30
+
+    def __init__(self, workers=None):
+        self.pool = HashPool(max_workers=workers)
+
+    def verify(self, req, timeout=None):
+        """
+        :param timeout: seconds to wait for the result at most, if less
+            than TIMEOUT
+        :return: None if req["hash"] is the hash of req["raw_data"], and
+        the reason why not otherwise
+        """
+        try:
+            if isinstance(req, LazyObject) and "raw_data" in req:
+                raw_data = req.string_bytes("raw_data")
+            else:
+                raw_data = req.get("raw_data") or ""
+            raw_data = base64.b64decode(raw_data, validate=True)
+            expected = bytes.fromhex(req.get("hash", "")[2:])
+        except (TypeError, ValueError):
+            return "undecodable raw_data or hash"
+        future = self.pool.submit(
+            check_sign_data, req.get("content_type"), raw_data)
+        if timeout is None or timeout > self.TIMEOUT:
+            timeout = self.TIMEOUT
+        try:
+            computed, problem = future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            return "hash verification timed out"
+        if problem is not None:
+            return problem
+        if computed != expected:
+            return "hash mismatch, computed 0x{}".format(computed.hex())
+        return None
+
+
+# JSON backend for decoding request fields. orjson and ujson are used when
+# installed; set_json_backend selects one explicitly.
+JSON_BACKENDS = {"json": lambda b: json.loads(bytes(b))}
+try:
+    import orjson
+
+    JSON_BACKENDS["orjson"] = orjson.loads
+except ImportError:
+    pass
+try:
+    import ujson
+
+    JSON_BACKENDS["ujson"] = lambda b: ujson.loads(bytes(b))
+except ImportError:
+    pass
+json_loads = next(
+    JSON_BACKENDS[name] for name in ("orjson", "ujson", "json")
+    if name in JSON_BACKENDS)
+
+
+def set_json_backend(name):
+    global json_loads
+    if name != "auto":
+        json_loads = JSON_BACKENDS[name]
+
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_SCALAR_END = re.compile(rb"[,\]} \t\n\r]")
+
+# Large containers recently skipped, by their first bytes. clef repeats some
+# of them in every request, e.g. the keystore accounts in listings, which
+# are then skipped with one comparison instead of a scan.
+_RECENT_PREFIX = 64
+_RECENT_MIN_SIZE = 4096
+_RECENT_MAX = 8
+_recent_values = {}
+
+
+def _skip_string(buf, pos):
+    """Return the end of the JSON string starting at buf[pos]."""
+    while True:
+        end = buf.find(b'"', pos + 1)
+        if end < 0:
+            raise ValueError("unterminated string")
+        k = end - 1
+        while buf[k] == 0x5C:
+            k -= 1
+        if (end - 1 - k) % 2 == 0:
+            return end + 1
+        pos = end
+
+
+def _skip_value(buf, pos):
+    """
+    Return the end of the JSON value starting at buf[pos]. Only the
+    structure is followed, using C-level searches, so the cost depends on
+    the number of strings and brackets rather than on the size of the value.
+    """
+    c = buf[pos:pos + 1]
+    if c == b'"':
+        return _skip_string(buf, pos)
+    if c not in (b"[", b"{"):
+        m = _SCALAR_END.search(buf, pos)
+        return m.start() if m else len(buf)
+    prefix = bytes(buf[pos:pos + _RECENT_PREFIX])
+    known = _recent_values.get(prefix)
+    if known is not None and buf.startswith(known, pos):
+        # The scan of a complete value stops where it ends.
+        return pos + len(known)
+    start = pos
+    depth = 0
+    while True:
+        m = _STRUCTURAL.search(buf, pos)
+        if m is None:
+            raise ValueError("unterminated value")
+        c = buf[m.start()]
+        if c == 0x22:
+            pos = _skip_string(buf, m.start())
+            continue
+        depth += 1 if c in b"[{" else -1
+        pos = m.end()
+        if depth == 0:
+            break
+    if pos - start >= _RECENT_MIN_SIZE:
+        if len(_recent_values) >= _RECENT_MAX:
+            _recent_values.clear()
+        _recent_values[prefix] = bytes(buf[start:pos])
+    return pos
+
+
+def _scan(buf, pos, close, parse_value):
+    """
+    Parse the members of a JSON object (close == b"}") or the elements of an
+    array (close == b"]") whose opening bracket is at buf[pos - 1]. Each
+    value is parsed by parse_value(key, pos), which returns the value and
+    its end, with key None for array elements.
+
+    :return: the list of (key, value) and the end of the object or array
+    """
+    items = []
+    pos = _WS.match(buf, pos).end()
+    if buf[pos:pos + 1] == close:
+        return items, pos + 1
+    while True:
+        key = None
+        if close == b"}":
+            if buf[pos:pos + 1] != b'"':
+                raise ValueError("expected a key")
+            key_end = _skip_value(buf, pos)
+            key = json_loads(buf[pos:key_end])
+            pos = _WS.match(buf, key_end).end()
+            if buf[pos:pos + 1] != b":":
+                raise ValueError("expected ':'")
+            pos = _WS.match(buf, pos + 1).end()
+        value, pos = parse_value(key, pos)
+        items.append((key, value))
+        pos = _WS.match(buf, pos).end()
+        c = buf[pos:pos + 1]
+        if c == close:
+            return items, pos + 1
+        if c != b",":
+            raise ValueError("expected ',' or {!r}".format(close))
+        pos = _WS.match(buf, pos + 1).end()
+
+
+class LazyObject(Mapping):
+    """
+    A JSON object whose members are decoded on first access, directly from
+    the buffer of the request they arrived in.
+    """
+
+    def __init__(self, buf, pos):
+        """Scan the object starting at buf[pos], see end for where it ends."""
+        self.buf = buf
+
+        def span(key, pos):
+            end = _skip_value(buf, pos)
+            return (pos, end), end
+
+        members, self.end = _scan(buf, pos + 1, b"}", span)
+        self.members = dict(members)
+        self.decoded = {}
+
+    def __getitem__(self, key):
+        try:
+            return self.decoded[key]
+        except KeyError:
+            start, end = self.members[key]
+            value = self.decoded[key] = json_loads(self.buf[start:end])
+            return value
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def __len__(self):
+        return len(self.members)
+
+    def raw(self, key):
+        """The undecoded JSON text of a member, as a memoryview."""
+        start, end = self.members[key]
+        return memoryview(self.buf)[start:end]
+
+    def string_bytes(self, key):
+        """
+        The contents of a string member as bytes, without decoding it to a
+        str if it contains no escapes (e.g. base64 data).
+        """
+        raw = self.raw(key)
+        if raw[:1] == b'"' and b"\\" not in raw:
+            return raw[1:-1]
+        value = self[key]
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+
+class LazyJSONRPCProtocol(JSONRPCProtocol):
+    """
+    JSON-RPC protocol which decodes only the envelope of a request eagerly.
+    Parameters which are objects become LazyObjects over the request buffer,
+    the undecoded parameter list is kept as request.raw_params and the time
+    of parsing as request.arrived.
+    """
+
+    def parse_request(self, data):
+        arrived = time.monotonic()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        start = _WS.match(data).end()
+        if data[start:start + 1] != b"{":
+            # Batches and invalid requests
+            return super().parse_request(data)
+        spans = {}
+
+        def member(key, pos):
+            if key == "params" and data[pos:pos + 1] == b"[":
+                value, end = _scan(data, pos + 1, b"]", element)
+                value = [v for (_, v) in value]
+            else:
+                end = _skip_value(data, pos)
+                value = json_loads(data[pos:end])
+            spans[key] = (pos, end)
+            return value, end
+
+        def element(key, pos):
+            if data[pos:pos + 1] == b"{":
+                obj = LazyObject(data, pos)
+                return obj, obj.end
+            end = _skip_value(data, pos)
+            return json_loads(data[pos:end]), end
+
+        try:
+            members, end = _scan(data, start + 1, b"}", member)
+            if data[end:].strip():
+                raise ValueError("trailing data")
+        except (ValueError, IndexError):
+            raise JSONRPCParseError()
+        request = self._parse_subrequest(dict(members))
+        request.arrived = arrived
+        if "params" in spans:
+            request.raw_params = memoryview(data)[slice(*spans["params"])]
+        return request
+
 
 class StdIOTransport(ServerTransport):
     """Uses std input/output for RPC"""
@@ -43,6 +491,7 @@ class PipeTransport(ServerTransport):
     def __init__(self, input, output):
         self.input = input
         self.output = output
+        self.lock = threading.Lock()
 
     def receive_message(self):
         data = self.input.readline()
@@ -51,8 +500,9 @@ class PipeTransport(ServerTransport):
 
     def send_reply(self, context, reply):
         reply = str(reply, "utf-8")
-        print("<< {}".format(reply))
-        self.output.write("{}\n".format(reply))
+        with self.lock:
+            print("<< {}".format(reply))
+            self.output.write("{}\n".format(reply))
 
 
 def sanitize(txt, limit=100):
@@ -79,9 +529,338 @@ def metaString(meta):
     )
 
 
-class StdIOHandler:
+def value_at_risk(transaction):
+    """Wei a transaction can move or burn: its value plus the maximum fee."""
+    def number(key):
+        try:
+            return int(transaction.get(key) or "0x0", 16)
+        except (TypeError, ValueError):
+            return 0
+
+    fee = number("maxFeePerGas") or number("gasPrice")
+    return number("value") + number("gas") * fee
+
+
+def origin_class(meta):
+    """
+    Rank the origin of a request: 0 for the local machine (in-proc and IPC),
+    1 for remote callers without and 2 for those with an HTTP Origin header,
+    i.e. browsers and dapps.
+    """
+    if meta.get("scheme") in ("in-proc", "ipc"):
+        return 0
+    return 2 if meta.get("Origin") else 1
+
+
+def complete_tx_result(transaction, result):
+    """
+    Turn a reviewer's answer to an approveTx request into the response clef
+    expects, which carries the transaction to sign. A reviewer may leave it
+    out to sign the transaction as requested, or modify it, but must keep
+    its fields and sender.
+    """
+    result = dict(result)
+    if "transaction" not in result:
+        result["transaction"] = transaction
+        return result
+    modified = result["transaction"]
+    if not isinstance(modified, dict) or modified.keys() != transaction.keys():
+        raise ValueError("transaction needs the fields {}".format(
+            sorted(transaction)))
+    if str(modified["from"]).lower() != str(transaction["from"]).lower():
+        raise ValueError("transaction sender cannot be changed")
+    return result
+
+
+class PendingApproval:
+    def __init__(self, id_, method, request, priority, deadline, check=None):
+        self.id = id_
+        self.method = method
+        self.request = request
+        self.check = check
+        self.priority = priority
+        self.deadline = deadline
+        self.result = None
+        self.done = threading.Event()
+        self.owner = None
+        self.claim_expires = None
+
+    def describe(self):
+        return {
+            "id": self.id,
+            "method": self.method,
+            "request": self.request,
+            "deadline": self.deadline - time.monotonic(),
+        }
+
+
+class ApprovalQueue:
+    """
+    Approvals waiting for a human or automated reviewer. They are ordered by
+    deadline in windows of DEADLINE_WINDOW seconds, within a window by
+    origin class and then by value at risk, highest first.
+
+    Reviewers claim the most urgent approval, and must answer it within
+    claim_timeout seconds or it is queued again. Approvals which are not
+    answered within approval_timeout seconds are rejected.
+    """
+
+    DEADLINE_WINDOW = 30
+
+    def __init__(self, claim_timeout=60, approval_timeout=300):
+        self.claim_timeout = claim_timeout
+        self.approval_timeout = approval_timeout
+        self.cond = threading.Condition()
+        self.heap = []
+        self.claimed = {}
+        self.ids = itertools.count(1)
+        threading.Thread(target=self._expire_loop, daemon=True).start()
+
+    def submit(self, method, request, value, origin, timeout=None,
+               check=None):
+        """
+        Queue an approval and wait for its answer, None on timeout.
+
+        :param timeout: seconds to wait at most, if less than the
+            approval_timeout
+        :param check: called with an answer before accepting it, returns
+            the result to use or raises ValueError to refuse it
+        """
+        if timeout is None or timeout > self.approval_timeout:
+            timeout = self.approval_timeout
+        deadline = time.monotonic() + timeout
+        priority = (
+            int(deadline // self.DEADLINE_WINDOW), origin, -value, deadline)
+        item = PendingApproval(
+            next(self.ids), method, request, priority, deadline, check)
+        with self.cond:
+            heapq.heappush(self.heap, (item.priority, item.id, item))
+            self.cond.notify()
+        item.done.wait(timeout)
+        with self.cond:
+            # Whether answered or not, it is no longer pending.
+            item.done.set()
+            self.claimed.pop(item.id, None)
+        return item.result
+
+    def claim(self, owner, wait=0):
+        """Claim the most urgent approval, waiting up to wait seconds for
+        one to arrive. Returns None if there is none."""
+        end = time.monotonic() + wait
+        with self.cond:
+            while True:
+                while self.heap and self.heap[0][2].done.is_set():
+                    heapq.heappop(self.heap)
+                if self.heap:
+                    item = heapq.heappop(self.heap)[2]
+                    item.owner = owner
+                    item.claim_expires = time.monotonic() + self.claim_timeout
+                    self.claimed[item.id] = item
+                    return item
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.cond.wait(remaining)
+
+    def answer(self, owner, id_, result):
+        with self.cond:
+            item = self.claimed.get(id_)
+            if item is None or item.owner is not owner:
+                return False
+            if item.check is not None:
+                result = item.check(result)
+            del self.claimed[id_]
+            item.result = result
+            item.done.set()
+            return True
+
+    def release(self, owner, id_=None):
+        """Queue the approvals claimed by owner (or only id_) again."""
+        with self.cond:
+            for item in list(self.claimed.values()):
+                if item.owner is owner and id_ in (None, item.id):
+                    self._requeue(item)
+
+    def _requeue(self, item):
+        del self.claimed[item.id]
+        item.owner = None
+        if not item.done.is_set():
+            heapq.heappush(self.heap, (item.priority, item.id, item))
+            self.cond.notify()
+
+    def pending(self):
+        with self.cond:
+            return [
+                dict(item.describe(), request=None)
+                for (_, _, item) in sorted(self.heap)
+                if not item.done.is_set()
+            ]
+
+    def _expire_loop(self):
+        while True:
+            time.sleep(1)
+            now = time.monotonic()
+            with self.cond:
+                for item in list(self.claimed.values()):
+                    if item.claim_expires <= now:
+                        self._requeue(item)
+
+
+class ApprovalRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Line-delimited JSON protocol for reviewers on the approval socket:
+
+      {"op": "claim", "wait": 10}
+          -> {"id": 1, "method": "approveTx", "request": {...},
+              "deadline": 287.5} or {"id": null}
+      {"op": "answer", "id": 1, "result": {"approved": true}}
+          -> {"ok": true}
+      {"op": "answer", "id": 1, "result": {"approved": true,
+                                           "transaction": {...}}}
+          -> {"ok": true}, or an error if the modified transaction does not
+             have the fields and sender of the requested one
+      {"op": "release", "id": 1} -> {"ok": true}
+      {"op": "list"} -> {"pending": [{"id": 2, ...}, ...]}
+
+    Approvals claimed over a connection are queued again when it closes.
+    """
+
+    def handle(self):
+        queue_ = self.server.approvals
+        try:
+            for line in self.rfile:
+                try:
+                    msg = json.loads(line)
+                    reply = self.dispatch(queue_, msg)
+                except (ValueError, TypeError, KeyError) as e:
+                    reply = {"error": str(e)}
+                self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+        finally:
+            queue_.release(self)
+
+    def dispatch(self, queue_, msg):
+        op = msg["op"]
+        if op == "claim":
+            item = queue_.claim(self, float(msg.get("wait", 0)))
+            return item.describe() if item else {"id": None}
+        if op == "answer":
+            result = msg["result"]
+            if not isinstance(result, dict) or \
+                    not isinstance(result.get("approved"), bool):
+                raise ValueError("result needs a boolean 'approved'")
+            return {"ok": queue_.answer(self, msg["id"], result)}
+        if op == "release":
+            queue_.release(self, msg["id"])
+            return {"ok": True}
+        if op == "list":
+            return {"pending": queue_.pending()}
+        raise ValueError("unknown op {!r}".format(op))
+
+
+def serve_approvals(path, approvals):
+    """Serve the approval queue on a Unix socket only the user can access."""
+    if os.path.exists(path):
+        os.unlink(path)
+    # Created with these permissions, chmod after bind would leave a window
+    # in which others can connect.
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(
+            path, ApprovalRequestHandler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    server.approvals = approvals
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class ThreadedRPCServer(RPCServer):
+    """Handles every request in its own thread, so that requests waiting for
+    a reviewer do not hold up others."""
+
+    def _spawn(self, func, *args, **kwargs):
+        threading.Thread(
+            target=func, args=args, kwargs=kwargs, daemon=True).start()
+
+
+# Addresses shown in an account listing prompt; the others are counted.
+LISTING_PAGE = 20
+
+
+def load_listing_allowlist(path):
+    """
+    Read the accounts each origin may list: a JSON object mapping the Origin
+    header of callers ("" for callers without one) to lists of addresses.
+    """
+    with open(path, "rb") as f:
+        doc = json.load(f)
+    if not isinstance(doc, dict):
+        raise ValueError("expected an object of origins")
+    allowlist = {}
+    for origin, addresses in doc.items():
+        allowed = set()
+        for address in addresses:
+            b = _address_bytes(address)
+            if b is None:
+                raise ValueError("invalid address {!r} for origin {!r}".format(
+                    address, origin))
+            allowed.add(b)
+        allowlist[origin] = frozenset(allowed)
+    return allowlist
+
+
+class AccountIndex:
+    """
+    The accounts clef offers for listing, by address. The index is only
+    rebuilt when the account list in a request differs from the previous
+    one, which with lazily decoded requests is a comparison of the raw
+    JSON text.
+    """
+
     def __init__(self):
-        pass
+        self.lock = threading.Lock()
+        self.raw = None
+        # Address bytes to (position, account), in keystore order.
+        self.index = {}
+
+    def get(self, req):
+        if not isinstance(req, LazyObject) or "accounts" not in req.members:
+            return self._build(req.get("accounts"))
+        # Comparing a memoryview goes element by element, bytes use memcmp.
+        raw = bytes(req.raw("accounts"))
+        with self.lock:
+            if raw != self.raw:
+                self.index = self._build(req["accounts"])
+                self.raw = raw
+            return self.index
+
+    @staticmethod
+    def _build(accounts):
+        index = {}
+        for i, account in enumerate(accounts or []):
+            address = _address_bytes(account.get("address"))
+            if address is not None:
+                index[address] = (i, account)
+        return index
+
+
+class StdIOHandler:
+    def __init__(self, verifier=None, approvals=None, history=None,
+                 allowlist=None):
+        # Serializes prompts when several clef instances are served at once.
+        self.console = threading.Lock()
+        self.verifier = verifier or SignDataVerifier()
+        # Transactions are left to the reviewers of this ApprovalQueue, if
+        # given.
+        self.approvals = approvals
+        # AccountHistory the decisions on transactions are counted in, if
+        # given.
+        self.history = history
+        # Accounts each origin may list, see load_listing_allowlist. Without
+        # one, listings are denied.
+        self.allowlist = allowlist
+        self.accounts = AccountIndex()
 
     @public
     def approveTx(self, req):
@@ -101,21 +880,52 @@ class StdIOHandler:
             "\n"
             "\tFrom: {from_}\n"
             "\tTo: {to}\n"
+            "{history}"
             "\n"
-            "\tAuto-rejecting request"
+            "\t{action}"
         )
         meta = req.get("meta", {})
         transaction = req.get("transaction")
+        from_ = transaction.get("from", "<missing>")
+        review = self.approvals is not None
+        if review and current_budget().remaining() < MIN_REVIEW_TIME:
+            review = False
+            audit_context.rule = "deadline"
+        history = ""
+        if self.history is not None:
+            history = "\tHistory: {} approved, {} rejected\n".format(
+                *self.history.get(from_)[:2])
         sys.stdout.write(
             message.format(
                 meta_string=metaString(meta),
-                from_=transaction.get("from", "<missing>"),
+                from_=from_,
                 to=transaction.get("to", "<missing>"),
+                history=history,
+                action="Queued for review\n" if review
+                else "Auto-rejecting request" if self.approvals is None
+                else "Auto-rejecting request, no time left for review\n",
             )
         )
-        return {
+        result = {
             "approved": False,
         }
+        if review:
+            with deadline_stats.stage("review"):
+                reviewed = self.approvals.submit(
+                    "approveTx", dict(req), value_at_risk(transaction),
+                    origin_class(meta), current_budget().remaining(),
+                    functools.partial(complete_tx_result, transaction))
+            if reviewed is not None:
+                audit_context.rule = "reviewer"
+                result = reviewed
+            else:
+                audit_context.rule = "review-timeout"
+        if self.history is not None:
+            self.history.record(
+                from_, isinstance(result, dict) and bool(
+                    result.get("approved")),
+                value_at_risk(transaction))
+        return result
 
     @public
     def approveSignData(self, req):
@@ -130,17 +940,25 @@ class StdIOHandler:
             "\n"
             "\tContent-type: {content_type}\n"
             "\tAddress: {address}\n"
-            "\tHash: {hash_}\n"
+            "\tHash: {hash_} ({check})\n"
             "\n"
             "\tAuto-rejecting request\n"
         )
         meta = req.get("meta", {})
+        budget = current_budget()
+        if deadline_stats.allows("hash", budget):
+            with deadline_stats.stage("hash"):
+                problem = self.verifier.verify(req, budget.remaining())
+        else:
+            problem = "not verified, no time left"
+            audit_context.rule = "deadline"
         sys.stdout.write(
             message.format(
                 meta_string=metaString(meta),
                 content_type=req.get("content_type"),
                 address=req.get("address"),
                 hash_=req.get("hash"),
+                check="verified" if problem is None else problem,
             )
         )
 
@@ -183,8 +1001,9 @@ class StdIOHandler:
             "Press enter to continue\n"
         )
         text = req.get("text")
-        sys.stdout.write(message.format(text=text))
-        input()
+        with self.console:
+            sys.stdout.write(message.format(text=text))
+            input()
         return
 
     @public
@@ -202,8 +1021,9 @@ class StdIOHandler:
             "Press enter to continue\n"
         )
         text = req.get("text")
-        sys.stdout.write(message.format(text=text))
-        input()
+        with self.console:
+            sys.stdout.write(message.format(text=text))
+            input()
         return
 
     @public
@@ -237,25 +1057,33 @@ class StdIOHandler:
 
         {"jsonrpc":"2.0","id":23,"method":"ui_approveListing","params":[{"accounts":[{"address":...
         """  # noqa: E501
-        message = (
+        meta = req.get("meta", {})
+        index = self.accounts.get(req)
+        listed = None
+        if self.allowlist is not None:
+            allowed = self.allowlist.get(meta.get("Origin") or "", ())
+            # Iterates over the allowlist only, however big the keystore.
+            listed = sorted(index[a] for a in index.keys() & allowed)
+        sys.stdout.write(
             "\n"
             "## Account listing request\n"
             "\t{meta_string}\n"
-            "\tDo you want to allow listing the following accounts?\n"
-            "\t-{addrs}\n"
-            "\n"
-            "->Auto-answering No\n"
-        )
-        meta = req.get("meta", {})
-        accounts = req.get("accounts", [])
-        addrs = [x.get("address") for x in accounts]
+            "\tDo you want to allow listing the following accounts?\n".format(
+                meta_string=metaString(meta)))
+        shown = index.values() if listed is None else listed
+        for _, account in itertools.islice(shown, LISTING_PAGE):
+            sys.stdout.write("\t-{}\n".format(account.get("address")))
+        if len(shown) > LISTING_PAGE:
+            sys.stdout.write("\t... and {} more\n".format(
+                len(shown) - LISTING_PAGE))
+        if not listed:
+            sys.stdout.write("\n->Auto-answering No\n")
+            return {}
         sys.stdout.write(
-            message.format(
-                addrs="\n\t-".join(addrs),
-                meta_string=metaString(meta)
-            )
-        )
-        return {}
+            "\n->Answering {} of {} accounts, allowed for this origin\n"
+            .format(len(listed), len(index)))
+        audit_context.rule = "allowlist"
+        return {"accounts": [account for _, account in listed]}
 
     @public
     def onInputRequired(self, req):
@@ -274,27 +1102,937 @@ class StdIOHandler:
             "\n"
             "> "
         )
-        sys.stdout.write(
-            message.format(
-                title=req.get("title"),
-                prompt=req.get("prompt")
+        with self.console:
+            sys.stdout.write(
+                message.format(
+                    title=req.get("title"),
+                    prompt=req.get("prompt")
+                )
             )
-        )
-        isPassword = req.get("isPassword")
-        if not isPassword:
-            return {"text": input()}
+            isPassword = req.get("isPassword")
+            if not isPassword:
+                return {"text": input()}
 
         return ""
 
 
+# Audit log records are a header of payload length and CRC-32 followed by
+# the payload, which starts with the record type.
+AUDIT_HEADER = struct.Struct(">II")
+# Decision: time, latency in microseconds, request fingerprint (SHA-256 of
+# the parameters as received from clef), approved, then the method and rule
+# id, each prefixed with its length in one byte.
+AUDIT_DECISION = struct.Struct(">BdI32sB")
+# Checkpoint, written every checkpoint_interval decisions: the number of
+# decisions before it and the file offset of the previous checkpoint (or
+# 2**64 - 1 for none), so that a reader can index the log by seeking from
+# checkpoint to checkpoint from the end.
+AUDIT_CHECKPOINT = struct.Struct(">BQQ")
+AUDIT_TYPE_DECISION = 0
+AUDIT_TYPE_CHECKPOINT = 1
+AUDIT_NO_CHECKPOINT = (1 << 64) - 1
+
+# Handlers may set audit_context.rule to the id of the rule which decided a
+# request, for the audit log.
+audit_context = threading.local()
+
+
+def read_audit_log(f):
+    """
+    Yield (offset, type, fields) for every intact record of an audit log,
+    stopping at the first torn or corrupted one.
+    """
+    offset = 0
+    while True:
+        header = f.read(AUDIT_HEADER.size)
+        if len(header) < AUDIT_HEADER.size:
+            return
+        length, crc = AUDIT_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length or zlib.crc32(payload) != crc or length == 0:
+            return
+        if payload[0] == AUDIT_TYPE_DECISION:
+            fields = list(AUDIT_DECISION.unpack_from(payload)[1:])
+            pos = AUDIT_DECISION.size
+            for _ in range(2):
+                n = payload[pos]
+                fields.append(payload[pos + 1:pos + 1 + n].decode("utf-8"))
+                pos += 1 + n
+        else:
+            fields = AUDIT_CHECKPOINT.unpack_from(payload)[1:]
+        yield offset, payload[0], fields
+        offset += AUDIT_HEADER.size + length
+
+
+class AuditLog:
+    """
+    Durable, append-only log of the decisions of the UI.
+
+    Records are written by a background thread which commits them in groups:
+    it waits at most max_delay seconds for further records after the first
+    one, then writes the batch and fsyncs once for all of them. Callers
+    wait for their record to be durable before answering clef. A batch which
+    fails to be written is cut off the log again and its callers are told.
+    """
+
+    def __init__(self, path, max_delay=0.005, max_batch=256,
+                 checkpoint_interval=1024):
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.checkpoint_interval = checkpoint_interval
+        self.queue = queue.Queue()
+        # Unbuffered, so that nothing of a failed write is left behind to be
+        # flushed with a later one.
+        self.f = open(path, "a+b", buffering=0)
+        self._recover(path)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _recover(self, path):
+        """Find the state at the end of the log, dropping a torn tail."""
+        end = 0
+        self.decisions = 0
+        self.last_checkpoint = AUDIT_NO_CHECKPOINT
+        with open(path, "rb") as f:
+            for (offset, kind, fields) in read_audit_log(f):
+                if kind == AUDIT_TYPE_DECISION:
+                    self.decisions += 1
+                else:
+                    self.last_checkpoint = offset
+                end = f.tell()
+        self.f.truncate(end)
+        self.offset = end
+
+    def record(self, method, params, approved, rule, latency):
+        """
+        Queue a decision and return a future which completes once it is
+        durable, or fails with the OSError which prevented that.
+
+        :param params: the JSON text of the request parameters
+        """
+        fingerprint = hashlib.sha256(params).digest()
+        payload = AUDIT_DECISION.pack(
+            AUDIT_TYPE_DECISION, time.time(),
+            min(int(latency * 1e6), 0xFFFFFFFF), fingerprint,
+            1 if approved else 0)
+        for s in (method, rule):
+            b = s.encode("utf-8")[:255]
+            payload += bytes([len(b)]) + b
+        done = concurrent.futures.Future()
+        self.queue.put((payload, done))
+        return done
+
+    def _append(self, buf, payload):
+        buf += AUDIT_HEADER.pack(len(payload), zlib.crc32(payload))
+        buf += payload
+        self.offset += AUDIT_HEADER.size + len(payload)
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            durable = (self.offset, self.decisions, self.last_checkpoint)
+            buf = bytearray()
+            for (payload, done) in batch:
+                self._append(buf, payload)
+                self.decisions += 1
+                if self.decisions % self.checkpoint_interval == 0:
+                    checkpoint = self.offset
+                    self._append(buf, AUDIT_CHECKPOINT.pack(
+                        AUDIT_TYPE_CHECKPOINT, self.decisions,
+                        self.last_checkpoint))
+                    self.last_checkpoint = checkpoint
+            try:
+                self._write(buf, durable[0])
+            except OSError as e:
+                print("audit log write failed: {}".format(e))
+                # Later records follow the last durable one, the torn
+                # batch is cut off before the next write.
+                self.offset, self.decisions, self.last_checkpoint = durable
+                for (payload, done) in batch:
+                    done.set_exception(e)
+                continue
+            for (payload, done) in batch:
+                done.set_result(None)
+
+    def _write(self, buf, start):
+        """Write buf at offset start of the log and sync it."""
+        fd = self.f.fileno()
+        if os.fstat(fd).st_size != start:
+            self.f.truncate(start)
+        view = memoryview(buf)
+        while view:
+            view = view[self.f.write(view):]
+        os.fsync(fd)
+
+
+class AuditingDispatcher(RPCDispatcher):
+    """Records the outcome of every ui_approve* request in an audit log."""
+
+    TIMEOUT = 10
+
+    def __init__(self, log=None):
+        # tinyrpc creates a dispatcher without a log for every prefix
+        # registered, only the top level one records.
+        super().__init__()
+        self.log = log
+
+    def _dispatch(self, request, caller):
+        started = time.monotonic()
+        response = super()._dispatch(request, caller)
+        if self.log is None or not request.method.startswith("ui_approve"):
+            return response
+        result = getattr(response, "result", None)
+        approved = isinstance(result, dict) and bool(
+            result.get("approved") or result.get("accounts"))
+        rule = getattr(audit_context, "rule", None) or "auto-reject"
+        audit_context.rule = None
+        if result is None:
+            rule = "error"
+        params = getattr(request, "raw_params", None)
+        if params is None:
+            params = json.dumps(request.args).encode("utf-8")
+        done = self.log.record(
+            request.method, params, approved, rule,
+            time.monotonic() - started)
+        # A decision which is not in the log is not passed on either.
+        # Stdout is the channel to clef, so the reason goes to stderr.
+        try:
+            done.result(self.TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            sys.stderr.write("audit log write timed out\n")
+            return request.error_respond("audit log write timed out")
+        except OSError as e:
+            sys.stderr.write("audit log write failed: {}\n".format(e))
+            return request.error_respond(
+                "audit log write failed: {}".format(e))
+        return response
+
+
+# A request which cannot be queued for at least this many seconds is not
+# worth showing to a reviewer.
+MIN_REVIEW_TIME = 1.0
+LATENCY_BUCKETS_MS = [
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000,
+]
+BUDGET_BUCKETS = [10, 25, 50, 75, 90, 100]
+
+
+class Histogram:
+    """Counts observations in buckets with the given upper bounds, and one
+    more for everything above the last."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += 1
+
+    def quantile(self, q):
+        """
+        :return: the upper bound of the bucket holding the q-quantile, inf
+        if it is the overflow bucket and None without observations
+        """
+        if self.total == 0:
+            return None
+        rank = q * self.total
+        seen = 0
+        for (i, count) in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds[i] if i < len(self.bounds) else math.inf
+        return math.inf
+
+    def format(self):
+        buckets = []
+        for (i, count) in enumerate(self.counts):
+            if count:
+                bound = ("<={}".format(self.bounds[i]) if i < len(self.bounds)
+                         else ">{}".format(self.bounds[-1]))
+                buckets.append("{}:{}".format(bound, count))
+        return " ".join(buckets) or "-"
+
+
+class Budget:
+    """The time left to answer a request."""
+
+    def __init__(self, arrived, deadline=None):
+        self.arrived = arrived
+        self.deadline = None if deadline is None else arrived + deadline
+
+    def remaining(self):
+        if self.deadline is None:
+            return math.inf
+        return self.deadline - time.monotonic()
+
+
+# The budget of the request being handled by the current thread.
+deadline_context = threading.local()
+
+
+def current_budget():
+    budget = getattr(deadline_context, "budget", None)
+    if budget is None:
+        return Budget(time.monotonic())
+    return budget
+
+
+class DeadlineStats:
+    """Histograms of the time taken by the stages of request handling, of
+    the share of its budget every request used and of by how much deadlines
+    were missed."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = collections.defaultdict(
+            lambda: Histogram(LATENCY_BUCKETS_MS))
+        self.used = collections.defaultdict(lambda: Histogram(BUDGET_BUCKETS))
+        self.missed = collections.defaultdict(
+            lambda: Histogram(LATENCY_BUCKETS_MS))
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = (time.monotonic() - started) * 1000
+            with self.lock:
+                self.stages[name].observe(elapsed)
+
+    def allows(self, stage, budget):
+        """
+        :return: whether the stage usually finishes within the remaining
+        budget, judged by its 99th percentile so far
+        """
+        remaining = budget.remaining()
+        if remaining == math.inf:
+            return True
+        with self.lock:
+            estimate = (self.stages[stage].quantile(0.99)
+                        if stage in self.stages else None)
+        if estimate is None:
+            return remaining > 0
+        return remaining * 1000 > estimate
+
+    def finished(self, method, elapsed, deadline):
+        with self.lock:
+            self.used[method].observe(100 * elapsed / deadline)
+            if elapsed > deadline:
+                self.missed[method].observe((elapsed - deadline) * 1000)
+
+    def report(self):
+        with self.lock:
+            lines = ["stage {} ms: {}".format(name, h.format())
+                     for (name, h) in sorted(self.stages.items())]
+            for (method, h) in sorted(self.used.items()):
+                missed = self.missed.get(method)
+                lines.append("{} budget used %: {} missed by ms: {}".format(
+                    method, h.format(),
+                    missed.format() if missed is not None else "-"))
+        return "".join(line + "\n" for line in lines)
+
+
+deadline_stats = DeadlineStats()
+
+
+class DeadlineDispatcher(AuditingDispatcher):
+    """Gives handlers the budget left to answer every request within the
+    deadline, counted from its arrival, and records how much of it was
+    used."""
+
+    def __init__(self, log=None, deadline=None):
+        super().__init__(log)
+        self.deadline = deadline
+
+    def _dispatch(self, request, caller):
+        arrived = getattr(request, "arrived", None) or time.monotonic()
+        deadline_context.budget = Budget(arrived, self.deadline)
+        try:
+            # Includes waiting for the audit log.
+            response = super()._dispatch(request, caller)
+        finally:
+            deadline_context.budget = None
+        if self.deadline is not None:
+            deadline_stats.finished(
+                request.method, time.monotonic() - arrived, self.deadline)
+        return response
+
+
+# Account history snapshot: a header, then fixed size records sorted by
+# address, each with its own checksum.
+# Header: magic, version, record size, number of records, CRC-32 of the
+# preceding fields.
+SNAPSHOT_MAGIC = b"clefhist"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct(">8sIIQI")
+# Record: address, approved, rejected, wei at risk approved, time of the
+# last transaction, CRC-32 of the preceding fields.
+SNAPSHOT_RECORD = struct.Struct(">20sQQ32sdI")
+UINT256_MAX = (1 << 256) - 1
+
+
+class AccountHistory:
+    """
+    How many transactions from each account were approved and rejected,
+    and how much value was approved, kept across restarts.
+
+    Changes are kept in memory and checkpointed every interval seconds into
+    a new snapshot, which is renamed over the old one. The snapshot is
+    mapped, not read, and searched on demand, so that a restart costs the
+    same for any number of accounts: only its header is checked on open,
+    and a record when it is looked up. A snapshot of another version or
+    with a bad header is discarded and the history starts over. The records
+    are all checked in the background after open, and a snapshot with
+    corrupt ones, whose addresses a lookup could miss, is rebuilt from the
+    intact ones.
+    """
+
+    def __init__(self, path, interval=60):
+        self.path = path
+        self.lock = threading.Lock()
+        self.checkpoint_lock = threading.Lock()
+        # Address to (approved, rejected, value, last seen), for accounts
+        # changed since the snapshot was written.
+        self.changes = {}
+        # Replaced, never closed, while the history is in use: a checkpoint
+        # may still be reading the previous map.
+        self.map = None
+        self.count = 0
+        self.verifier = None
+        self._open()
+        if self.map is not None:
+            self.verifier = threading.Thread(target=self._verify, daemon=True)
+            self.verifier.start()
+        if interval > 0:
+            threading.Thread(
+                target=self._checkpoint_loop, args=(interval,), daemon=True,
+            ).start()
+
+    def _open(self):
+        try:
+            with open(self.path, "rb") as f:
+                m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            # An empty file cannot be mapped.
+            self._discard(e)
+            return
+        if len(m) < SNAPSHOT_HEADER.size:
+            m.close()
+            self._discard("truncated header")
+            return
+        magic, version, size, count, crc = SNAPSHOT_HEADER.unpack_from(m)
+        if magic != SNAPSHOT_MAGIC or zlib.crc32(
+                m[:SNAPSHOT_HEADER.size - 4]) != crc:
+            reason = "bad header"
+        elif version != SNAPSHOT_VERSION or size != SNAPSHOT_RECORD.size:
+            reason = "version {}".format(version)
+        elif len(m) != SNAPSHOT_HEADER.size + count * size:
+            reason = "truncated"
+        else:
+            self.map = m
+            self.count = count
+            return
+        m.close()
+        self._discard(reason)
+
+    def _discard(self, reason):
+        print("account history {}: {}, starting over".format(
+            self.path, reason))
+        self.map = None
+        self.count = 0
+
+    def _verify(self):
+        """Rebuild the snapshot if any of its records is corrupt."""
+        with self.lock:
+            m, count = self.map, self.count
+        skipped = []
+        for i, _ in enumerate(_snapshot_records(m, count, skipped)):
+            if i % 1024 == 0:
+                # Let requests have the interpreter.
+                time.sleep(0)
+        if skipped:
+            try:
+                self.checkpoint(force=True)
+            except OSError as e:
+                print("account history checkpoint failed: {}".format(e))
+
+    def _lookup(self, address):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = SNAPSHOT_HEADER.size + mid * SNAPSHOT_RECORD.size
+            key = self.map[offset:offset + 20]
+            if key < address:
+                lo = mid + 1
+            elif key > address:
+                hi = mid
+            else:
+                # A corrupt record is lost, and dropped by the next
+                # checkpoint.
+                fields = _snapshot_record(self.map, mid)
+                if fields is None:
+                    return None
+                return _snapshot_stats(fields)
+        return None
+
+    def get(self, address):
+        """
+        Return (approved, rejected, value, last seen) for a hex address.
+        """
+        address = _address_bytes(address)
+        if address is None:
+            return (0, 0, 0, 0.0)
+        with self.lock:
+            return self._get(address)
+
+    def _get(self, address):
+        stats = self.changes.get(address)
+        if stats is None and self.map is not None:
+            stats = self._lookup(address)
+        return stats or (0, 0, 0, 0.0)
+
+    def record(self, address, approved, value):
+        address = _address_bytes(address)
+        if address is None:
+            return
+        with self.lock:
+            n_approved, n_rejected, total, _ = self._get(address)
+            if approved:
+                n_approved += 1
+                total = min(total + value, UINT256_MAX)
+            else:
+                n_rejected += 1
+            self.changes[address] = (n_approved, n_rejected, total,
+                                     time.time())
+
+    def checkpoint(self, force=False):
+        """
+        Write the changes since the last checkpoint to a new snapshot, or
+        the snapshot without its corrupt records if forced.
+        """
+        with self.checkpoint_lock:
+            with self.lock:
+                changes = dict(self.changes)
+                m, count = self.map, self.count
+            if not changes and not force:
+                return
+            tmp = self.path + ".tmp"
+            skipped = []
+            count = self._write(
+                tmp, _merged(_snapshot_records(m, count, skipped), changes))
+            if skipped:
+                print("account history {}: dropped {} corrupt records".format(
+                    self.path, len(skipped)))
+            os.replace(tmp, self.path)
+            # Make the rename durable, or a crash could bring back the old
+            # snapshot.
+            fd = os.open(os.path.dirname(self.path) or ".", os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            with open(self.path, "rb") as f:
+                m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with self.lock:
+                self.map = m
+                self.count = count
+                for address, stats in changes.items():
+                    if self.changes.get(address) == stats:
+                        del self.changes[address]
+
+    def _write(self, path, records):
+        count = 0
+        with open(path, "wb") as f:
+            f.write(bytes(SNAPSHOT_HEADER.size))
+            for address, (approved, rejected, value, seen) in records:
+                record = SNAPSHOT_RECORD.pack(
+                    address, approved, rejected, value.to_bytes(32, "big"),
+                    seen, 0)[:-4]
+                f.write(record)
+                f.write(struct.pack(">I", zlib.crc32(record)))
+                count += 1
+            header = SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, SNAPSHOT_RECORD.size,
+                count, 0)[:-4]
+            f.seek(0)
+            f.write(header)
+            f.write(struct.pack(">I", zlib.crc32(header)))
+            f.flush()
+            os.fsync(f.fileno())
+        return count
+
+    def _checkpoint_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.checkpoint()
+            except OSError as e:
+                print("account history checkpoint failed: {}".format(e))
+
+
+def _snapshot_record(m, i):
+    """Return the fields of record i of snapshot m, or None if it is
+    corrupt."""
+    offset = SNAPSHOT_HEADER.size + i * SNAPSHOT_RECORD.size
+    fields = SNAPSHOT_RECORD.unpack_from(m, offset)
+    if zlib.crc32(m[offset:offset + SNAPSHOT_RECORD.size - 4]) != fields[-1]:
+        return None
+    return fields
+
+
+def _snapshot_stats(fields):
+    return (fields[1], fields[2], int.from_bytes(fields[3], "big"),
+            fields[4])
+
+
+def _snapshot_records(m, count, skipped):
+    """
+    Yield (address, stats) for the intact records of snapshot m, in address
+    order, appending the index of every other record to skipped.
+    """
+    previous = b""
+    for i in range(count):
+        fields = _snapshot_record(m, i)
+        if fields is None or fields[0] <= previous:
+            skipped.append(i)
+            continue
+        previous = fields[0]
+        yield fields[0], _snapshot_stats(fields)
+
+
+def _merged(records, changes):
+    """Yield records, in address order, updated with changes."""
+    pending = sorted(changes.items())
+    j = 0
+    for address, stats in records:
+        while j < len(pending) and pending[j][0] < address:
+            yield pending[j]
+            j += 1
+        if j < len(pending) and pending[j][0] == address:
+            yield pending[j]
+            j += 1
+        else:
+            yield address, stats
+    yield from pending[j:]
+
+
+def _address_bytes(address):
+    try:
+        b = bytes.fromhex(address[2:] if address.startswith("0x")
+                          else address)
+    except (AttributeError, ValueError):
+        return None
+    return b if len(b) == 20 else None
+
+
+class ClefInstance:
+    """A supervised clef process and the bookkeeping of its UI channel."""
+
+    def __init__(self, index, cmd, work):
+        self.index = index
+        self.cmd = cmd
+        self.work = work
+        self.process = None
+        # Incremented on every (re)start, so that answers to requests of a
+        # crashed process are not sent to its successor.
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.handled = 0
+        self.restarts = 0
+
+    def start(self):
+        with self.lock:
+            self.generation += 1
+            self.pending = 0
+            self.process = subprocess.Popen(
+                self.cmd,
+                bufsize=1,
+                universal_newlines=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        print("[{}] started pid {}: {}".format(
+            self.index, self.process.pid, " ".join(self.cmd)))
+
+    def serve(self):
+        """Queue the requests of the current process until it exits, and
+        return its exit code."""
+        generation = self.generation
+        for data in iter(self.process.stdout.readline, ""):
+            print("[{}] >> {}".format(self.index, data))
+            with self.lock:
+                self.pending += 1
+            self.work.put((self, generation, data, time.monotonic()))
+        return self.process.wait()
+
+    def done(self, generation, reply):
+        """Complete a request of the given generation, sending reply unless
+        it is None."""
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.pending -= 1
+            self.handled += 1
+            if reply is None:
+                return
+            print("[{}] << {}".format(self.index, reply))
+            try:
+                self.process.stdin.write("{}\n".format(reply))
+            except (OSError, ValueError):
+                # The process died, serve() will notice.
+                pass
+
+    def stats(self):
+        with self.lock:
+            return "[{}] pid {} pending {} handled {} restarts {}".format(
+                self.index,
+                self.process.pid if self.process else "-",
+                self.pending,
+                self.handled,
+                self.restarts,
+            )
+
+
+class Supervisor:
+    """Runs several clef instances, answers the requests of all of them
+    from one dispatcher using a pool of worker threads, and restarts
+    instances which exit."""
+
+    BACKOFF_MIN = 1
+    BACKOFF_MAX = 60
+    # An instance which ran at least this long is restarted without delay
+    # growing from previous crashes.
+    STABLE_UPTIME = 60
+
+    def __init__(self, cmds, dispatcher, workers, stats_interval):
+        self.work = queue.Queue()
+        self.instances = [
+            ClefInstance(i, cmd, self.work) for (i, cmd) in enumerate(cmds)
+        ]
+        self.dispatcher = dispatcher
+        self.protocol = LazyJSONRPCProtocol()
+        self.workers = workers
+        self.stats_interval = stats_interval
+
+    def handle(self, data, arrived):
+        try:
+            request = self.protocol.parse_request(urlparse.unquote(data))
+        except RPCError as e:
+            response = e.error_respond()
+        else:
+            # It may have waited for a worker since.
+            request.arrived = arrived
+            response = self.dispatcher.dispatch(request)
+        if response is None:
+            return None
+        return str(response.serialize(), "utf-8")
+
+    def work_loop(self):
+        while True:
+            instance, generation, data, arrived = self.work.get()
+            try:
+                reply = self.handle(data, arrived)
+            except Exception as e:
+                print("[{}] error handling request: {}".format(
+                    instance.index, e))
+                reply = None
+            instance.done(generation, reply)
+
+    def supervise(self, instance):
+        backoff = self.BACKOFF_MIN
+        while True:
+            started = time.monotonic()
+            try:
+                instance.start()
+                code = instance.serve()
+            except OSError as e:
+                code = e
+            uptime = time.monotonic() - started
+            if uptime >= self.STABLE_UPTIME:
+                backoff = self.BACKOFF_MIN
+            print("[{}] clef exited ({}) after {:.0f}s, restarting in {}s"
+                  .format(instance.index, code, uptime, backoff))
+            time.sleep(backoff)
+            backoff = min(2 * backoff, self.BACKOFF_MAX)
+            with instance.lock:
+                instance.restarts += 1
+
+    def serve_forever(self):
+        for _ in range(self.workers):
+            threading.Thread(target=self.work_loop, daemon=True).start()
+        for instance in self.instances:
+            threading.Thread(
+                target=self.supervise, args=(instance,), daemon=True
+            ).start()
+        while True:
+            if self.stats_interval > 0:
+                time.sleep(self.stats_interval)
+                sys.stderr.write(
+                    "".join(i.stats() + "\n" for i in self.instances))
+            else:
+                time.sleep(3600)
+
+
+def dump_audit_log(path):
+    with open(path, "rb") as f:
+        for (offset, kind, fields) in read_audit_log(f):
+            if kind == AUDIT_TYPE_DECISION:
+                when, latency, fingerprint, approved, method, rule = fields
+                print("{:.6f} {} {} {} rule={} latency={}us {}".format(
+                    when, method, "approved" if approved else "rejected",
+                    fingerprint.hex(), rule, latency, offset))
+            else:
+                print("checkpoint: {} decisions, previous at {} {}".format(
+                    fields[0], fields[1], offset))
+
+
+def report_deadlines(interval):
+    while True:
+        time.sleep(interval)
+        sys.stderr.write(deadline_stats.report())
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description="Example UI for clef.")
+    parser.add_argument(
+        "test", nargs="?", choices=["test"],
+        help="run clef with --stdio-ui-test")
+    parser.add_argument(
+        "--instances", type=int, default=1,
+        help="number of clef processes to supervise")
+    parser.add_argument(
+        "--shard-dir",
+        help="directory containing the keystore, config directory and audit "
+             "log of each instance, as <shard-dir>/<i>/keystore, "
+             "<shard-dir>/<i> and <shard-dir>/<i>/audit.log")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="number of threads answering requests (default: one per "
+             "instance)")
+    parser.add_argument(
+        "--hash-workers", type=int, default=None,
+        help="number of workers verifying sign data hashes")
+    parser.add_argument(
+        "--json-backend", default="auto",
+        choices=["auto"] + sorted(JSON_BACKENDS),
+        help="library used to decode request fields")
+    parser.add_argument(
+        "--approval-socket", metavar="PATH",
+        help="queue transactions for reviewers connecting to this Unix "
+             "socket instead of rejecting them")
+    parser.add_argument(
+        "--claim-timeout", type=float, default=60,
+        help="seconds a reviewer has to answer a claimed approval")
+    parser.add_argument(
+        "--approval-timeout", type=float, default=300,
+        help="seconds after which unanswered approvals are rejected")
+    parser.add_argument(
+        "--audit-log", help="file to append the approval decisions to")
+    parser.add_argument(
+        "--audit-max-delay", type=float, default=5,
+        help="milliseconds to wait for further decisions before writing "
+             "and syncing the audit log (default: 5)")
+    parser.add_argument(
+        "--dump-audit-log", metavar="PATH",
+        help="print the records of an audit log and exit")
+    parser.add_argument(
+        "--account-history", metavar="PATH",
+        help="file keeping the number of approved and rejected transactions "
+             "per account across restarts")
+    parser.add_argument(
+        "--history-interval", type=float, default=60,
+        help="seconds between checkpoints of the account history")
+    parser.add_argument(
+        "--listing-allowlist", metavar="PATH",
+        help="JSON file mapping origins to the accounts they may list")
+    parser.add_argument(
+        "--deadline", type=float, default=0,
+        help="seconds within which every request should be answered, "
+             "0 for no deadline")
+    parser.add_argument(
+        "--stats-interval", type=float, default=30,
+        help="seconds between queue depth and deadline reports, 0 to "
+             "disable")
+    args = parser.parse_args(args)
+    if args.instances < 1:
+        parser.error("--instances must be at least 1")
+    if args.instances > 1 and args.shard_dir is None:
+        parser.error("--instances requires --shard-dir")
+    if args.deadline < 0:
+        parser.error("--deadline must not be negative")
+    return args
+
+
 def main(args):
+    args = parse_args(args)
     cmd = ["clef", "--stdio-ui"]
-    if len(args) > 0 and args[0] == "test":
+    if args.test:
         cmd.extend(["--stdio-ui-test"])
-    print("cmd: {}".format(" ".join(cmd)))
 
-    dispatcher = RPCDispatcher()
-    dispatcher.register_instance(StdIOHandler(), "ui_")
+    set_json_backend(args.json_backend)
+    if args.dump_audit_log is not None:
+        dump_audit_log(args.dump_audit_log)
+        return
+
+    log = None
+    if args.audit_log is not None:
+        log = AuditLog(args.audit_log, args.audit_max_delay / 1000)
+    dispatcher = DeadlineDispatcher(log, args.deadline or None)
+    if args.deadline and args.stats_interval > 0:
+        threading.Thread(
+            target=report_deadlines, args=(args.stats_interval,), daemon=True
+        ).start()
+    approvals = None
+    if args.approval_socket is not None:
+        approvals = ApprovalQueue(args.claim_timeout, args.approval_timeout)
+        serve_approvals(args.approval_socket, approvals)
+    history = None
+    if args.account_history is not None:
+        history = AccountHistory(args.account_history, args.history_interval)
+        atexit.register(history.checkpoint)
+    allowlist = None
+    if args.listing_allowlist is not None:
+        try:
+            allowlist = load_listing_allowlist(args.listing_allowlist)
+        except (OSError, ValueError) as e:
+            sys.exit("invalid listing allowlist: {}".format(e))
+    dispatcher.register_instance(
+        StdIOHandler(SignDataVerifier(args.hash_workers), approvals, history,
+                     allowlist),
+        "ui_")
+
+    if args.shard_dir is not None:
+        cmds = []
+        for i in range(args.instances):
+            shard = os.path.join(args.shard_dir, str(i))
+            cmds.append(cmd + [
+                "--keystore", os.path.join(shard, "keystore"),
+                "--configdir", shard,
+                "--auditlog", os.path.join(shard, "audit.log"),
+            ])
+        # Every transaction waiting for a reviewer occupies a worker.
+        workers = args.workers or (
+            args.instances if approvals is None else 64)
+        Supervisor(
+            cmds, dispatcher, workers, args.stats_interval,
+        ).serve_forever()
+        return
+
+    print("cmd: {}".format(" ".join(cmd)))
 
     # line buffered
     p = subprocess.Popen(
@@ -305,8 +2043,9 @@ def main(args):
         stdout=subprocess.PIPE,
     )
 
-    rpc_server = RPCServer(
-        PipeTransport(p.stdout, p.stdin), JSONRPCProtocol(), dispatcher
+    server = RPCServer if approvals is None else ThreadedRPCServer
+    rpc_server = server(
+        PipeTransport(p.stdout, p.stdin), LazyJSONRPCProtocol(), dispatcher
     )
     rpc_server.serve_forever()
 
@@ -0,0 +1,404 @@
+import base64
+import concurrent.futures
+import importlib.util
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import unittest
+
+import pythonsigner
+
+APPROVE_TX = {
+    "jsonrpc": "2.0",
+    "id": 20,
+    "method": "ui_approveTx",
+    "params": [{
+        "transaction": {
+            "from": "0xDEADbEeF000000000000000000000000DeaDbeEf",
+            "to": "0xDEADbEeF000000000000000000000000DeaDbeEf",
+            "gas": "0x3e8",
+            "gasPrice": "0x5",
+            "maxFeePerGas": None,
+            "maxPriorityFeePerGas": None,
+            "value": "0x6",
+            "nonce": "0x1",
+            "data": "0x",
+        },
+        "call_info": None,
+        "meta": {
+            "remote": "clef binary",
+            "local": "main",
+            "scheme": "in-proc",
+            "User-Agent": "",
+            "Origin": "",
+        },
+    }],
+}
+
+
+class Reviewer:
+    """A reviewer speaking the approval socket protocol."""
+
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self.file = self.sock.makefile("rwb")
+
+    def call(self, **msg):
+        self.file.write(json.dumps(msg).encode("utf-8") + b"\n")
+        self.file.flush()
+        return json.loads(self.file.readline())
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+class ApprovalSocketTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "approvals.sock")
+        self.approvals = pythonsigner.ApprovalQueue(60, 10)
+        self.server = pythonsigner.serve_approvals(self.path, self.approvals)
+        self.dispatcher = pythonsigner.DeadlineDispatcher()
+        self.dispatcher.register_instance(
+            pythonsigner.StdIOHandler(
+                pythonsigner.SignDataVerifier(1), self.approvals, None, None),
+            "ui_")
+        self.reviewer = Reviewer(self.path)
+
+    def tearDown(self):
+        self.reviewer.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.dir.cleanup()
+
+    def request(self):
+        """Send APPROVE_TX to the UI, returns a function waiting for the
+        decoded response."""
+        protocol = pythonsigner.LazyJSONRPCProtocol()
+        request = protocol.parse_request(json.dumps(APPROVE_TX))
+        response = {}
+
+        def run():
+            reply = self.dispatcher.dispatch(request)
+            response.update(json.loads(reply.serialize()))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+
+        def wait():
+            thread.join(10)
+            self.assertFalse(thread.is_alive())
+            return response
+
+        return wait
+
+    def test_socket_private(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_approve_as_requested(self):
+        wait = self.request()
+        item = self.reviewer.call(op="claim", wait=5)
+        self.assertEqual(item["method"], "approveTx")
+        reply = self.reviewer.call(
+            op="answer", id=item["id"], result={"approved": True})
+        self.assertEqual(reply, {"ok": True})
+        result = wait()["result"]
+        # What clef decodes into a SignTxResponse.
+        self.assertTrue(result["approved"])
+        self.assertEqual(
+            result["transaction"], APPROVE_TX["params"][0]["transaction"])
+
+    def test_approve_modified(self):
+        wait = self.request()
+        item = self.reviewer.call(op="claim", wait=5)
+        transaction = dict(item["request"]["transaction"], gas="0x7d0")
+        reply = self.reviewer.call(
+            op="answer", id=item["id"],
+            result={"approved": True, "transaction": transaction})
+        self.assertEqual(reply, {"ok": True})
+        self.assertEqual(wait()["result"]["transaction"], transaction)
+
+    def test_modified_shape_refused(self):
+        wait = self.request()
+        item = self.reviewer.call(op="claim", wait=5)
+        original = item["request"]["transaction"]
+        for transaction in (
+            {"from": original["from"]},
+            dict(original, **{"from": "0x" + "11" * 20}),
+            "0x",
+        ):
+            reply = self.reviewer.call(
+                op="answer", id=item["id"],
+                result={"approved": True, "transaction": transaction})
+            self.assertIn("error", reply)
+        # Still claimed, and can be answered properly.
+        reply = self.reviewer.call(
+            op="answer", id=item["id"], result={"approved": False})
+        self.assertEqual(reply, {"ok": True})
+        self.assertFalse(wait()["result"]["approved"])
+
+
+class TornWrite:
+    """Wraps the file of an audit log, writing only part of the next buffer
+    and then failing."""
+
+    def __init__(self, f):
+        self.f = f
+        self.fail = True
+
+    def write(self, data):
+        if self.fail:
+            self.fail = False
+            self.f.write(data[:len(data) // 2])
+            raise OSError(28, "No space left on device")
+        return self.f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+
+class AuditLogTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "audit.log")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def records(self):
+        with open(self.path, "rb") as f:
+            return [fields[4] for (_, kind, fields)
+                    in pythonsigner.read_audit_log(f)
+                    if kind == pythonsigner.AUDIT_TYPE_DECISION]
+
+    def record(self, log, method):
+        return log.record(method, b"[]", False, "test", 0)
+
+    def test_failed_write_cut_off(self):
+        log = pythonsigner.AuditLog(self.path, max_delay=0)
+        self.record(log, "ui_approveTx").result(5)
+        log.f = TornWrite(log.f)
+        with self.assertRaises(OSError):
+            self.record(log, "ui_approveSignData").result(5)
+        self.record(log, "ui_approveListing").result(5)
+        self.assertEqual(
+            self.records(), ["ui_approveTx", "ui_approveListing"])
+        self.assertEqual(log.decisions, 2)
+
+    def test_failed_write_not_answered(self):
+        log = pythonsigner.AuditLog(self.path, max_delay=0)
+        log.f = TornWrite(log.f)
+        dispatcher = pythonsigner.AuditingDispatcher(log)
+        dispatcher.register_instance(
+            pythonsigner.StdIOHandler(
+                pythonsigner.SignDataVerifier(1), None, None, None),
+            "ui_")
+        protocol = pythonsigner.LazyJSONRPCProtocol()
+        response = dispatcher.dispatch(
+            protocol.parse_request(json.dumps(APPROVE_TX)))
+        self.assertIn("audit log write failed", response.error)
+
+    def test_stalled_write_not_answered(self):
+        log = pythonsigner.AuditLog(self.path, max_delay=0)
+        # A write which never completes.
+        log.record = lambda *args: concurrent.futures.Future()
+        dispatcher = pythonsigner.AuditingDispatcher(log)
+        dispatcher.TIMEOUT = 0
+        dispatcher.register_instance(
+            pythonsigner.StdIOHandler(
+                pythonsigner.SignDataVerifier(1), None, None, None),
+            "ui_")
+        protocol = pythonsigner.LazyJSONRPCProtocol()
+        response = dispatcher.dispatch(
+            protocol.parse_request(json.dumps(APPROVE_TX)))
+        self.assertIn("audit log write timed out", response.error)
+
+
+class AccountHistoryTest(unittest.TestCase):
+    ACCOUNTS = ["0x" + "%02x" % i * 20 for i in range(1, 4)]
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "history")
+        history = pythonsigner.AccountHistory(self.path, interval=0)
+        for i, account in enumerate(self.ACCOUNTS):
+            for _ in range(i + 1):
+                history.record(account, True, 5)
+        history.checkpoint()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def corrupt(self, record, offset):
+        """Flip a byte of a record of the snapshot."""
+        with open(self.path, "r+b") as f:
+            f.seek(pythonsigner.SNAPSHOT_HEADER.size +
+                   record * pythonsigner.SNAPSHOT_RECORD.size + offset)
+            b = f.read(1)
+            f.seek(-1, os.SEEK_CUR)
+            f.write(bytes([b[0] ^ 0xFF]))
+
+    def open(self):
+        history = pythonsigner.AccountHistory(self.path, interval=0)
+        history.verifier.join(10)
+        self.assertFalse(history.verifier.is_alive())
+        return history
+
+    def test_reopen(self):
+        history = self.open()
+        self.assertEqual(history.count, 3)
+        for i, account in enumerate(self.ACCOUNTS):
+            self.assertEqual(history.get(account)[:3], (i + 1, 0, 5 * (i + 1)))
+
+    def test_corrupt_key_rebuilt(self):
+        self.corrupt(1, 0)
+        history = self.open()
+        self.assertEqual((history.count, history.changes), (2, {}))
+        self.assertEqual(history.get(self.ACCOUNTS[0])[:3], (1, 0, 5))
+        self.assertEqual(history.get(self.ACCOUNTS[1])[:3], (0, 0, 0))
+        self.assertEqual(history.get(self.ACCOUNTS[2])[:3], (3, 0, 15))
+        # The rebuilt snapshot holds the intact records.
+        history = self.open()
+        self.assertEqual(history.count, 2)
+        self.assertEqual(history.get(self.ACCOUNTS[2])[:3], (3, 0, 15))
+
+    def test_all_corrupt_rebuilt_empty(self):
+        for i in range(len(self.ACCOUNTS)):
+            self.corrupt(i, 25)
+        history = self.open()
+        self.assertEqual(history.get(self.ACCOUNTS[0]), (0, 0, 0, 0.0))
+        self.assertEqual(history.count, 0)
+        self.assertEqual(
+            os.path.getsize(self.path), pythonsigner.SNAPSHOT_HEADER.size)
+
+    def test_corrupt_record_dropped_by_checkpoint(self):
+        self.corrupt(2, 25)
+        history = pythonsigner.AccountHistory(self.path, interval=0)
+        # The corrupt record is lost whether or not the verifier has
+        # rebuilt the snapshot yet.
+        history.record(self.ACCOUNTS[2], False, 0)
+        self.assertEqual(history.get(self.ACCOUNTS[2])[:3], (0, 1, 0))
+        history.checkpoint()
+        history.verifier.join(10)
+        history = self.open()
+        self.assertEqual(history.count, 3)
+        self.assertEqual(history.get(self.ACCOUNTS[0])[:3], (1, 0, 5))
+        self.assertEqual(history.get(self.ACCOUNTS[2])[:3], (0, 1, 0))
+
+
+
+def load_pure_python():
+    """Load another copy of pythonsigner as if pycryptodome was missing."""
+    saved = {name: module for name, module in sys.modules.items()
+             if name == "Crypto" or name.startswith("Crypto.")}
+    for name in saved:
+        del sys.modules[name]
+    # Makes importing Crypto raise ImportError.
+    sys.modules["Crypto"] = None
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "pythonsigner_pure", pythonsigner.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        del sys.modules["Crypto"]
+        sys.modules.update(saved)
+    return module
+
+
+def input_of(n):
+    return bytes(i & 0xFF for i in range(n))
+
+
+class Keccak256Test(unittest.TestCase):
+    VECTORS = [
+        (b"", "c5d2460186f7233c927e7db2dcc703c0"
+              "e500b653ca82273b7bfad8045d85a470"),
+        # One byte short of the rate, exactly the rate, and one byte more:
+        # the padding fills the block, starts a new one, or follows a full
+        # block.
+        (input_of(135), "cbdfd9dee5faad3818d6b06f95a219fd"
+                        "290b0e1706f6a82e5a595b9ce9faca62"),
+        (input_of(136), "7ce759f1ab7f9ce437719970c26b0a66"
+                        "ff11fe3e38e17df89cf5d29c7d7f807e"),
+        (input_of(137), "ac73d4fae68b8453f764007c1a20ce95"
+                        "994187861f0c3227a3a8e99a73a3b1db"),
+        (input_of(500), "cbfabf79afab5860388c0abad0004bfb"
+                        "f11a8be32b02427078883c926c25745b"),
+    ]
+
+    def test_pure_python(self):
+        module = load_pure_python()
+        self.assertIs(module.HashPool,
+                      pythonsigner.concurrent.futures.ProcessPoolExecutor)
+        for data, digest in self.VECTORS:
+            with self.subTest(len=len(data)):
+                self.assertEqual(module.keccak256(data).hex(), digest)
+                self.assertEqual(
+                    module.keccak256(memoryview(data)).hex(), digest)
+
+    def test_default(self):
+        for data, digest in self.VECTORS:
+            with self.subTest(len=len(data)):
+                self.assertEqual(pythonsigner.keccak256(data).hex(), digest)
+
+
+class CheckSignDataTest(unittest.TestCase):
+    def clique_example(self):
+        doc = pythonsigner.StdIOHandler.approveSignData.__doc__
+        line = next(line for line in doc.splitlines()
+                    if line.strip().startswith("{"))
+        req = json.loads(line)["params"][0]
+        return base64.b64decode(req["raw_data"]), req["hash"][2:]
+
+    def check(self, content_type, raw_data, digest):
+        for module in (pythonsigner, load_pure_python()):
+            computed, problem = module.check_sign_data(content_type, raw_data)
+            self.assertIsNone(problem)
+            self.assertEqual(computed.hex(), digest)
+
+    def rejected(self, content_type, raw_data):
+        _, problem = pythonsigner.check_sign_data(content_type, raw_data)
+        self.assertEqual(problem, "malformed {} data".format(content_type))
+
+    def test_text(self):
+        self.check(
+            "text/plain", b"\x19Ethereum Signed Message:\n5hello",
+            "50b2c43fd39106bafbba0da34fc430e1"
+            "f91e3c96ea2acee2bc34119f92b37750")
+        # A message starting with digits.
+        _, problem = pythonsigner.check_sign_data(
+            "text/plain", b"\x19Ethereum Signed Message:\n312a")
+        self.assertIsNone(problem)
+        self.rejected(
+            "text/plain", b"\x19Ethereum Signed Message:\n6hello")
+
+    def test_validator(self):
+        self.check(
+            "data/validator", b"\x19\x00" + input_of(21)[1:] + b"data",
+            "f74a709e4f21faaf07ed5358e08647a2"
+            "6eee0fb4813940522f04b067eb7d9bf2")
+        # Too short for the validator address.
+        self.rejected("data/validator", b"\x19\x00" + input_of(19))
+
+    def test_typed(self):
+        self.check(
+            "data/typed", b"\x19\x01" + input_of(64),
+            "71d794446d7c48f892ac3d70ffeb3b88"
+            "9a61afd745fe8bd250056298d7510228")
+        self.rejected("data/typed", b"\x19\x01" + input_of(63))
+
+    def test_clique(self):
+        raw_data, digest = self.clique_example()
+        self.check("application/x-clique-header", raw_data, digest)
+        self.rejected("application/x-clique-header", raw_data[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@
 #include "../include/secp256k1.h"
 #include "util.h"
 #include "bench.h"
+#include "wycheproof/ecdsa_secp256k1_sha256_bitcoin_bench.h"
 
 static void help(int default_iters) {
     printf("Benchmarks the following algorithms:\n");
@@ -39,6 +40,7 @@ static void help(int default_iters) {
     printf("    ecdsa             : all ECDSA algorithms--sign, verify, recovery (if enabled)\n");
     printf("    ecdsa_sign        : ECDSA siging algorithm\n");
     printf("    ecdsa_verify      : ECDSA verification algorithm\n");
+    printf("    wycheproof        : ECDSA verification of the Wycheproof vectors\n");
     printf("    ec                : all EC public key algorithms (keygen)\n");
     printf("    ec_keygen         : EC public key generation\n");
 
@@ -96,6 +98,44 @@ static void bench_verify(void* arg, int iters) {
     }
 }
 
+typedef struct {
+    secp256k1_context *ctx;
+    secp256k1_pubkey pubkeys[SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_KEYS];
+} bench_wycheproof_data;
+
+static void bench_verify_wycheproof_setup(void* arg) {
+    int k;
+    bench_wycheproof_data *data = (bench_wycheproof_data*)arg;
+
+    for (k = 0; k < SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_KEYS; k++) {
+        CHECK(secp256k1_ec_pubkey_parse(data->ctx, &data->pubkeys[k], wycheproof_ecdsa_bench_keys[k].pk, 65) == 1);
+    }
+}
+
+/* Verifies the vectors in turn, each with the already parsed public key of
+ * its group. High-s signatures are normalized first, so that they get a full
+ * verification too. */
+static void bench_verify_wycheproof(void* arg, int iters) {
+    int i = 0;
+    bench_wycheproof_data *data = (bench_wycheproof_data*)arg;
+
+    while (i < iters) {
+        size_t k, v = 0;
+        for (k = 0; k < SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_KEYS && i < iters; k++) {
+            size_t end = v + wycheproof_ecdsa_bench_keys[k].num_vectors;
+            for (; v < end && i < iters; v++, i++) {
+                const wycheproof_ecdsa_bench_vector *vector = &wycheproof_ecdsa_bench_vectors[v];
+                secp256k1_ecdsa_signature sig;
+                int result;
+                CHECK(secp256k1_ecdsa_signature_parse_compact(data->ctx, &sig, vector->sig) == 1);
+                CHECK(secp256k1_ecdsa_signature_normalize(data->ctx, &sig, &sig) == vector->high_s);
+                result = secp256k1_ecdsa_verify(data->ctx, &sig, vector->msghash, &data->pubkeys[k]);
+                CHECK(vector->high_s || result == vector->expected_verify);
+            }
+        }
+    }
+}
+
 static void bench_sign_setup(void* arg) {
     int i;
     bench_data *data = (bench_data*)arg;
@@ -171,6 +211,7 @@ int main(int argc, char** argv) {
     secp256k1_pubkey pubkey;
     secp256k1_ecdsa_signature sig;
     bench_data data;
+    bench_wycheproof_data wycheproof_data;
 
     int d = argc == 1;
     int default_iters = 20000;
@@ -180,7 +221,7 @@ int main(int argc, char** argv) {
     char* valid_args[] = {"ecdsa", "verify", "ecdsa_verify", "sign", "ecdsa_sign", "ecdh", "recover",
                          "ecdsa_recover", "schnorrsig", "schnorrsig_verify", "schnorrsig_sign", "ec",
                          "keygen", "ec_keygen", "ellswift", "encode", "ellswift_encode", "decode",
-                         "ellswift_decode", "ellswift_keygen", "ellswift_ecdh"};
+                         "ellswift_decode", "ellswift_keygen", "ellswift_ecdh", "wycheproof"};
     size_t valid_args_size = sizeof(valid_args)/sizeof(valid_args[0]);
     int invalid_args = have_invalid_args(argc, argv, valid_args, valid_args_size);
 
@@ -250,6 +291,8 @@ int main(int argc, char** argv) {
 
     print_output_table_header_row();
     if (d || have_flag(argc, argv, "ecdsa") || have_flag(argc, argv, "verify") || have_flag(argc, argv, "ecdsa_verify")) run_benchmark("ecdsa_verify", bench_verify, NULL, NULL, &data, 10, iters);
+    wycheproof_data.ctx = data.ctx;
+    if (d || have_flag(argc, argv, "ecdsa") || have_flag(argc, argv, "wycheproof")) run_benchmark("ecdsa_verify_wycheproof", bench_verify_wycheproof, bench_verify_wycheproof_setup, NULL, &wycheproof_data, 10, iters);
 
     if (d || have_flag(argc, argv, "ecdsa") || have_flag(argc, argv, "sign") || have_flag(argc, argv, "ecdsa_sign")) run_benchmark("ecdsa_sign", bench_sign_run, bench_sign_setup, NULL, &data, 10, iters);
     if (d || have_flag(argc, argv, "ec") || have_flag(argc, argv, "keygen") || have_flag(argc, argv, "ec_keygen")) run_benchmark("ec_keygen", bench_keygen_run, bench_keygen_setup, NULL, &data, 10, iters);
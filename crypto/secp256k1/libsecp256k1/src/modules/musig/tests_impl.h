@@ -686,8 +686,8 @@ static void musig_tweak_test(void) {
 int musig_vectors_keyagg_and_tweak(enum MUSIG_ERROR *error,
                                    secp256k1_musig_keyagg_cache *keyagg_cache,
                                    unsigned char *agg_pk_ser,
-                                   const unsigned char pubkeys33[][33],
-                                   const unsigned char tweaks32[][32],
+                                   const unsigned char *const *pubkeys33,
+                                   const unsigned char *const *tweaks32,
                                    size_t key_indices_len,
                                    const size_t *key_indices,
                                    size_t tweak_indices_len,
@@ -747,6 +747,15 @@ int musig_vectors_keyagg_and_tweak(enum MUSIG_ERROR *error,
 static void musig_test_vectors_keyagg(void) {
     size_t i;
     const struct musig_key_agg_vector *vector = &musig_key_agg_vector;
+    const unsigned char *pubkeys[sizeof(vector->pubkeys)/sizeof(vector->pubkeys[0])];
+    const unsigned char *tweaks[sizeof(vector->tweaks)/sizeof(vector->tweaks[0])];
+
+    for (i = 0; i < sizeof(pubkeys)/sizeof(pubkeys[0]); i++) {
+        pubkeys[i] = MUSIG_KEY_AGG_PUBKEYS(vector, i);
+    }
+    for (i = 0; i < sizeof(tweaks)/sizeof(tweaks[0]); i++) {
+        tweaks[i] = MUSIG_KEY_AGG_TWEAKS(vector, i);
+    }
 
     for (i = 0; i < sizeof(vector->valid_case)/sizeof(vector->valid_case[0]); i++) {
         const struct musig_key_agg_valid_test_case *c = &vector->valid_case[i];
@@ -754,8 +763,8 @@ static void musig_test_vectors_keyagg(void) {
         secp256k1_musig_keyagg_cache keyagg_cache;
         unsigned char agg_pk[32];
 
-        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, agg_pk, vector->pubkeys, vector->tweaks, c->key_indices_len, c->key_indices, 0, NULL, NULL));
-        CHECK(secp256k1_memcmp_var(agg_pk, c->expected, sizeof(agg_pk)) == 0);
+        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, agg_pk, pubkeys, tweaks, c->key_indices_len, MUSIG_KEY_AGG_KEY_INDICES(c), 0, NULL, NULL));
+        CHECK(secp256k1_memcmp_var(agg_pk, MUSIG_KEY_AGG_EXPECTED(c), sizeof(agg_pk)) == 0);
     }
 
     for (i = 0; i < sizeof(vector->error_case)/sizeof(vector->error_case[0]); i++) {
@@ -763,7 +772,7 @@ static void musig_test_vectors_keyagg(void) {
         enum MUSIG_ERROR error;
         secp256k1_musig_keyagg_cache keyagg_cache;
 
-        CHECK(!musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, vector->tweaks, c->key_indices_len, c->key_indices, c->tweak_indices_len, c->tweak_indices, c->is_xonly));
+        CHECK(!musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, tweaks, c->key_indices_len, MUSIG_KEY_AGG_KEY_INDICES(c), c->tweak_indices_len, MUSIG_KEY_AGG_TWEAK_INDICES(c), MUSIG_KEY_AGG_IS_XONLY(c)));
         CHECK(c->error == error);
     }
 }
@@ -785,38 +794,37 @@ static void musig_test_vectors_noncegen(void) {
         secp256k1_pubkey pk;
         unsigned char pubnonce66[66];
 
-        memcpy(session_secrand32, c->rand_, 32);
+        memcpy(session_secrand32, MUSIG_NONCE_GEN_RAND_(c), 32);
         if (c->has_sk) {
-            sk = c->sk;
+            sk = MUSIG_NONCE_GEN_SK(c);
         }
         if (c->has_aggpk) {
             /* Create keyagg_cache from aggpk */
             secp256k1_keyagg_cache_internal cache_i;
             secp256k1_xonly_pubkey aggpk;
             memset(&cache_i, 0, sizeof(cache_i));
-            CHECK(secp256k1_xonly_pubkey_parse(CTX, &aggpk, c->aggpk));
+            CHECK(secp256k1_xonly_pubkey_parse(CTX, &aggpk, MUSIG_NONCE_GEN_AGGPK(c)));
             CHECK(secp256k1_xonly_pubkey_load(CTX, &cache_i.pk, &aggpk));
             secp256k1_keyagg_cache_save(&keyagg_cache, &cache_i);
             keyagg_cache_ptr = &keyagg_cache;
         }
         if (c->has_msg) {
-            msg = c->msg;
+            msg = MUSIG_NONCE_GEN_MSG(c);
         }
         if (c->has_extra_in) {
-            extra_in = c->extra_in;
+            extra_in = MUSIG_NONCE_GEN_EXTRA_IN(c);
         }
 
-        CHECK(secp256k1_ec_pubkey_parse(CTX, &pk, c->pk, sizeof(c->pk)));
+        CHECK(secp256k1_ec_pubkey_parse(CTX, &pk, MUSIG_NONCE_GEN_PK(c), 33));
         CHECK(secp256k1_musig_nonce_gen(CTX, &secnonce, &pubnonce, session_secrand32, sk, &pk, msg, keyagg_cache_ptr, extra_in) == 1);
-        CHECK(secp256k1_memcmp_var(&secnonce.data[4], c->expected_secnonce, 2*32) == 0);
+        CHECK(secp256k1_memcmp_var(&secnonce.data[4], MUSIG_NONCE_GEN_EXPECTED_SECNONCE(c), 2*32) == 0);
         /* The last element of the secnonce is the public key (uncompressed in
          * secp256k1_musig_secnonce, compressed in the test vector secnonce). */
         CHECK(secp256k1_memcmp_var(&secnonce.data[4+2*32], &pk, sizeof(pk)) == 0);
-        CHECK(secp256k1_memcmp_var(&c->expected_secnonce[2*32], c->pk, sizeof(c->pk)) == 0);
+        CHECK(secp256k1_memcmp_var(&MUSIG_NONCE_GEN_EXPECTED_SECNONCE(c)[2*32], MUSIG_NONCE_GEN_PK(c), 33) == 0);
 
         CHECK(secp256k1_musig_pubnonce_serialize(CTX, pubnonce66, &pubnonce) == 1);
-        CHECK(sizeof(c->expected_pubnonce) == sizeof(pubnonce66));
-        CHECK(secp256k1_memcmp_var(pubnonce66, c->expected_pubnonce, sizeof(pubnonce66)) == 0);
+        CHECK(secp256k1_memcmp_var(pubnonce66, MUSIG_NONCE_GEN_EXPECTED_PUBNONCE(c), sizeof(pubnonce66)) == 0);
     }
 }
 
@@ -834,19 +842,19 @@ static void musig_test_vectors_nonceagg(void) {
         unsigned char aggnonce66[66];
 
         for (j = 0; j < 2; j++) {
-            CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce[j], vector->pnonces[c->pnonce_indices[j]]) == 1);
+            CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce[j], MUSIG_NONCE_AGG_PNONCES(vector, c->pnonce_indices[j])) == 1);
             pubnonce_ptr[j] = &pubnonce[j];
         }
         CHECK(secp256k1_musig_nonce_agg(CTX, &aggnonce, pubnonce_ptr, 2));
         CHECK(secp256k1_musig_aggnonce_serialize(CTX, aggnonce66, &aggnonce));
-        CHECK(secp256k1_memcmp_var(aggnonce66, c->expected, 33) == 0);
+        CHECK(secp256k1_memcmp_var(aggnonce66, MUSIG_NONCE_AGG_EXPECTED(c), 33) == 0);
     }
     for (i = 0; i < sizeof(vector->error_case)/sizeof(vector->error_case[0]); i++) {
         const struct musig_nonce_agg_test_case *c = &vector->error_case[i];
         secp256k1_musig_pubnonce pubnonce[2];
         for (j = 0; j < 2; j++) {
             int expected = c->invalid_nonce_idx != j;
-            CHECK(expected == secp256k1_musig_pubnonce_parse(CTX, &pubnonce[j], vector->pnonces[c->pnonce_indices[j]]));
+            CHECK(expected == secp256k1_musig_pubnonce_parse(CTX, &pubnonce[j], MUSIG_NONCE_AGG_PNONCES(vector, c->pnonce_indices[j])));
         }
     }
 }
@@ -864,6 +872,11 @@ static void musig_test_set_secnonce(secp256k1_musig_secnonce *secnonce, const un
 static void musig_test_vectors_signverify(void) {
     size_t i;
     const struct musig_sign_verify_vector *vector = &musig_sign_verify_vector;
+    const unsigned char *pubkeys[sizeof(vector->pubkeys)/sizeof(vector->pubkeys[0])];
+
+    for (i = 0; i < sizeof(pubkeys)/sizeof(pubkeys[0]); i++) {
+        pubkeys[i] = MUSIG_SIGN_VERIFY_PUBKEYS(vector, i);
+    }
 
     for (i = 0; i < sizeof(vector->valid_case)/sizeof(vector->valid_case[0]); i++) {
         const struct musig_valid_case *c = &vector->valid_case[i];
@@ -878,19 +891,19 @@ static void musig_test_vectors_signverify(void) {
         secp256k1_keypair keypair;
         unsigned char partial_sig32[32];
 
-        CHECK(secp256k1_keypair_create(CTX, &keypair, vector->sk));
-        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, NULL, c->key_indices_len, c->key_indices, 0, NULL, NULL));
+        CHECK(secp256k1_keypair_create(CTX, &keypair, MUSIG_SIGN_VERIFY_SK(vector)));
+        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, NULL, c->key_indices_len, MUSIG_SIGN_VERIFY_KEY_INDICES(c), 0, NULL, NULL));
 
-        CHECK(secp256k1_musig_aggnonce_parse(CTX, &aggnonce, vector->aggnonces[c->aggnonce_index]));
-        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, vector->msgs[c->msg_index], &keyagg_cache));
+        CHECK(secp256k1_musig_aggnonce_parse(CTX, &aggnonce, MUSIG_SIGN_VERIFY_AGGNONCES(vector, c->aggnonce_index)));
+        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, MUSIG_SIGN_VERIFY_MSGS(vector, c->msg_index), &keyagg_cache));
 
-        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, vector->pubkeys[0], sizeof(vector->pubkeys[0])));
-        musig_test_set_secnonce(&secnonce, vector->secnonces[0], &pubkey);
+        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, pubkeys[0], 33));
+        musig_test_set_secnonce(&secnonce, MUSIG_SIGN_VERIFY_SECNONCES(vector, 0), &pubkey);
         CHECK(secp256k1_musig_partial_sign(CTX, &partial_sig, &secnonce, &keypair, &keyagg_cache, &session));
         CHECK(secp256k1_musig_partial_sig_serialize(CTX, partial_sig32, &partial_sig));
-        CHECK(secp256k1_memcmp_var(partial_sig32, c->expected, sizeof(partial_sig32)) == 0);
+        CHECK(secp256k1_memcmp_var(partial_sig32, MUSIG_SIGN_VERIFY_EXPECTED(c), sizeof(partial_sig32)) == 0);
 
-        CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce, vector->pubnonces[0]));
+        CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce, MUSIG_SIGN_VERIFY_PUBNONCES(vector, 0)));
         CHECK(secp256k1_musig_partial_sig_verify(CTX, &partial_sig, &pubnonce, &pubkey, &keyagg_cache, &session));
     }
     for (i = 0; i < sizeof(vector->sign_error_case)/sizeof(vector->sign_error_case[0]); i++) {
@@ -911,21 +924,21 @@ static void musig_test_vectors_signverify(void) {
             continue;
         }
         expected = c->error != MUSIG_PUBKEY;
-        CHECK(expected == musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, NULL, c->key_indices_len, c->key_indices, 0, NULL, NULL));
+        CHECK(expected == musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, NULL, c->key_indices_len, MUSIG_SIGN_VERIFY_KEY_INDICES(c), 0, NULL, NULL));
         CHECK(expected || c->error == error);
         if (!expected) {
             continue;
         }
 
         expected = c->error != MUSIG_AGGNONCE;
-        CHECK(expected == secp256k1_musig_aggnonce_parse(CTX, &aggnonce, vector->aggnonces[c->aggnonce_index]));
+        CHECK(expected == secp256k1_musig_aggnonce_parse(CTX, &aggnonce, MUSIG_SIGN_VERIFY_AGGNONCES(vector, c->aggnonce_index)));
         if (!expected) {
             continue;
         }
-        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, vector->msgs[c->msg_index], &keyagg_cache));
+        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, MUSIG_SIGN_VERIFY_MSGS(vector, c->msg_index), &keyagg_cache));
 
-        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, vector->pubkeys[0], sizeof(vector->pubkeys[0])));
-        musig_test_set_secnonce(&secnonce, vector->secnonces[c->secnonce_index], &pubkey);
+        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, pubkeys[0], 33));
+        musig_test_set_secnonce(&secnonce, MUSIG_SIGN_VERIFY_SECNONCES(vector, c->secnonce_index), &pubkey);
         expected = c->error != MUSIG_SECNONCE;
         if (expected) {
             CHECK(secp256k1_musig_partial_sign(CTX, &partial_sig, &secnonce, &keypair, &keyagg_cache, &session));
@@ -949,18 +962,18 @@ static void musig_test_vectors_signverify(void) {
 
         CHECK(NUM_PUBNONCES <= c->nonce_indices_len);
         for (j = 0; j < c->nonce_indices_len; j++) {
-            CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce[j], vector->pubnonces[c->nonce_indices[j]]));
+            CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce[j], MUSIG_SIGN_VERIFY_PUBNONCES(vector, MUSIG_SIGN_VERIFY_NONCE_INDICES(c)[j])));
             pubnonce_ptr[j] = &pubnonce[j];
         }
 
-        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, NULL, c->key_indices_len, c->key_indices, 0, NULL, NULL));
+        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, NULL, c->key_indices_len, MUSIG_SIGN_VERIFY_KEY_INDICES(c), 0, NULL, NULL));
         CHECK(secp256k1_musig_nonce_agg(CTX, &aggnonce, pubnonce_ptr, c->nonce_indices_len) == 1);
-        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, vector->msgs[c->msg_index], &keyagg_cache));
+        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, MUSIG_SIGN_VERIFY_MSGS(vector, c->msg_index), &keyagg_cache));
 
-        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, vector->pubkeys[c->signer_index], sizeof(vector->pubkeys[0])));
+        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, pubkeys[c->signer_index], 33));
 
         expected = c->error != MUSIG_SIG;
-        CHECK(expected == secp256k1_musig_partial_sig_parse(CTX, &partial_sig, c->sig));
+        CHECK(expected == secp256k1_musig_partial_sig_parse(CTX, &partial_sig, MUSIG_SIGN_VERIFY_SIG(c)));
         if (!expected) {
             continue;
         }
@@ -975,25 +988,33 @@ static void musig_test_vectors_signverify(void) {
         int expected;
 
         expected = c->error != MUSIG_PUBKEY;
-        CHECK(expected == musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, NULL, c->key_indices_len, c->key_indices, 0, NULL, NULL));
+        CHECK(expected == musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, NULL, c->key_indices_len, MUSIG_SIGN_VERIFY_KEY_INDICES(c), 0, NULL, NULL));
         CHECK(expected || c->error == error);
         if (!expected) {
             continue;
         }
         expected = c->error != MUSIG_PUBNONCE;
-        CHECK(expected == secp256k1_musig_pubnonce_parse(CTX, &pubnonce, vector->pubnonces[c->nonce_indices[c->signer_index]]));
+        CHECK(expected == secp256k1_musig_pubnonce_parse(CTX, &pubnonce, MUSIG_SIGN_VERIFY_PUBNONCES(vector, MUSIG_SIGN_VERIFY_NONCE_INDICES(c)[c->signer_index])));
     }
 }
 
 static void musig_test_vectors_tweak(void) {
     size_t i;
     const struct musig_tweak_vector *vector = &musig_tweak_vector;
+    const unsigned char *pubkeys[sizeof(vector->pubkeys)/sizeof(vector->pubkeys[0])];
+    const unsigned char *tweaks[sizeof(vector->tweaks)/sizeof(vector->tweaks[0])];
     secp256k1_pubkey pubkey;
     secp256k1_musig_aggnonce aggnonce;
     secp256k1_musig_secnonce secnonce;
 
-    CHECK(secp256k1_musig_aggnonce_parse(CTX, &aggnonce, vector->aggnonce));
-    CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, vector->pubkeys[0], sizeof(vector->pubkeys[0])));
+    for (i = 0; i < sizeof(pubkeys)/sizeof(pubkeys[0]); i++) {
+        pubkeys[i] = MUSIG_TWEAK_PUBKEYS(vector, i);
+    }
+    for (i = 0; i < sizeof(tweaks)/sizeof(tweaks[0]); i++) {
+        tweaks[i] = MUSIG_TWEAK_TWEAKS(vector, i);
+    }
+    CHECK(secp256k1_musig_aggnonce_parse(CTX, &aggnonce, MUSIG_TWEAK_AGGNONCE(vector)));
+    CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, pubkeys[0], 33));
 
     for (i = 0; i < sizeof(vector->valid_case)/sizeof(vector->valid_case[0]); i++) {
         const struct musig_tweak_case *c = &vector->valid_case[i];
@@ -1005,25 +1026,25 @@ static void musig_test_vectors_tweak(void) {
         secp256k1_keypair keypair;
         unsigned char partial_sig32[32];
 
-        musig_test_set_secnonce(&secnonce, vector->secnonce, &pubkey);
+        musig_test_set_secnonce(&secnonce, MUSIG_TWEAK_SECNONCE(vector), &pubkey);
 
-        CHECK(secp256k1_keypair_create(CTX, &keypair, vector->sk));
-        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, vector->tweaks, c->key_indices_len, c->key_indices, c->tweak_indices_len, c->tweak_indices, c->is_xonly));
+        CHECK(secp256k1_keypair_create(CTX, &keypair, MUSIG_TWEAK_SK(vector)));
+        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, tweaks, c->key_indices_len, MUSIG_TWEAK_KEY_INDICES(c), c->tweak_indices_len, MUSIG_TWEAK_TWEAK_INDICES(c), MUSIG_TWEAK_IS_XONLY(c)));
 
-        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, vector->msg, &keyagg_cache));
+        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, MUSIG_TWEAK_MSG(vector), &keyagg_cache));
 
         CHECK(secp256k1_musig_partial_sign(CTX, &partial_sig, &secnonce, &keypair, &keyagg_cache, &session));
         CHECK(secp256k1_musig_partial_sig_serialize(CTX, partial_sig32, &partial_sig));
-        CHECK(secp256k1_memcmp_var(partial_sig32, c->expected, sizeof(partial_sig32)) == 0);
+        CHECK(secp256k1_memcmp_var(partial_sig32, MUSIG_TWEAK_EXPECTED(c), sizeof(partial_sig32)) == 0);
 
-        CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce, vector->pubnonces[c->nonce_indices[c->signer_index]]));
+        CHECK(secp256k1_musig_pubnonce_parse(CTX, &pubnonce, MUSIG_TWEAK_PUBNONCES(vector, MUSIG_TWEAK_NONCE_INDICES(c)[c->signer_index])));
         CHECK(secp256k1_musig_partial_sig_verify(CTX, &partial_sig, &pubnonce, &pubkey, &keyagg_cache, &session));
     }
     for (i = 0; i < sizeof(vector->error_case)/sizeof(vector->error_case[0]); i++) {
         const struct musig_tweak_case *c = &vector->error_case[i];
         enum MUSIG_ERROR error;
         secp256k1_musig_keyagg_cache keyagg_cache;
-        CHECK(!musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, vector->pubkeys, vector->tweaks, c->key_indices_len, c->key_indices, c->tweak_indices_len, c->tweak_indices, c->is_xonly));
+        CHECK(!musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, NULL, pubkeys, tweaks, c->key_indices_len, MUSIG_TWEAK_KEY_INDICES(c), c->tweak_indices_len, MUSIG_TWEAK_TWEAK_INDICES(c), MUSIG_TWEAK_IS_XONLY(c)));
         CHECK(error == MUSIG_TWEAK);
     }
 }
@@ -1031,6 +1052,15 @@ static void musig_test_vectors_tweak(void) {
 static void musig_test_vectors_sigagg(void) {
     size_t i, j;
     const struct musig_sig_agg_vector *vector = &musig_sig_agg_vector;
+    const unsigned char *pubkeys[sizeof(vector->pubkeys)/sizeof(vector->pubkeys[0])];
+    const unsigned char *tweaks[sizeof(vector->tweaks)/sizeof(vector->tweaks[0])];
+
+    for (i = 0; i < sizeof(pubkeys)/sizeof(pubkeys[0]); i++) {
+        pubkeys[i] = MUSIG_SIG_AGG_PUBKEYS(vector, i);
+    }
+    for (i = 0; i < sizeof(tweaks)/sizeof(tweaks[0]); i++) {
+        tweaks[i] = MUSIG_SIG_AGG_TWEAKS(vector, i);
+    }
 
     for (i = 0; i < sizeof(vector->valid_case)/sizeof(vector->valid_case[0]); i++) {
         const struct musig_sig_agg_case *c = &vector->valid_case[i];
@@ -1044,26 +1074,26 @@ static void musig_test_vectors_sigagg(void) {
         secp256k1_musig_partial_sig partial_sig[(sizeof(vector->psigs)/sizeof(vector->psigs[0]))];
         const secp256k1_musig_partial_sig *partial_sig_ptr[(sizeof(vector->psigs)/sizeof(vector->psigs[0]))];
 
-        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, agg_pk32, vector->pubkeys, vector->tweaks, c->key_indices_len, c->key_indices, c->tweak_indices_len, c->tweak_indices, c->is_xonly));
-        CHECK(secp256k1_musig_aggnonce_parse(CTX, &aggnonce, c->aggnonce));
-        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, vector->msg, &keyagg_cache));
+        CHECK(musig_vectors_keyagg_and_tweak(&error, &keyagg_cache, agg_pk32, pubkeys, tweaks, c->key_indices_len, MUSIG_SIG_AGG_KEY_INDICES(c), c->tweak_indices_len, MUSIG_SIG_AGG_TWEAK_INDICES(c), MUSIG_SIG_AGG_IS_XONLY(c)));
+        CHECK(secp256k1_musig_aggnonce_parse(CTX, &aggnonce, MUSIG_SIG_AGG_AGGNONCE(c)));
+        CHECK(secp256k1_musig_nonce_process(CTX, &session, &aggnonce, MUSIG_SIG_AGG_MSG(vector), &keyagg_cache));
         for (j = 0; j < c->psig_indices_len; j++) {
-            CHECK(secp256k1_musig_partial_sig_parse(CTX, &partial_sig[j], vector->psigs[c->psig_indices[j]]));
+            CHECK(secp256k1_musig_partial_sig_parse(CTX, &partial_sig[j], MUSIG_SIG_AGG_PSIGS(vector, MUSIG_SIG_AGG_PSIG_INDICES(c)[j])));
             partial_sig_ptr[j] = &partial_sig[j];
         }
 
         CHECK(secp256k1_musig_partial_sig_agg(CTX, final_sig, &session, partial_sig_ptr, c->psig_indices_len) == 1);
-        CHECK(secp256k1_memcmp_var(final_sig, c->expected, sizeof(final_sig)) == 0);
+        CHECK(secp256k1_memcmp_var(final_sig, MUSIG_SIG_AGG_EXPECTED(c), sizeof(final_sig)) == 0);
 
         CHECK(secp256k1_xonly_pubkey_parse(CTX, &agg_pk, agg_pk32));
-        CHECK(secp256k1_schnorrsig_verify(CTX, final_sig, vector->msg, sizeof(vector->msg), &agg_pk) == 1);
+        CHECK(secp256k1_schnorrsig_verify(CTX, final_sig, MUSIG_SIG_AGG_MSG(vector), 32, &agg_pk) == 1);
     }
     for (i = 0; i < sizeof(vector->error_case)/sizeof(vector->error_case[0]); i++) {
         const struct musig_sig_agg_case *c = &vector->error_case[i];
         secp256k1_musig_partial_sig partial_sig[(sizeof(vector->psigs)/sizeof(vector->psigs[0]))];
         for (j = 0; j < c->psig_indices_len; j++) {
             int expected = c->invalid_sig_idx != (int)j;
-            CHECK(expected == secp256k1_musig_partial_sig_parse(CTX, &partial_sig[j], vector->psigs[c->psig_indices[j]]));
+            CHECK(expected == secp256k1_musig_partial_sig_parse(CTX, &partial_sig[j], MUSIG_SIG_AGG_PSIGS(vector, MUSIG_SIG_AGG_PSIG_INDICES(c)[j])));
         }
     }
 }
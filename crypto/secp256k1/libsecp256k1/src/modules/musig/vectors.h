@@ -37,6 +37,15 @@ struct musig_key_agg_vector {
     struct musig_key_agg_error_test_case error_case[5];
 };
 
+/* Accessors for the fields of musig_key_agg_vector, which resolve
+ * correctly in every layout of this file. */
+#define MUSIG_KEY_AGG_KEY_INDICES(c) ((c)->key_indices)
+#define MUSIG_KEY_AGG_EXPECTED(c) ((c)->expected)
+#define MUSIG_KEY_AGG_TWEAK_INDICES(c) ((c)->tweak_indices)
+#define MUSIG_KEY_AGG_IS_XONLY(c) ((c)->is_xonly)
+#define MUSIG_KEY_AGG_PUBKEYS(v, i) ((v)->pubkeys[i])
+#define MUSIG_KEY_AGG_TWEAKS(v, i) ((v)->tweaks[i])
+
 static const struct musig_key_agg_vector musig_key_agg_vector = {
     {
         { 0x02, 0xF9, 0x30, 0x8A, 0x01, 0x92, 0x58, 0xC3, 0x10, 0x49, 0x34, 0x4F, 0x85, 0xF8, 0x9D, 0x52, 0x29, 0xB5, 0x31, 0xC8, 0x45, 0x83, 0x6F, 0x99, 0xB0, 0x86, 0x01, 0xF1, 0x13, 0xBC, 0xE0, 0x36, 0xF9 },
@@ -85,6 +94,17 @@ struct musig_nonce_gen_vector {
     struct musig_nonce_gen_test_case test_case[2];
 };
 
+/* Accessors for the fields of musig_nonce_gen_vector, which resolve
+ * correctly in every layout of this file. */
+#define MUSIG_NONCE_GEN_RAND_(c) ((c)->rand_)
+#define MUSIG_NONCE_GEN_SK(c) ((c)->sk)
+#define MUSIG_NONCE_GEN_PK(c) ((c)->pk)
+#define MUSIG_NONCE_GEN_AGGPK(c) ((c)->aggpk)
+#define MUSIG_NONCE_GEN_MSG(c) ((c)->msg)
+#define MUSIG_NONCE_GEN_EXTRA_IN(c) ((c)->extra_in)
+#define MUSIG_NONCE_GEN_EXPECTED_SECNONCE(c) ((c)->expected_secnonce)
+#define MUSIG_NONCE_GEN_EXPECTED_PUBNONCE(c) ((c)->expected_pubnonce)
+
 static const struct musig_nonce_gen_vector musig_nonce_gen_vector = {
     {
         { { 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F },  1 , { 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02, 0x02 }, { 0x02, 0x4D, 0x4B, 0x6C, 0xD1, 0x36, 0x10, 0x32, 0xCA, 0x9B, 0xD2, 0xAE, 0xB9, 0xD9, 0x00, 0xAA, 0x4D, 0x45, 0xD9, 0xEA, 0xD8, 0x0A, 0xC9, 0x42, 0x33, 0x74, 0xC4, 0x51, 0xA7, 0x25, 0x4D, 0x07, 0x66 }, 1 , { 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07 }, 1 , { 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01 }, 1 , { 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08 }, { 0xB1, 0x14, 0xE5, 0x02, 0xBE, 0xAA, 0x4E, 0x30, 0x1D, 0xD0, 0x8A, 0x50, 0x26, 0x41, 0x72, 0xC8, 0x4E, 0x41, 0x65, 0x0E, 0x6C, 0xB7, 0x26, 0xB4, 0x10, 0xC0, 0x69, 0x4D, 0x59, 0xEF, 0xFB, 0x64, 0x95, 0xB5, 0xCA, 0xF2, 0x8D, 0x04, 0x5B, 0x97, 0x3D, 0x63, 0xE3, 0xC9, 0x9A, 0x44, 0xB8, 0x07, 0xBD, 0xE3, 0x75, 0xFD, 0x6C, 0xB3, 0x9E, 0x46, 0xDC, 0x4A, 0x51, 0x17, 0x08, 0xD0, 0xE9, 0xD2, 0x02, 0x4D, 0x4B, 0x6C, 0xD1, 0x36, 0x10, 0x32, 0xCA, 0x9B, 0xD2, 0xAE, 0xB9, 0xD9, 0x00, 0xAA, 0x4D, 0x45, 0xD9, 0xEA, 0xD8, 0x0A, 0xC9, 0x42, 0x33, 0x74, 0xC4, 0x51, 0xA7, 0x25, 0x4D, 0x07, 0x66 }, { 0x02, 0xF7, 0xBE, 0x70, 0x89, 0xE8, 0x37, 0x6E, 0xB3, 0x55, 0x27, 0x23, 0x68, 0x76, 0x6B, 0x17, 0xE8, 0x8E, 0x7D, 0xB7, 0x20, 0x47, 0xD0, 0x5E, 0x56, 0xAA, 0x88, 0x1E, 0xA5, 0x2B, 0x3B, 0x35, 0xDF, 0x02, 0xC2, 0x9C, 0x80, 0x46, 0xFD, 0xD0, 0xDE, 0xD4, 0xC7, 0xE5, 0x58, 0x69, 0x13, 0x72, 0x00, 0xFB, 0xDB, 0xFE, 0x2E, 0xB6, 0x54, 0x26, 0x7B, 0x6D, 0x70, 0x13, 0x60, 0x2C, 0xAE, 0xD3, 0x11, 0x5A } },
@@ -106,6 +126,11 @@ struct musig_nonce_agg_vector {
     struct musig_nonce_agg_test_case error_case[3];
 };
 
+/* Accessors for the fields of musig_nonce_agg_vector, which resolve
+ * correctly in every layout of this file. */
+#define MUSIG_NONCE_AGG_EXPECTED(c) ((c)->expected)
+#define MUSIG_NONCE_AGG_PNONCES(v, i) ((v)->pnonces[i])
+
 static const struct musig_nonce_agg_vector musig_nonce_agg_vector = {
     {
         { 0x02, 0x01, 0x51, 0xC8, 0x0F, 0x43, 0x56, 0x48, 0xDF, 0x67, 0xA2, 0x2B, 0x74, 0x9C, 0xD7, 0x98, 0xCE, 0x54, 0xE0, 0x32, 0x1D, 0x03, 0x4B, 0x92, 0xB7, 0x09, 0xB5, 0x67, 0xD6, 0x0A, 0x42, 0xE6, 0x66, 0x03, 0xBA, 0x47, 0xFB, 0xC1, 0x83, 0x44, 0x37, 0xB3, 0x21, 0x2E, 0x89, 0xA8, 0x4D, 0x84, 0x25, 0xE7, 0xBF, 0x12, 0xE0, 0x24, 0x5D, 0x98, 0x26, 0x22, 0x68, 0xEB, 0xDC, 0xB3, 0x85, 0xD5, 0x06, 0x41 },
@@ -171,6 +196,19 @@ struct musig_sign_verify_vector {
     struct musig_verify_fail_error_case verify_error_case[2];
 };
 
+/* Accessors for the fields of musig_sign_verify_vector, which resolve
+ * correctly in every layout of this file. */
+#define MUSIG_SIGN_VERIFY_KEY_INDICES(c) ((c)->key_indices)
+#define MUSIG_SIGN_VERIFY_EXPECTED(c) ((c)->expected)
+#define MUSIG_SIGN_VERIFY_SIG(c) ((c)->sig)
+#define MUSIG_SIGN_VERIFY_NONCE_INDICES(c) ((c)->nonce_indices)
+#define MUSIG_SIGN_VERIFY_SK(v) ((v)->sk)
+#define MUSIG_SIGN_VERIFY_PUBKEYS(v, i) ((v)->pubkeys[i])
+#define MUSIG_SIGN_VERIFY_SECNONCES(v, i) ((v)->secnonces[i])
+#define MUSIG_SIGN_VERIFY_PUBNONCES(v, i) ((v)->pubnonces[i])
+#define MUSIG_SIGN_VERIFY_AGGNONCES(v, i) ((v)->aggnonces[i])
+#define MUSIG_SIGN_VERIFY_MSGS(v, i) ((v)->msgs[i])
+
 static const struct musig_sign_verify_vector musig_sign_verify_vector = {
     { 0x7F, 0xB9, 0xE0, 0xE6, 0x87, 0xAD, 0xA1, 0xEE, 0xBF, 0x7E, 0xCF, 0xE2, 0xF2, 0x1E, 0x73, 0xEB, 0xDB, 0x51, 0xA7, 0xD4, 0x50, 0x94, 0x8D, 0xFE, 0x8D, 0x76, 0xD7, 0xF2, 0xD1, 0x00, 0x76, 0x71 },
     {
@@ -249,6 +287,21 @@ struct musig_tweak_vector {
     struct musig_tweak_case error_case[1];
 };
 
+/* Accessors for the fields of musig_tweak_vector, which resolve
+ * correctly in every layout of this file. */
+#define MUSIG_TWEAK_KEY_INDICES(c) ((c)->key_indices)
+#define MUSIG_TWEAK_NONCE_INDICES(c) ((c)->nonce_indices)
+#define MUSIG_TWEAK_TWEAK_INDICES(c) ((c)->tweak_indices)
+#define MUSIG_TWEAK_IS_XONLY(c) ((c)->is_xonly)
+#define MUSIG_TWEAK_EXPECTED(c) ((c)->expected)
+#define MUSIG_TWEAK_SK(v) ((v)->sk)
+#define MUSIG_TWEAK_SECNONCE(v) ((v)->secnonce)
+#define MUSIG_TWEAK_AGGNONCE(v) ((v)->aggnonce)
+#define MUSIG_TWEAK_MSG(v) ((v)->msg)
+#define MUSIG_TWEAK_PUBKEYS(v, i) ((v)->pubkeys[i])
+#define MUSIG_TWEAK_PUBNONCES(v, i) ((v)->pubnonces[i])
+#define MUSIG_TWEAK_TWEAKS(v, i) ((v)->tweaks[i])
+
 static const struct musig_tweak_vector musig_tweak_vector = {
     { 0x7F, 0xB9, 0xE0, 0xE6, 0x87, 0xAD, 0xA1, 0xEE, 0xBF, 0x7E, 0xCF, 0xE2, 0xF2, 0x1E, 0x73, 0xEB, 0xDB, 0x51, 0xA7, 0xD4, 0x50, 0x94, 0x8D, 0xFE, 0x8D, 0x76, 0xD7, 0xF2, 0xD1, 0x00, 0x76, 0x71 },
     { 0x50, 0x8B, 0x81, 0xA6, 0x11, 0xF1, 0x00, 0xA6, 0xB2, 0xB6, 0xB2, 0x96, 0x56, 0x59, 0x08, 0x98, 0xAF, 0x48, 0x8B, 0xCF, 0x2E, 0x1F, 0x55, 0xCF, 0x22, 0xE5, 0xCF, 0xB8, 0x44, 0x21, 0xFE, 0x61, 0xFA, 0x27, 0xFD, 0x49, 0xB1, 0xD5, 0x00, 0x85, 0xB4, 0x81, 0x28, 0x5E, 0x1C, 0xA2, 0x05, 0xD5, 0x5C, 0x82, 0xCC, 0x1B, 0x31, 0xFF, 0x5C, 0xD5, 0x4A, 0x48, 0x98, 0x29, 0x35, 0x59, 0x01, 0xF7, 0x03, 0x93, 0x5F, 0x97, 0x2D, 0xA0, 0x13, 0xF8, 0x0A, 0xE0, 0x11, 0x89, 0x0F, 0xA8, 0x9B, 0x67, 0xA2, 0x7B, 0x7B, 0xE6, 0xCC, 0xB2, 0x4D, 0x32, 0x74, 0xD1, 0x8B, 0x2D, 0x40, 0x67, 0xF2, 0x61, 0xA9 },
@@ -309,6 +362,19 @@ struct musig_sig_agg_vector {
     struct musig_sig_agg_case error_case[1];
 };
 
+/* Accessors for the fields of musig_sig_agg_vector, which resolve
+ * correctly in every layout of this file. */
+#define MUSIG_SIG_AGG_KEY_INDICES(c) ((c)->key_indices)
+#define MUSIG_SIG_AGG_TWEAK_INDICES(c) ((c)->tweak_indices)
+#define MUSIG_SIG_AGG_IS_XONLY(c) ((c)->is_xonly)
+#define MUSIG_SIG_AGG_AGGNONCE(c) ((c)->aggnonce)
+#define MUSIG_SIG_AGG_PSIG_INDICES(c) ((c)->psig_indices)
+#define MUSIG_SIG_AGG_EXPECTED(c) ((c)->expected)
+#define MUSIG_SIG_AGG_PUBKEYS(v, i) ((v)->pubkeys[i])
+#define MUSIG_SIG_AGG_TWEAKS(v, i) ((v)->tweaks[i])
+#define MUSIG_SIG_AGG_PSIGS(v, i) ((v)->psigs[i])
+#define MUSIG_SIG_AGG_MSG(v) ((v)->msg)
+
 static const struct musig_sig_agg_vector musig_sig_agg_vector = {
     {
         { 0x03, 0x93, 0x5F, 0x97, 0x2D, 0xA0, 0x13, 0xF8, 0x0A, 0xE0, 0x11, 0x89, 0x0F, 0xA8, 0x9B, 0x67, 0xA2, 0x7B, 0x7B, 0xE6, 0xCC, 0xB2, 0x4D, 0x32, 0x74, 0xD1, 0x8B, 0x2D, 0x40, 0x67, 0xF2, 0x61, 0xA9 },
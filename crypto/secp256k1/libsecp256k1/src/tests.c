@@ -7400,29 +7400,49 @@ The tests check for known attacks (range checks in (r,s), arithmetic errors, mal
 static void test_ecdsa_wycheproof(void) {
     #include "wycheproof/ecdsa_secp256k1_sha256_bitcoin_test.h"
 
-    int t;
-    for (t = 0; t < SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS; t++) {
-        secp256k1_ecdsa_signature signature;
-        secp256k1_sha256 hasher;
+    size_t g, t;
+    for (g = 0; g < SECP256K1_ECDSA_WYCHEPROOF_NUMBER_KEY_GROUPS; g++) {
+        const wycheproof_ecdsa_key_group *group = &wycheproof_ecdsa_key_groups[g];
         secp256k1_pubkey pubkey;
-        const unsigned char *msg, *sig, *pk;
-        unsigned char out[32] = {0};
-        int actual_verify = 0;
 
+        /* The vectors of a group all use its public key, parse it once. */
         memset(&pubkey, 0, sizeof(pubkey));
-        pk = &wycheproof_ecdsa_public_keys[testvectors[t].pk_offset];
-        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, pk, 65) == 1);
+        CHECK(secp256k1_ec_pubkey_parse(CTX, &pubkey, &wycheproof_ecdsa_public_keys[group->pk_offset], 65) == 1);
+
+        for (t = group->first_testvector; t < group->first_testvector + group->num_testvectors; t++) {
+            const wycheproof_ecdsa_testvector *vector = &testvectors[t];
+            secp256k1_ecdsa_signature signature;
+            secp256k1_sha256 hasher;
+            const unsigned char *msg, *sig;
+            unsigned char out[32] = {0};
+            unsigned char rs[64], compact[64];
+            int actual_verify = 0;
+
+            if (vector->der_class == WYCHEPROOF_DER_INVALID) {
+                /* The generator found secp256k1_ecdsa_signature_parse_der to
+                 * reject the signature, so there is nothing to verify. */
+                CHECK(vector->expected_verify == 0);
+                continue;
+            }
 
-        secp256k1_sha256_initialize(&hasher);
-        msg = &wycheproof_ecdsa_messages[testvectors[t].msg_offset];
-        secp256k1_sha256_write(&hasher, msg, testvectors[t].msg_len);
-        secp256k1_sha256_finalize(&hasher, out);
+            secp256k1_sha256_initialize(&hasher);
+            msg = &wycheproof_ecdsa_messages[vector->msg_offset];
+            secp256k1_sha256_write(&hasher, msg, vector->msg_len);
+            secp256k1_sha256_finalize(&hasher, out);
 
-        sig = &wycheproof_ecdsa_signatures[testvectors[t].sig_offset];
-        if (secp256k1_ecdsa_signature_parse_der(CTX, &signature, sig, testvectors[t].sig_len) == 1) {
+            sig = &wycheproof_ecdsa_signatures[vector->sig_offset];
+            CHECK(secp256k1_ecdsa_signature_parse_der(CTX, &signature, sig, vector->sig_len) == 1);
+            if (vector->der_class != WYCHEPROOF_DER_OUT_OF_RANGE) {
+                /* r and s are where the generator found them. */
+                memset(rs, 0, sizeof(rs));
+                memcpy(&rs[32 - vector->r_len], &sig[vector->r_offset], vector->r_len);
+                memcpy(&rs[64 - vector->s_len], &sig[vector->s_offset], vector->s_len);
+                CHECK(secp256k1_ecdsa_signature_serialize_compact(CTX, compact, &signature) == 1);
+                CHECK(secp256k1_memcmp_var(compact, rs, sizeof(rs)) == 0);
+            }
             actual_verify = secp256k1_ecdsa_verify(CTX, (const secp256k1_ecdsa_signature *)&signature, out, &pubkey);
+            CHECK(vector->expected_verify == actual_verify);
         }
-        CHECK(testvectors[t].expected_verify == actual_verify);
     }
 }
 
@@ -1,15 +1,42 @@
 /* Note: this file was autogenerated using tests_wycheproof_generate.py. Do not edit. */
 #define SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS (463)
+#define SECP256K1_ECDSA_WYCHEPROOF_NUMBER_KEY_GROUPS (99)
+
+typedef enum {
+    /* rejected by secp256k1_ecdsa_signature_parse_der */
+    WYCHEPROOF_DER_INVALID,
+    /* parses, but r or s is zero, negative or not less than the group order */
+    WYCHEPROOF_DER_OUT_OF_RANGE,
+    /* parses and is in range, but rejected by secp256k1_ecdsa_verify for its high s */
+    WYCHEPROOF_DER_HIGH_S,
+    /* parses and is in range; needs an actual verification */
+    WYCHEPROOF_DER_VALID
+} wycheproof_der_class;
 
 typedef struct {
+    size_t tc_id;
     size_t pk_offset;
     size_t msg_offset;
     size_t msg_len;
     size_t sig_offset;
     size_t sig_len;
     int expected_verify;
+    wycheproof_der_class der_class;
+    /* position of r and s within the signature, without leading zero byte */
+    size_t r_offset;
+    size_t r_len;
+    size_t s_offset;
+    size_t s_len;
 } wycheproof_ecdsa_testvector;
 
+
+/* A run of testvectors which all use the public key at pk_offset. */
+typedef struct {
+    size_t pk_offset;
+    size_t first_testvector;
+    size_t num_testvectors;
+} wycheproof_ecdsa_key_group;
+
 static const unsigned char wycheproof_ecdsa_messages[]    = { 0x31,0x32,0x33,0x34,0x30,0x30,
   0x32,0x35,0x35,0x38,0x35,
   0x34,0x32,0x36,0x34,0x37,0x39,0x37,0x32,0x34,
@@ -635,930 +662,1033 @@ static const unsigned char wycheproof_ecdsa_signatures[]  = { 0x30,0x46,0x02,0x2
 
 static const wycheproof_ecdsa_testvector testvectors[SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS] = {
   /* tcId: 1. Signature malleability */
-  {0, 0, 6, 0, 72, 0 },
+  {1, 0, 0, 6, 0, 72, 0, WYCHEPROOF_DER_HIGH_S, 5, 32, 40, 32 },
   /* tcId: 2. valid */
-  {0, 0, 6, 72, 71, 1 },
+  {2, 0, 0, 6, 72, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 3. length of sequence [r, s] uses long form encoding */
-  {0, 0, 6, 143, 72, 0 },
+  {3, 0, 0, 6, 143, 72, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 4. length of sequence [r, s] contains a leading 0 */
-  {0, 0, 6, 215, 73, 0 },
+  {4, 0, 0, 6, 215, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 5. length of sequence [r, s] uses 70 instead of 69 */
-  {0, 0, 6, 288, 71, 0 },
+  {5, 0, 0, 6, 288, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 6. length of sequence [r, s] uses 68 instead of 69 */
-  {0, 0, 6, 359, 71, 0 },
+  {6, 0, 0, 6, 359, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 7. uint32 overflow in length of sequence [r, s] */
-  {0, 0, 6, 430, 76, 0 },
+  {7, 0, 0, 6, 430, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 8. uint64 overflow in length of sequence [r, s] */
-  {0, 0, 6, 506, 80, 0 },
+  {8, 0, 0, 6, 506, 80, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 9. length of sequence [r, s] = 2**31 - 1 */
-  {0, 0, 6, 586, 75, 0 },
+  {9, 0, 0, 6, 586, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 10. length of sequence [r, s] = 2**31 */
-  {0, 0, 6, 661, 75, 0 },
+  {10, 0, 0, 6, 661, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 11. length of sequence [r, s] = 2**32 - 1 */
-  {0, 0, 6, 736, 75, 0 },
+  {11, 0, 0, 6, 736, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 12. length of sequence [r, s] = 2**40 - 1 */
-  {0, 0, 6, 811, 76, 0 },
+  {12, 0, 0, 6, 811, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 13. length of sequence [r, s] = 2**64 - 1 */
-  {0, 0, 6, 887, 79, 0 },
+  {13, 0, 0, 6, 887, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 14. incorrect length of sequence [r, s] */
-  {0, 0, 6, 966, 71, 0 },
+  {14, 0, 0, 6, 966, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 15. replaced sequence [r, s] by an indefinite length tag without termination */
-  {0, 0, 6, 1037, 71, 0 },
+  {15, 0, 0, 6, 1037, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 16. removing sequence [r, s] */
-  {0, 0, 6, 1108, 0, 0 },
+  {16, 0, 0, 6, 1108, 0, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 17. lonely sequence tag */
-  {0, 0, 6, 1108, 1, 0 },
+  {17, 0, 0, 6, 1108, 1, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 18. appending 0's to sequence [r, s] */
-  {0, 0, 6, 1109, 73, 0 },
+  {18, 0, 0, 6, 1109, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 19. prepending 0's to sequence [r, s] */
-  {0, 0, 6, 1182, 73, 0 },
+  {19, 0, 0, 6, 1182, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 20. appending unused 0's to sequence [r, s] */
-  {0, 0, 6, 1255, 73, 0 },
+  {20, 0, 0, 6, 1255, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 21. appending null value to sequence [r, s] */
-  {0, 0, 6, 1328, 73, 0 },
+  {21, 0, 0, 6, 1328, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 22. prepending garbage to sequence [r, s] */
-  {0, 0, 6, 1401, 76, 0 },
+  {22, 0, 0, 6, 1401, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 23. prepending garbage to sequence [r, s] */
-  {0, 0, 6, 1477, 75, 0 },
+  {23, 0, 0, 6, 1477, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 24. appending garbage to sequence [r, s] */
-  {0, 0, 6, 1552, 79, 0 },
+  {24, 0, 0, 6, 1552, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 25. including undefined tags */
-  {0, 0, 6, 1631, 79, 0 },
+  {25, 0, 0, 6, 1631, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 26. including undefined tags */
-  {0, 0, 6, 1710, 79, 0 },
+  {26, 0, 0, 6, 1710, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 27. including undefined tags */
-  {0, 0, 6, 1789, 79, 0 },
+  {27, 0, 0, 6, 1789, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 28. truncated length of sequence [r, s] */
-  {0, 0, 6, 1868, 2, 0 },
+  {28, 0, 0, 6, 1868, 2, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 29. including undefined tags to sequence [r, s] */
-  {0, 0, 6, 1870, 77, 0 },
+  {29, 0, 0, 6, 1870, 77, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 30. using composition with indefinite length for sequence [r, s] */
-  {0, 0, 6, 1947, 75, 0 },
+  {30, 0, 0, 6, 1947, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 31. using composition with wrong tag for sequence [r, s] */
-  {0, 0, 6, 2022, 75, 0 },
+  {31, 0, 0, 6, 2022, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 32. Replacing sequence [r, s] with NULL */
-  {0, 0, 6, 2097, 2, 0 },
+  {32, 0, 0, 6, 2097, 2, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 33. changing tag value of sequence [r, s] */
-  {0, 0, 6, 2099, 71, 0 },
+  {33, 0, 0, 6, 2099, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 34. changing tag value of sequence [r, s] */
-  {0, 0, 6, 2170, 71, 0 },
+  {34, 0, 0, 6, 2170, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 35. changing tag value of sequence [r, s] */
-  {0, 0, 6, 2241, 71, 0 },
+  {35, 0, 0, 6, 2241, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 36. changing tag value of sequence [r, s] */
-  {0, 0, 6, 2312, 71, 0 },
+  {36, 0, 0, 6, 2312, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 37. changing tag value of sequence [r, s] */
-  {0, 0, 6, 2383, 71, 0 },
+  {37, 0, 0, 6, 2383, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 38. dropping value of sequence [r, s] */
-  {0, 0, 6, 2454, 2, 0 },
+  {38, 0, 0, 6, 2454, 2, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 39. using composition for sequence [r, s] */
-  {0, 0, 6, 2456, 75, 0 },
+  {39, 0, 0, 6, 2456, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 40. truncated sequence [r, s] */
-  {0, 0, 6, 2531, 70, 0 },
+  {40, 0, 0, 6, 2531, 70, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 41. truncated sequence [r, s] */
-  {0, 0, 6, 2601, 70, 0 },
+  {41, 0, 0, 6, 2601, 70, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 42. sequence [r, s] of size 4166 to check for overflows */
-  {0, 0, 6, 2671, 4170, 0 },
+  {42, 0, 0, 6, 2671, 4170, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 43. indefinite length */
-  {0, 0, 6, 6841, 73, 0 },
+  {43, 0, 0, 6, 6841, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 44. indefinite length with truncated delimiter */
-  {0, 0, 6, 6914, 72, 0 },
+  {44, 0, 0, 6, 6914, 72, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 45. indefinite length with additional element */
-  {0, 0, 6, 6986, 75, 0 },
+  {45, 0, 0, 6, 6986, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 46. indefinite length with truncated element */
-  {0, 0, 6, 7061, 77, 0 },
+  {46, 0, 0, 6, 7061, 77, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 47. indefinite length with garbage */
-  {0, 0, 6, 7138, 77, 0 },
+  {47, 0, 0, 6, 7138, 77, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 48. indefinite length with nonempty EOC */
-  {0, 0, 6, 7215, 75, 0 },
+  {48, 0, 0, 6, 7215, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 49. prepend empty sequence */
-  {0, 0, 6, 7290, 73, 0 },
+  {49, 0, 0, 6, 7290, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 50. append empty sequence */
-  {0, 0, 6, 7363, 73, 0 },
+  {50, 0, 0, 6, 7363, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 51. append zero */
-  {0, 0, 6, 7436, 74, 0 },
+  {51, 0, 0, 6, 7436, 74, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 52. append garbage with high tag number */
-  {0, 0, 6, 7510, 74, 0 },
+  {52, 0, 0, 6, 7510, 74, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 53. append null with explicit tag */
-  {0, 0, 6, 7584, 75, 0 },
+  {53, 0, 0, 6, 7584, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 54. append null with implicit tag */
-  {0, 0, 6, 7659, 73, 0 },
+  {54, 0, 0, 6, 7659, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 55. sequence of sequence */
-  {0, 0, 6, 7732, 73, 0 },
+  {55, 0, 0, 6, 7732, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 56. truncated sequence: removed last 1 elements */
-  {0, 0, 6, 7805, 37, 0 },
+  {56, 0, 0, 6, 7805, 37, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 57. repeating element in sequence */
-  {0, 0, 6, 7842, 105, 0 },
+  {57, 0, 0, 6, 7842, 105, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 58. flipped bit 0 in r */
-  {0, 0, 6, 7947, 69, 0 },
+  {58, 0, 0, 6, 7947, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 59. flipped bit 32 in r */
-  {0, 0, 6, 8016, 69, 0 },
+  {59, 0, 0, 6, 8016, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 60. flipped bit 48 in r */
-  {0, 0, 6, 8085, 69, 0 },
+  {60, 0, 0, 6, 8085, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 61. flipped bit 64 in r */
-  {0, 0, 6, 8154, 69, 0 },
+  {61, 0, 0, 6, 8154, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 62. length of r uses long form encoding */
-  {0, 0, 6, 8223, 72, 0 },
+  {62, 0, 0, 6, 8223, 72, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 63. length of r contains a leading 0 */
-  {0, 0, 6, 8295, 73, 0 },
+  {63, 0, 0, 6, 8295, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 64. length of r uses 34 instead of 33 */
-  {0, 0, 6, 8368, 71, 0 },
+  {64, 0, 0, 6, 8368, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 65. length of r uses 32 instead of 33 */
-  {0, 0, 6, 8439, 71, 0 },
+  {65, 0, 0, 6, 8439, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 66. uint32 overflow in length of r */
-  {0, 0, 6, 8510, 76, 0 },
+  {66, 0, 0, 6, 8510, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 67. uint64 overflow in length of r */
-  {0, 0, 6, 8586, 80, 0 },
+  {67, 0, 0, 6, 8586, 80, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 68. length of r = 2**31 - 1 */
-  {0, 0, 6, 8666, 75, 0 },
+  {68, 0, 0, 6, 8666, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 69. length of r = 2**31 */
-  {0, 0, 6, 8741, 75, 0 },
+  {69, 0, 0, 6, 8741, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 70. length of r = 2**32 - 1 */
-  {0, 0, 6, 8816, 75, 0 },
+  {70, 0, 0, 6, 8816, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 71. length of r = 2**40 - 1 */
-  {0, 0, 6, 8891, 76, 0 },
+  {71, 0, 0, 6, 8891, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 72. length of r = 2**64 - 1 */
-  {0, 0, 6, 8967, 79, 0 },
+  {72, 0, 0, 6, 8967, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 73. incorrect length of r */
-  {0, 0, 6, 9046, 71, 0 },
+  {73, 0, 0, 6, 9046, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 74. replaced r by an indefinite length tag without termination */
-  {0, 0, 6, 9117, 71, 0 },
+  {74, 0, 0, 6, 9117, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 75. removing r */
-  {0, 0, 6, 9188, 36, 0 },
+  {75, 0, 0, 6, 9188, 36, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 76. lonely integer tag */
-  {0, 0, 6, 9224, 37, 0 },
+  {76, 0, 0, 6, 9224, 37, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 77. lonely integer tag */
-  {0, 0, 6, 9261, 38, 0 },
+  {77, 0, 0, 6, 9261, 38, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 78. appending 0's to r */
-  {0, 0, 6, 9299, 73, 0 },
+  {78, 0, 0, 6, 9299, 73, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 34, 41, 32 },
   /* tcId: 79. prepending 0's to r */
-  {0, 0, 6, 9372, 73, 0 },
+  {79, 0, 0, 6, 9372, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 80. appending unused 0's to r */
-  {0, 0, 6, 9445, 73, 0 },
+  {80, 0, 0, 6, 9445, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 81. appending null value to r */
-  {0, 0, 6, 9518, 73, 0 },
+  {81, 0, 0, 6, 9518, 73, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 34, 41, 32 },
   /* tcId: 82. prepending garbage to r */
-  {0, 0, 6, 9591, 76, 0 },
+  {82, 0, 0, 6, 9591, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 83. prepending garbage to r */
-  {0, 0, 6, 9667, 75, 0 },
+  {83, 0, 0, 6, 9667, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 84. appending garbage to r */
-  {0, 0, 6, 9742, 79, 0 },
+  {84, 0, 0, 6, 9742, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 85. truncated length of r */
-  {0, 0, 6, 9821, 38, 0 },
+  {85, 0, 0, 6, 9821, 38, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 86. including undefined tags to r */
-  {0, 0, 6, 9859, 77, 0 },
+  {86, 0, 0, 6, 9859, 77, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 87. using composition with indefinite length for r */
-  {0, 0, 6, 9936, 75, 0 },
+  {87, 0, 0, 6, 9936, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 88. using composition with wrong tag for r */
-  {0, 0, 6, 10011, 75, 0 },
+  {88, 0, 0, 6, 10011, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 89. Replacing r with NULL */
-  {0, 0, 6, 10086, 38, 0 },
+  {89, 0, 0, 6, 10086, 38, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 90. changing tag value of r */
-  {0, 0, 6, 10124, 71, 0 },
+  {90, 0, 0, 6, 10124, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 91. changing tag value of r */
-  {0, 0, 6, 10195, 71, 0 },
+  {91, 0, 0, 6, 10195, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 92. changing tag value of r */
-  {0, 0, 6, 10266, 71, 0 },
+  {92, 0, 0, 6, 10266, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 93. changing tag value of r */
-  {0, 0, 6, 10337, 71, 0 },
+  {93, 0, 0, 6, 10337, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 94. changing tag value of r */
-  {0, 0, 6, 10408, 71, 0 },
+  {94, 0, 0, 6, 10408, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 95. dropping value of r */
-  {0, 0, 6, 10479, 38, 0 },
+  {95, 0, 0, 6, 10479, 38, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 96. using composition for r */
-  {0, 0, 6, 10517, 75, 0 },
+  {96, 0, 0, 6, 10517, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 97. modifying first byte of r */
-  {0, 0, 6, 10592, 71, 0 },
+  {97, 0, 0, 6, 10592, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 98. modifying last byte of r */
-  {0, 0, 6, 10663, 71, 0 },
+  {98, 0, 0, 6, 10663, 71, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 99. truncated r */
-  {0, 0, 6, 10734, 70, 0 },
+  {99, 0, 0, 6, 10734, 70, 0, WYCHEPROOF_DER_VALID, 5, 31, 38, 32 },
   /* tcId: 100. truncated r */
-  {0, 0, 6, 10804, 70, 0 },
+  {100, 0, 0, 6, 10804, 70, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 32, 38, 32 },
   /* tcId: 101. r of size 4130 to check for overflows */
-  {0, 0, 6, 10874, 4172, 0 },
+  {101, 0, 0, 6, 10874, 4172, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 9, 4129, 4140, 32 },
   /* tcId: 102. leading ff in r */
-  {0, 0, 6, 15046, 72, 0 },
+  {102, 0, 0, 6, 15046, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 34, 40, 32 },
   /* tcId: 103. replaced r by infinity */
-  {0, 0, 6, 15118, 39, 0 },
+  {103, 0, 0, 6, 15118, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 104. replacing r with zero */
-  {0, 0, 6, 15157, 39, 0 },
+  {104, 0, 0, 6, 15157, 39, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 7, 32 },
   /* tcId: 105. flipped bit 0 in s */
-  {0, 0, 6, 15196, 69, 0 },
+  {105, 0, 0, 6, 15196, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 106. flipped bit 32 in s */
-  {0, 0, 6, 15265, 69, 0 },
+  {106, 0, 0, 6, 15265, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 107. flipped bit 48 in s */
-  {0, 0, 6, 15334, 69, 0 },
+  {107, 0, 0, 6, 15334, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 108. flipped bit 64 in s */
-  {0, 0, 6, 15403, 69, 0 },
+  {108, 0, 0, 6, 15403, 69, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 109. length of s uses long form encoding */
-  {0, 0, 6, 15472, 72, 0 },
+  {109, 0, 0, 6, 15472, 72, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 110. length of s contains a leading 0 */
-  {0, 0, 6, 15544, 73, 0 },
+  {110, 0, 0, 6, 15544, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 111. length of s uses 33 instead of 32 */
-  {0, 0, 6, 15617, 71, 0 },
+  {111, 0, 0, 6, 15617, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 112. length of s uses 31 instead of 32 */
-  {0, 0, 6, 15688, 71, 0 },
+  {112, 0, 0, 6, 15688, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 113. uint32 overflow in length of s */
-  {0, 0, 6, 15759, 76, 0 },
+  {113, 0, 0, 6, 15759, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 114. uint64 overflow in length of s */
-  {0, 0, 6, 15835, 80, 0 },
+  {114, 0, 0, 6, 15835, 80, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 115. length of s = 2**31 - 1 */
-  {0, 0, 6, 15915, 75, 0 },
+  {115, 0, 0, 6, 15915, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 116. length of s = 2**31 */
-  {0, 0, 6, 15990, 75, 0 },
+  {116, 0, 0, 6, 15990, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 117. length of s = 2**32 - 1 */
-  {0, 0, 6, 16065, 75, 0 },
+  {117, 0, 0, 6, 16065, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 118. length of s = 2**40 - 1 */
-  {0, 0, 6, 16140, 76, 0 },
+  {118, 0, 0, 6, 16140, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 119. length of s = 2**64 - 1 */
-  {0, 0, 6, 16216, 79, 0 },
+  {119, 0, 0, 6, 16216, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 120. incorrect length of s */
-  {0, 0, 6, 16295, 71, 0 },
+  {120, 0, 0, 6, 16295, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 121. replaced s by an indefinite length tag without termination */
-  {0, 0, 6, 16366, 71, 0 },
+  {121, 0, 0, 6, 16366, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 122. appending 0's to s */
-  {0, 0, 6, 16437, 73, 0 },
+  {122, 0, 0, 6, 16437, 73, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 34 },
   /* tcId: 123. prepending 0's to s */
-  {0, 0, 6, 16510, 73, 0 },
+  {123, 0, 0, 6, 16510, 73, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 124. appending null value to s */
-  {0, 0, 6, 16583, 73, 0 },
+  {124, 0, 0, 6, 16583, 73, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 34 },
   /* tcId: 125. prepending garbage to s */
-  {0, 0, 6, 16656, 76, 0 },
+  {125, 0, 0, 6, 16656, 76, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 126. prepending garbage to s */
-  {0, 0, 6, 16732, 75, 0 },
+  {126, 0, 0, 6, 16732, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 127. appending garbage to s */
-  {0, 0, 6, 16807, 79, 0 },
+  {127, 0, 0, 6, 16807, 79, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 128. truncated length of s */
-  {0, 0, 6, 16886, 39, 0 },
+  {128, 0, 0, 6, 16886, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 129. including undefined tags to s */
-  {0, 0, 6, 16925, 77, 0 },
+  {129, 0, 0, 6, 16925, 77, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 130. using composition with indefinite length for s */
-  {0, 0, 6, 17002, 75, 0 },
+  {130, 0, 0, 6, 17002, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 131. using composition with wrong tag for s */
-  {0, 0, 6, 17077, 75, 0 },
+  {131, 0, 0, 6, 17077, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 132. Replacing s with NULL */
-  {0, 0, 6, 17152, 39, 0 },
+  {132, 0, 0, 6, 17152, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 133. changing tag value of s */
-  {0, 0, 6, 17191, 71, 0 },
+  {133, 0, 0, 6, 17191, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 134. changing tag value of s */
-  {0, 0, 6, 17262, 71, 0 },
+  {134, 0, 0, 6, 17262, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 135. changing tag value of s */
-  {0, 0, 6, 17333, 71, 0 },
+  {135, 0, 0, 6, 17333, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 136. changing tag value of s */
-  {0, 0, 6, 17404, 71, 0 },
+  {136, 0, 0, 6, 17404, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 137. changing tag value of s */
-  {0, 0, 6, 17475, 71, 0 },
+  {137, 0, 0, 6, 17475, 71, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 138. dropping value of s */
-  {0, 0, 6, 17546, 39, 0 },
+  {138, 0, 0, 6, 17546, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 139. using composition for s */
-  {0, 0, 6, 17585, 75, 0 },
+  {139, 0, 0, 6, 17585, 75, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 140. modifying first byte of s */
-  {0, 0, 6, 17660, 71, 0 },
+  {140, 0, 0, 6, 17660, 71, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 141. modifying last byte of s */
-  {0, 0, 6, 17731, 71, 0 },
+  {141, 0, 0, 6, 17731, 71, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 142. truncated s */
-  {0, 0, 6, 17802, 70, 0 },
+  {142, 0, 0, 6, 17802, 70, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 31 },
   /* tcId: 143. truncated s */
-  {0, 0, 6, 17872, 70, 0 },
+  {143, 0, 0, 6, 17872, 70, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 31 },
   /* tcId: 144. s of size 4129 to check for overflows */
-  {0, 0, 6, 17942, 4172, 0 },
+  {144, 0, 0, 6, 17942, 4172, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 7, 32, 43, 4129 },
   /* tcId: 145. leading ff in s */
-  {0, 0, 6, 22114, 72, 0 },
+  {145, 0, 0, 6, 22114, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 33 },
   /* tcId: 146. replaced s by infinity */
-  {0, 0, 6, 22186, 40, 0 },
+  {146, 0, 0, 6, 22186, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 147. replacing s with zero */
-  {0, 0, 6, 22226, 40, 0 },
+  {147, 0, 0, 6, 22226, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 0 },
   /* tcId: 148. replaced r by r + n */
-  {0, 0, 6, 22266, 71, 0 },
+  {148, 0, 0, 6, 22266, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 149. replaced r by r - n */
-  {0, 0, 6, 22337, 70, 0 },
+  {149, 0, 0, 6, 22337, 70, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 32, 38, 32 },
   /* tcId: 150. replaced r by r + 256 * n */
-  {0, 0, 6, 22407, 72, 0 },
+  {150, 0, 0, 6, 22407, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 34, 40, 32 },
   /* tcId: 151. replaced r by -r */
-  {0, 0, 6, 22479, 71, 0 },
+  {151, 0, 0, 6, 22479, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 152. replaced r by n - r */
-  {0, 0, 6, 22550, 70, 0 },
+  {152, 0, 0, 6, 22550, 70, 0, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 153. replaced r by -n - r */
-  {0, 0, 6, 22620, 71, 0 },
+  {153, 0, 0, 6, 22620, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 154. replaced r by r + 2**256 */
-  {0, 0, 6, 22691, 71, 0 },
+  {154, 0, 0, 6, 22691, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 155. replaced r by r + 2**320 */
-  {0, 0, 6, 22762, 79, 0 },
+  {155, 0, 0, 6, 22762, 79, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 41, 47, 32 },
   /* tcId: 156. replaced s by s + n */
-  {0, 0, 6, 22841, 71, 0 },
+  {156, 0, 0, 6, 22841, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 157. replaced s by s - n */
-  {0, 0, 6, 22912, 71, 0 },
+  {157, 0, 0, 6, 22912, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 158. replaced s by s + 256 * n */
-  {0, 0, 6, 22983, 72, 0 },
+  {158, 0, 0, 6, 22983, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 34, 40, 32 },
   /* tcId: 159. replaced s by -s */
-  {0, 0, 6, 23055, 70, 0 },
+  {159, 0, 0, 6, 23055, 70, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 32, 38, 32 },
   /* tcId: 160. replaced s by -n - s */
-  {0, 0, 6, 23125, 71, 0 },
+  {160, 0, 0, 6, 23125, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 161. replaced s by s + 2**256 */
-  {0, 0, 6, 23196, 71, 0 },
+  {161, 0, 0, 6, 23196, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 162. replaced s by s - 2**256 */
-  {0, 0, 6, 23267, 71, 0 },
+  {162, 0, 0, 6, 23267, 71, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 33, 39, 32 },
   /* tcId: 163. replaced s by s + 2**320 */
-  {0, 0, 6, 23338, 79, 0 },
+  {163, 0, 0, 6, 23338, 79, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 41, 47, 32 },
   /* tcId: 164. Signature with special case values r=0 and s=0 */
-  {0, 0, 6, 23417, 8, 0 },
+  {164, 0, 0, 6, 23417, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 8, 0 },
   /* tcId: 165. Signature with special case values r=0 and s=1 */
-  {0, 0, 6, 23425, 8, 0 },
+  {165, 0, 0, 6, 23425, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 7, 1 },
   /* tcId: 166. Signature with special case values r=0 and s=-1 */
-  {0, 0, 6, 23433, 8, 0 },
+  {166, 0, 0, 6, 23433, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 7, 1 },
   /* tcId: 167. Signature with special case values r=0 and s=n */
-  {0, 0, 6, 23441, 40, 0 },
+  {167, 0, 0, 6, 23441, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 8, 32 },
   /* tcId: 168. Signature with special case values r=0 and s=n - 1 */
-  {0, 0, 6, 23481, 40, 0 },
+  {168, 0, 0, 6, 23481, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 8, 32 },
   /* tcId: 169. Signature with special case values r=0 and s=n + 1 */
-  {0, 0, 6, 23521, 40, 0 },
+  {169, 0, 0, 6, 23521, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 8, 32 },
   /* tcId: 170. Signature with special case values r=0 and s=p */
-  {0, 0, 6, 23561, 40, 0 },
+  {170, 0, 0, 6, 23561, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 8, 32 },
   /* tcId: 171. Signature with special case values r=0 and s=p + 1 */
-  {0, 0, 6, 23601, 40, 0 },
+  {171, 0, 0, 6, 23601, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 0, 8, 32 },
   /* tcId: 172. Signature with special case values r=1 and s=0 */
-  {0, 0, 6, 23641, 8, 0 },
+  {172, 0, 0, 6, 23641, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 0 },
   /* tcId: 173. Signature with special case values r=1 and s=1 */
-  {0, 0, 6, 23649, 8, 0 },
+  {173, 0, 0, 6, 23649, 8, 0, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 174. Signature with special case values r=1 and s=-1 */
-  {0, 0, 6, 23657, 8, 0 },
+  {174, 0, 0, 6, 23657, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 7, 1 },
   /* tcId: 175. Signature with special case values r=1 and s=n */
-  {0, 0, 6, 23665, 40, 0 },
+  {175, 0, 0, 6, 23665, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 176. Signature with special case values r=1 and s=n - 1 */
-  {0, 0, 6, 23705, 40, 0 },
+  {176, 0, 0, 6, 23705, 40, 0, WYCHEPROOF_DER_HIGH_S, 4, 1, 8, 32 },
   /* tcId: 177. Signature with special case values r=1 and s=n + 1 */
-  {0, 0, 6, 23745, 40, 0 },
+  {177, 0, 0, 6, 23745, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 178. Signature with special case values r=1 and s=p */
-  {0, 0, 6, 23785, 40, 0 },
+  {178, 0, 0, 6, 23785, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 179. Signature with special case values r=1 and s=p + 1 */
-  {0, 0, 6, 23825, 40, 0 },
+  {179, 0, 0, 6, 23825, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 180. Signature with special case values r=-1 and s=0 */
-  {0, 0, 6, 23865, 8, 0 },
+  {180, 0, 0, 6, 23865, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 0 },
   /* tcId: 181. Signature with special case values r=-1 and s=1 */
-  {0, 0, 6, 23873, 8, 0 },
+  {181, 0, 0, 6, 23873, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 7, 1 },
   /* tcId: 182. Signature with special case values r=-1 and s=-1 */
-  {0, 0, 6, 23881, 8, 0 },
+  {182, 0, 0, 6, 23881, 8, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 7, 1 },
   /* tcId: 183. Signature with special case values r=-1 and s=n */
-  {0, 0, 6, 23889, 40, 0 },
+  {183, 0, 0, 6, 23889, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 184. Signature with special case values r=-1 and s=n - 1 */
-  {0, 0, 6, 23929, 40, 0 },
+  {184, 0, 0, 6, 23929, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 185. Signature with special case values r=-1 and s=n + 1 */
-  {0, 0, 6, 23969, 40, 0 },
+  {185, 0, 0, 6, 23969, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 186. Signature with special case values r=-1 and s=p */
-  {0, 0, 6, 24009, 40, 0 },
+  {186, 0, 0, 6, 24009, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 187. Signature with special case values r=-1 and s=p + 1 */
-  {0, 0, 6, 24049, 40, 0 },
+  {187, 0, 0, 6, 24049, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 8, 32 },
   /* tcId: 188. Signature with special case values r=n and s=0 */
-  {0, 0, 6, 24089, 40, 0 },
+  {188, 0, 0, 6, 24089, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 0 },
   /* tcId: 189. Signature with special case values r=n and s=1 */
-  {0, 0, 6, 24129, 40, 0 },
+  {189, 0, 0, 6, 24129, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 190. Signature with special case values r=n and s=-1 */
-  {0, 0, 6, 24169, 40, 0 },
+  {190, 0, 0, 6, 24169, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 191. Signature with special case values r=n and s=n */
-  {0, 0, 6, 24209, 72, 0 },
+  {191, 0, 0, 6, 24209, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 192. Signature with special case values r=n and s=n - 1 */
-  {0, 0, 6, 24281, 72, 0 },
+  {192, 0, 0, 6, 24281, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 193. Signature with special case values r=n and s=n + 1 */
-  {0, 0, 6, 24353, 72, 0 },
+  {193, 0, 0, 6, 24353, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 194. Signature with special case values r=n and s=p */
-  {0, 0, 6, 24425, 72, 0 },
+  {194, 0, 0, 6, 24425, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 195. Signature with special case values r=n and s=p + 1 */
-  {0, 0, 6, 24497, 72, 0 },
+  {195, 0, 0, 6, 24497, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 196. Signature with special case values r=n - 1 and s=0 */
-  {0, 0, 6, 24569, 40, 0 },
+  {196, 0, 0, 6, 24569, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 0 },
   /* tcId: 197. Signature with special case values r=n - 1 and s=1 */
-  {0, 0, 6, 24609, 40, 0 },
+  {197, 0, 0, 6, 24609, 40, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 1 },
   /* tcId: 198. Signature with special case values r=n - 1 and s=-1 */
-  {0, 0, 6, 24649, 40, 0 },
+  {198, 0, 0, 6, 24649, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 199. Signature with special case values r=n - 1 and s=n */
-  {0, 0, 6, 24689, 72, 0 },
+  {199, 0, 0, 6, 24689, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 200. Signature with special case values r=n - 1 and s=n - 1 */
-  {0, 0, 6, 24761, 72, 0 },
+  {200, 0, 0, 6, 24761, 72, 0, WYCHEPROOF_DER_HIGH_S, 5, 32, 40, 32 },
   /* tcId: 201. Signature with special case values r=n - 1 and s=n + 1 */
-  {0, 0, 6, 24833, 72, 0 },
+  {201, 0, 0, 6, 24833, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 202. Signature with special case values r=n - 1 and s=p */
-  {0, 0, 6, 24905, 72, 0 },
+  {202, 0, 0, 6, 24905, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 203. Signature with special case values r=n - 1 and s=p + 1 */
-  {0, 0, 6, 24977, 72, 0 },
+  {203, 0, 0, 6, 24977, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 204. Signature with special case values r=n + 1 and s=0 */
-  {0, 0, 6, 25049, 40, 0 },
+  {204, 0, 0, 6, 25049, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 0 },
   /* tcId: 205. Signature with special case values r=n + 1 and s=1 */
-  {0, 0, 6, 25089, 40, 0 },
+  {205, 0, 0, 6, 25089, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 206. Signature with special case values r=n + 1 and s=-1 */
-  {0, 0, 6, 25129, 40, 0 },
+  {206, 0, 0, 6, 25129, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 207. Signature with special case values r=n + 1 and s=n */
-  {0, 0, 6, 25169, 72, 0 },
+  {207, 0, 0, 6, 25169, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 208. Signature with special case values r=n + 1 and s=n - 1 */
-  {0, 0, 6, 25241, 72, 0 },
+  {208, 0, 0, 6, 25241, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 209. Signature with special case values r=n + 1 and s=n + 1 */
-  {0, 0, 6, 25313, 72, 0 },
+  {209, 0, 0, 6, 25313, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 210. Signature with special case values r=n + 1 and s=p */
-  {0, 0, 6, 25385, 72, 0 },
+  {210, 0, 0, 6, 25385, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 211. Signature with special case values r=n + 1 and s=p + 1 */
-  {0, 0, 6, 25457, 72, 0 },
+  {211, 0, 0, 6, 25457, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 212. Signature with special case values r=p and s=0 */
-  {0, 0, 6, 25529, 40, 0 },
+  {212, 0, 0, 6, 25529, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 0 },
   /* tcId: 213. Signature with special case values r=p and s=1 */
-  {0, 0, 6, 25569, 40, 0 },
+  {213, 0, 0, 6, 25569, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 214. Signature with special case values r=p and s=-1 */
-  {0, 0, 6, 25609, 40, 0 },
+  {214, 0, 0, 6, 25609, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 215. Signature with special case values r=p and s=n */
-  {0, 0, 6, 25649, 72, 0 },
+  {215, 0, 0, 6, 25649, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 216. Signature with special case values r=p and s=n - 1 */
-  {0, 0, 6, 25721, 72, 0 },
+  {216, 0, 0, 6, 25721, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 217. Signature with special case values r=p and s=n + 1 */
-  {0, 0, 6, 25793, 72, 0 },
+  {217, 0, 0, 6, 25793, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 218. Signature with special case values r=p and s=p */
-  {0, 0, 6, 25865, 72, 0 },
+  {218, 0, 0, 6, 25865, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 219. Signature with special case values r=p and s=p + 1 */
-  {0, 0, 6, 25937, 72, 0 },
+  {219, 0, 0, 6, 25937, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 220. Signature with special case values r=p + 1 and s=0 */
-  {0, 0, 6, 26009, 40, 0 },
+  {220, 0, 0, 6, 26009, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 0 },
   /* tcId: 221. Signature with special case values r=p + 1 and s=1 */
-  {0, 0, 6, 26049, 40, 0 },
+  {221, 0, 0, 6, 26049, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 222. Signature with special case values r=p + 1 and s=-1 */
-  {0, 0, 6, 26089, 40, 0 },
+  {222, 0, 0, 6, 26089, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 223. Signature with special case values r=p + 1 and s=n */
-  {0, 0, 6, 26129, 72, 0 },
+  {223, 0, 0, 6, 26129, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 224. Signature with special case values r=p + 1 and s=n - 1 */
-  {0, 0, 6, 26201, 72, 0 },
+  {224, 0, 0, 6, 26201, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 225. Signature with special case values r=p + 1 and s=n + 1 */
-  {0, 0, 6, 26273, 72, 0 },
+  {225, 0, 0, 6, 26273, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 226. Signature with special case values r=p + 1 and s=p */
-  {0, 0, 6, 26345, 72, 0 },
+  {226, 0, 0, 6, 26345, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 227. Signature with special case values r=p + 1 and s=p + 1 */
-  {0, 0, 6, 26417, 72, 0 },
+  {227, 0, 0, 6, 26417, 72, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 40, 32 },
   /* tcId: 228. Signature encoding contains incorrect types: r=0, s=0.25 */
-  {0, 0, 6, 26489, 10, 0 },
+  {228, 0, 0, 6, 26489, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 229. Signature encoding contains incorrect types: r=0, s=nan */
-  {0, 0, 6, 26499, 8, 0 },
+  {229, 0, 0, 6, 26499, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 230. Signature encoding contains incorrect types: r=0, s=True */
-  {0, 0, 6, 26507, 8, 0 },
+  {230, 0, 0, 6, 26507, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 231. Signature encoding contains incorrect types: r=0, s=False */
-  {0, 0, 6, 26515, 8, 0 },
+  {231, 0, 0, 6, 26515, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 232. Signature encoding contains incorrect types: r=0, s=Null */
-  {0, 0, 6, 26523, 7, 0 },
+  {232, 0, 0, 6, 26523, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 233. Signature encoding contains incorrect types: r=0, s=empyt UTF-8 string */
-  {0, 0, 6, 26530, 7, 0 },
+  {233, 0, 0, 6, 26530, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 234. Signature encoding contains incorrect types: r=0, s="0" */
-  {0, 0, 6, 26537, 8, 0 },
+  {234, 0, 0, 6, 26537, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 235. Signature encoding contains incorrect types: r=0, s=empty list */
-  {0, 0, 6, 26545, 7, 0 },
+  {235, 0, 0, 6, 26545, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 236. Signature encoding contains incorrect types: r=0, s=list containing 0 */
-  {0, 0, 6, 26552, 10, 0 },
+  {236, 0, 0, 6, 26552, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 237. Signature encoding contains incorrect types: r=1, s=0.25 */
-  {0, 0, 6, 26562, 10, 0 },
+  {237, 0, 0, 6, 26562, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 238. Signature encoding contains incorrect types: r=1, s=nan */
-  {0, 0, 6, 26572, 8, 0 },
+  {238, 0, 0, 6, 26572, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 239. Signature encoding contains incorrect types: r=1, s=True */
-  {0, 0, 6, 26580, 8, 0 },
+  {239, 0, 0, 6, 26580, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 240. Signature encoding contains incorrect types: r=1, s=False */
-  {0, 0, 6, 26588, 8, 0 },
+  {240, 0, 0, 6, 26588, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 241. Signature encoding contains incorrect types: r=1, s=Null */
-  {0, 0, 6, 26596, 7, 0 },
+  {241, 0, 0, 6, 26596, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 242. Signature encoding contains incorrect types: r=1, s=empyt UTF-8 string */
-  {0, 0, 6, 26603, 7, 0 },
+  {242, 0, 0, 6, 26603, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 243. Signature encoding contains incorrect types: r=1, s="0" */
-  {0, 0, 6, 26610, 8, 0 },
+  {243, 0, 0, 6, 26610, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 244. Signature encoding contains incorrect types: r=1, s=empty list */
-  {0, 0, 6, 26618, 7, 0 },
+  {244, 0, 0, 6, 26618, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 245. Signature encoding contains incorrect types: r=1, s=list containing 0 */
-  {0, 0, 6, 26625, 10, 0 },
+  {245, 0, 0, 6, 26625, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 246. Signature encoding contains incorrect types: r=-1, s=0.25 */
-  {0, 0, 6, 26635, 10, 0 },
+  {246, 0, 0, 6, 26635, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 247. Signature encoding contains incorrect types: r=-1, s=nan */
-  {0, 0, 6, 26645, 8, 0 },
+  {247, 0, 0, 6, 26645, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 248. Signature encoding contains incorrect types: r=-1, s=True */
-  {0, 0, 6, 26653, 8, 0 },
+  {248, 0, 0, 6, 26653, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 249. Signature encoding contains incorrect types: r=-1, s=False */
-  {0, 0, 6, 26661, 8, 0 },
+  {249, 0, 0, 6, 26661, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 250. Signature encoding contains incorrect types: r=-1, s=Null */
-  {0, 0, 6, 26669, 7, 0 },
+  {250, 0, 0, 6, 26669, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 251. Signature encoding contains incorrect types: r=-1, s=empyt UTF-8 string */
-  {0, 0, 6, 26676, 7, 0 },
+  {251, 0, 0, 6, 26676, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 252. Signature encoding contains incorrect types: r=-1, s="0" */
-  {0, 0, 6, 26683, 8, 0 },
+  {252, 0, 0, 6, 26683, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 253. Signature encoding contains incorrect types: r=-1, s=empty list */
-  {0, 0, 6, 26691, 7, 0 },
+  {253, 0, 0, 6, 26691, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 254. Signature encoding contains incorrect types: r=-1, s=list containing 0 */
-  {0, 0, 6, 26698, 10, 0 },
+  {254, 0, 0, 6, 26698, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 255. Signature encoding contains incorrect types: r=n, s=0.25 */
-  {0, 0, 6, 26708, 42, 0 },
+  {255, 0, 0, 6, 26708, 42, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 256. Signature encoding contains incorrect types: r=n, s=nan */
-  {0, 0, 6, 26750, 40, 0 },
+  {256, 0, 0, 6, 26750, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 257. Signature encoding contains incorrect types: r=n, s=True */
-  {0, 0, 6, 26790, 40, 0 },
+  {257, 0, 0, 6, 26790, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 258. Signature encoding contains incorrect types: r=n, s=False */
-  {0, 0, 6, 26830, 40, 0 },
+  {258, 0, 0, 6, 26830, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 259. Signature encoding contains incorrect types: r=n, s=Null */
-  {0, 0, 6, 26870, 39, 0 },
+  {259, 0, 0, 6, 26870, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 260. Signature encoding contains incorrect types: r=n, s=empyt UTF-8 string */
-  {0, 0, 6, 26909, 39, 0 },
+  {260, 0, 0, 6, 26909, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 261. Signature encoding contains incorrect types: r=n, s="0" */
-  {0, 0, 6, 26948, 40, 0 },
+  {261, 0, 0, 6, 26948, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 262. Signature encoding contains incorrect types: r=n, s=empty list */
-  {0, 0, 6, 26988, 39, 0 },
+  {262, 0, 0, 6, 26988, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 263. Signature encoding contains incorrect types: r=n, s=list containing 0 */
-  {0, 0, 6, 27027, 42, 0 },
+  {263, 0, 0, 6, 27027, 42, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 264. Signature encoding contains incorrect types: r=p, s=0.25 */
-  {0, 0, 6, 27069, 42, 0 },
+  {264, 0, 0, 6, 27069, 42, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 265. Signature encoding contains incorrect types: r=p, s=nan */
-  {0, 0, 6, 27111, 40, 0 },
+  {265, 0, 0, 6, 27111, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 266. Signature encoding contains incorrect types: r=p, s=True */
-  {0, 0, 6, 27151, 40, 0 },
+  {266, 0, 0, 6, 27151, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 267. Signature encoding contains incorrect types: r=p, s=False */
-  {0, 0, 6, 27191, 40, 0 },
+  {267, 0, 0, 6, 27191, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 268. Signature encoding contains incorrect types: r=p, s=Null */
-  {0, 0, 6, 27231, 39, 0 },
+  {268, 0, 0, 6, 27231, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 269. Signature encoding contains incorrect types: r=p, s=empyt UTF-8 string */
-  {0, 0, 6, 27270, 39, 0 },
+  {269, 0, 0, 6, 27270, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 270. Signature encoding contains incorrect types: r=p, s="0" */
-  {0, 0, 6, 27309, 40, 0 },
+  {270, 0, 0, 6, 27309, 40, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 271. Signature encoding contains incorrect types: r=p, s=empty list */
-  {0, 0, 6, 27349, 39, 0 },
+  {271, 0, 0, 6, 27349, 39, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 272. Signature encoding contains incorrect types: r=p, s=list containing 0 */
-  {0, 0, 6, 27388, 42, 0 },
+  {272, 0, 0, 6, 27388, 42, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 273. Signature encoding contains incorrect types: r=0.25, s=0.25 */
-  {0, 0, 6, 27430, 12, 0 },
+  {273, 0, 0, 6, 27430, 12, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 274. Signature encoding contains incorrect types: r=nan, s=nan */
-  {0, 0, 6, 27442, 8, 0 },
+  {274, 0, 0, 6, 27442, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 275. Signature encoding contains incorrect types: r=True, s=True */
-  {0, 0, 6, 27450, 8, 0 },
+  {275, 0, 0, 6, 27450, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 276. Signature encoding contains incorrect types: r=False, s=False */
-  {0, 0, 6, 27458, 8, 0 },
+  {276, 0, 0, 6, 27458, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 277. Signature encoding contains incorrect types: r=Null, s=Null */
-  {0, 0, 6, 27466, 6, 0 },
+  {277, 0, 0, 6, 27466, 6, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 278. Signature encoding contains incorrect types: r=empyt UTF-8 string, s=empyt UTF-8 string */
-  {0, 0, 6, 27472, 6, 0 },
+  {278, 0, 0, 6, 27472, 6, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 279. Signature encoding contains incorrect types: r="0", s="0" */
-  {0, 0, 6, 27478, 8, 0 },
+  {279, 0, 0, 6, 27478, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 280. Signature encoding contains incorrect types: r=empty list, s=empty list */
-  {0, 0, 6, 27486, 6, 0 },
+  {280, 0, 0, 6, 27486, 6, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 281. Signature encoding contains incorrect types: r=list containing 0, s=list containing 0 */
-  {0, 0, 6, 27492, 12, 0 },
+  {281, 0, 0, 6, 27492, 12, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 282. Signature encoding contains incorrect types: r=0.25, s=0 */
-  {0, 0, 6, 27504, 10, 0 },
+  {282, 0, 0, 6, 27504, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 283. Signature encoding contains incorrect types: r=nan, s=0 */
-  {0, 0, 6, 27514, 8, 0 },
+  {283, 0, 0, 6, 27514, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 284. Signature encoding contains incorrect types: r=True, s=0 */
-  {0, 0, 6, 27522, 8, 0 },
+  {284, 0, 0, 6, 27522, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 285. Signature encoding contains incorrect types: r=False, s=0 */
-  {0, 0, 6, 27530, 8, 0 },
+  {285, 0, 0, 6, 27530, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 286. Signature encoding contains incorrect types: r=Null, s=0 */
-  {0, 0, 6, 27538, 7, 0 },
+  {286, 0, 0, 6, 27538, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 287. Signature encoding contains incorrect types: r=empyt UTF-8 string, s=0 */
-  {0, 0, 6, 27545, 7, 0 },
+  {287, 0, 0, 6, 27545, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 288. Signature encoding contains incorrect types: r="0", s=0 */
-  {0, 0, 6, 27552, 8, 0 },
+  {288, 0, 0, 6, 27552, 8, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 289. Signature encoding contains incorrect types: r=empty list, s=0 */
-  {0, 0, 6, 27560, 7, 0 },
+  {289, 0, 0, 6, 27560, 7, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 290. Signature encoding contains incorrect types: r=list containing 0, s=0 */
-  {0, 0, 6, 27567, 10, 0 },
+  {290, 0, 0, 6, 27567, 10, 0, WYCHEPROOF_DER_INVALID, 0, 0, 0, 0 },
   /* tcId: 291. Edge case for Shamir multiplication */
-  {0, 6, 5, 27577, 71, 1 },
+  {291, 0, 6, 5, 27577, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 292. special case hash */
-  {0, 11, 9, 27648, 71, 1 },
+  {292, 0, 11, 9, 27648, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 293. special case hash */
-  {0, 20, 10, 27719, 70, 1 },
+  {293, 0, 20, 10, 27719, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 294. special case hash */
-  {0, 30, 11, 27789, 71, 1 },
+  {294, 0, 30, 11, 27789, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 295. special case hash */
-  {0, 41, 10, 27860, 71, 1 },
+  {295, 0, 41, 10, 27860, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 296. special case hash */
-  {0, 51, 10, 27931, 70, 1 },
+  {296, 0, 51, 10, 27931, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 297. special case hash */
-  {0, 61, 10, 28001, 71, 1 },
+  {297, 0, 61, 10, 28001, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 298. special case hash */
-  {0, 71, 9, 28072, 70, 1 },
+  {298, 0, 71, 9, 28072, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 299. special case hash */
-  {0, 80, 10, 28142, 71, 1 },
+  {299, 0, 80, 10, 28142, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 300. special case hash */
-  {0, 90, 10, 28213, 71, 1 },
+  {300, 0, 90, 10, 28213, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 301. special case hash */
-  {0, 100, 10, 28284, 71, 1 },
+  {301, 0, 100, 10, 28284, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 302. special case hash */
-  {0, 110, 10, 28355, 71, 1 },
+  {302, 0, 110, 10, 28355, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 303. special case hash */
-  {0, 120, 11, 28426, 70, 1 },
+  {303, 0, 120, 11, 28426, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 304. special case hash */
-  {0, 131, 10, 28496, 71, 1 },
+  {304, 0, 131, 10, 28496, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 305. special case hash */
-  {0, 141, 10, 28567, 71, 1 },
+  {305, 0, 141, 10, 28567, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 306. special case hash */
-  {0, 151, 10, 28638, 70, 1 },
+  {306, 0, 151, 10, 28638, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 307. special case hash */
-  {0, 161, 10, 28708, 71, 1 },
+  {307, 0, 161, 10, 28708, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 308. special case hash */
-  {0, 171, 10, 28779, 71, 1 },
+  {308, 0, 171, 10, 28779, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 309. special case hash */
-  {0, 181, 10, 28850, 70, 1 },
+  {309, 0, 181, 10, 28850, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 310. special case hash */
-  {0, 191, 10, 28920, 71, 1 },
+  {310, 0, 191, 10, 28920, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 311. special case hash */
-  {0, 201, 10, 28991, 71, 1 },
+  {311, 0, 201, 10, 28991, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 312. special case hash */
-  {0, 211, 10, 29062, 71, 1 },
+  {312, 0, 211, 10, 29062, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 313. special case hash */
-  {0, 221, 10, 29133, 70, 1 },
+  {313, 0, 221, 10, 29133, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 314. special case hash */
-  {0, 231, 10, 29203, 71, 1 },
+  {314, 0, 231, 10, 29203, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 315. special case hash */
-  {0, 241, 10, 29274, 71, 1 },
+  {315, 0, 241, 10, 29274, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 316. special case hash */
-  {0, 251, 10, 29345, 71, 1 },
+  {316, 0, 251, 10, 29345, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 317. special case hash */
-  {0, 261, 11, 29416, 71, 1 },
+  {317, 0, 261, 11, 29416, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 318. special case hash */
-  {0, 272, 11, 29487, 70, 1 },
+  {318, 0, 272, 11, 29487, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 319. special case hash */
-  {0, 283, 9, 29557, 71, 1 },
+  {319, 0, 283, 9, 29557, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 320. special case hash */
-  {0, 292, 9, 29628, 71, 1 },
+  {320, 0, 292, 9, 29628, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 321. special case hash */
-  {0, 301, 10, 29699, 71, 1 },
+  {321, 0, 301, 10, 29699, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 322. special case hash */
-  {0, 311, 10, 29770, 71, 1 },
+  {322, 0, 311, 10, 29770, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 323. special case hash */
-  {0, 321, 10, 29841, 70, 1 },
+  {323, 0, 321, 10, 29841, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 324. special case hash */
-  {0, 331, 10, 29911, 70, 1 },
+  {324, 0, 331, 10, 29911, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 325. special case hash */
-  {0, 341, 10, 29981, 71, 1 },
+  {325, 0, 341, 10, 29981, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 326. special case hash */
-  {0, 351, 9, 30052, 70, 1 },
+  {326, 0, 351, 9, 30052, 70, 1, WYCHEPROOF_DER_VALID, 5, 31, 38, 32 },
   /* tcId: 327. special case hash */
-  {0, 360, 10, 30122, 70, 1 },
+  {327, 0, 360, 10, 30122, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 328. special case hash */
-  {0, 370, 10, 30192, 70, 1 },
+  {328, 0, 370, 10, 30192, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 329. special case hash */
-  {0, 380, 10, 30262, 70, 1 },
+  {329, 0, 380, 10, 30262, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 330. special case hash */
-  {0, 390, 9, 30332, 71, 1 },
+  {330, 0, 390, 9, 30332, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 331. special case hash */
-  {0, 399, 11, 30403, 70, 1 },
+  {331, 0, 399, 11, 30403, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 332. special case hash */
-  {0, 410, 9, 30473, 71, 1 },
+  {332, 0, 410, 9, 30473, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 333. special case hash */
-  {0, 419, 9, 30544, 71, 1 },
+  {333, 0, 419, 9, 30544, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 334. special case hash */
-  {0, 428, 11, 30615, 70, 1 },
+  {334, 0, 428, 11, 30615, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 335. special case hash */
-  {0, 439, 8, 30685, 71, 1 },
+  {335, 0, 439, 8, 30685, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 336. special case hash */
-  {0, 447, 10, 30756, 70, 1 },
+  {336, 0, 447, 10, 30756, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 337. special case hash */
-  {0, 457, 10, 30826, 71, 1 },
+  {337, 0, 457, 10, 30826, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 338. special case hash */
-  {0, 467, 10, 30897, 70, 1 },
+  {338, 0, 467, 10, 30897, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 339. special case hash */
-  {0, 477, 10, 30967, 70, 1 },
+  {339, 0, 477, 10, 30967, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 340. special case hash */
-  {0, 487, 10, 31037, 70, 1 },
+  {340, 0, 487, 10, 31037, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 341. special case hash */
-  {0, 497, 10, 31107, 71, 1 },
+  {341, 0, 497, 10, 31107, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 342. special case hash */
-  {0, 507, 10, 31178, 70, 1 },
+  {342, 0, 507, 10, 31178, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 343. special case hash */
-  {0, 517, 10, 31248, 70, 1 },
+  {343, 0, 517, 10, 31248, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 344. special case hash */
-  {0, 527, 10, 31318, 71, 1 },
+  {344, 0, 527, 10, 31318, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 345. special case hash */
-  {0, 537, 9, 31389, 70, 1 },
+  {345, 0, 537, 9, 31389, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 346. k*G has a large x-coordinate */
-  {65, 0, 6, 31459, 24, 1 },
+  {346, 65, 0, 6, 31459, 24, 1, WYCHEPROOF_DER_VALID, 4, 17, 23, 1 },
   /* tcId: 347. r too large */
-  {65, 0, 6, 31483, 40, 0 },
+  {347, 65, 0, 6, 31483, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 348. r,s are large */
-  {130, 0, 6, 31523, 40, 1 },
+  {348, 130, 0, 6, 31523, 40, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 1 },
   /* tcId: 349. r and s^-1 have a large Hamming weight */
-  {195, 0, 6, 31563, 70, 1 },
+  {349, 195, 0, 6, 31563, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 350. r and s^-1 have a large Hamming weight */
-  {260, 0, 6, 31633, 70, 1 },
+  {350, 260, 0, 6, 31633, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 351. small r and s */
-  {325, 0, 6, 31703, 8, 1 },
+  {351, 325, 0, 6, 31703, 8, 1, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 352. small r and s */
-  {390, 0, 6, 31711, 8, 1 },
+  {352, 390, 0, 6, 31711, 8, 1, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 353. small r and s */
-  {455, 0, 6, 31719, 8, 1 },
+  {353, 455, 0, 6, 31719, 8, 1, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 354. small r and s */
-  {520, 0, 6, 31727, 8, 1 },
+  {354, 520, 0, 6, 31727, 8, 1, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 355. small r and s */
-  {585, 0, 6, 31735, 8, 1 },
+  {355, 585, 0, 6, 31735, 8, 1, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 356. small r and s */
-  {650, 0, 6, 31743, 8, 1 },
+  {356, 650, 0, 6, 31743, 8, 1, WYCHEPROOF_DER_VALID, 4, 1, 7, 1 },
   /* tcId: 357. r is larger than n */
-  {650, 0, 6, 31751, 40, 0 },
+  {357, 650, 0, 6, 31751, 40, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 5, 32, 39, 1 },
   /* tcId: 358. s is larger than n */
-  {715, 0, 6, 31791, 10, 0 },
+  {358, 715, 0, 6, 31791, 10, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 1, 7, 3 },
   /* tcId: 359. small r and s^-1 */
-  {780, 0, 6, 31801, 40, 1 },
+  {359, 780, 0, 6, 31801, 40, 1, WYCHEPROOF_DER_VALID, 4, 2, 8, 32 },
   /* tcId: 360. smallish r and s^-1 */
-  {845, 0, 6, 31841, 45, 1 },
+  {360, 845, 0, 6, 31841, 45, 1, WYCHEPROOF_DER_VALID, 4, 7, 13, 32 },
   /* tcId: 361. 100-bit r and small s^-1 */
-  {910, 0, 6, 31886, 51, 1 },
+  {361, 910, 0, 6, 31886, 51, 1, WYCHEPROOF_DER_VALID, 4, 13, 19, 32 },
   /* tcId: 362. small r and 100 bit s^-1 */
-  {975, 0, 6, 31937, 40, 1 },
+  {362, 975, 0, 6, 31937, 40, 1, WYCHEPROOF_DER_VALID, 4, 2, 8, 32 },
   /* tcId: 363. 100-bit r and s^-1 */
-  {1040, 0, 6, 31977, 51, 1 },
+  {363, 1040, 0, 6, 31977, 51, 1, WYCHEPROOF_DER_VALID, 4, 13, 19, 32 },
   /* tcId: 364. r and s^-1 are close to n */
-  {1105, 0, 6, 32028, 71, 1 },
+  {364, 1105, 0, 6, 32028, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 365. r and s are 64-bit integer */
-  {1170, 0, 6, 32099, 24, 1 },
+  {365, 1170, 0, 6, 32099, 24, 1, WYCHEPROOF_DER_VALID, 5, 8, 16, 8 },
   /* tcId: 366. r and s are 100-bit integer */
-  {1235, 0, 6, 32123, 32, 1 },
+  {366, 1235, 0, 6, 32123, 32, 1, WYCHEPROOF_DER_VALID, 4, 13, 19, 13 },
   /* tcId: 367. r and s are 128-bit integer */
-  {1300, 0, 6, 32155, 40, 1 },
+  {367, 1300, 0, 6, 32155, 40, 1, WYCHEPROOF_DER_VALID, 5, 16, 24, 16 },
   /* tcId: 368. r and s are 160-bit integer */
-  {1365, 0, 6, 32195, 48, 1 },
+  {368, 1365, 0, 6, 32195, 48, 1, WYCHEPROOF_DER_VALID, 5, 20, 28, 20 },
   /* tcId: 369. s == 1 */
-  {1430, 0, 6, 32243, 39, 1 },
+  {369, 1430, 0, 6, 32243, 39, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 1 },
   /* tcId: 370. s == 0 */
-  {1430, 0, 6, 32282, 39, 0 },
+  {370, 1430, 0, 6, 32282, 39, 0, WYCHEPROOF_DER_OUT_OF_RANGE, 4, 32, 39, 0 },
   /* tcId: 371. edge case modular inverse */
-  {1495, 0, 6, 32321, 70, 1 },
+  {371, 1495, 0, 6, 32321, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 372. edge case modular inverse */
-  {1560, 0, 6, 32391, 70, 1 },
+  {372, 1560, 0, 6, 32391, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 373. edge case modular inverse */
-  {1625, 0, 6, 32461, 70, 1 },
+  {373, 1625, 0, 6, 32461, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 374. edge case modular inverse */
-  {1690, 0, 6, 32531, 70, 1 },
+  {374, 1690, 0, 6, 32531, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 375. edge case modular inverse */
-  {1755, 0, 6, 32601, 70, 1 },
+  {375, 1755, 0, 6, 32601, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 376. edge case modular inverse */
-  {1820, 0, 6, 32671, 70, 1 },
+  {376, 1820, 0, 6, 32671, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 377. edge case modular inverse */
-  {1885, 0, 6, 32741, 70, 1 },
+  {377, 1885, 0, 6, 32741, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 378. edge case modular inverse */
-  {1950, 0, 6, 32811, 70, 1 },
+  {378, 1950, 0, 6, 32811, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 379. edge case modular inverse */
-  {2015, 0, 6, 32881, 70, 1 },
+  {379, 2015, 0, 6, 32881, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 380. edge case modular inverse */
-  {2080, 0, 6, 32951, 70, 1 },
+  {380, 2080, 0, 6, 32951, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 381. edge case modular inverse */
-  {2145, 0, 6, 33021, 70, 1 },
+  {381, 2145, 0, 6, 33021, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 382. edge case modular inverse */
-  {2210, 0, 6, 33091, 70, 1 },
+  {382, 2210, 0, 6, 33091, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 383. edge case modular inverse */
-  {2275, 0, 6, 33161, 70, 1 },
+  {383, 2275, 0, 6, 33161, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 384. edge case modular inverse */
-  {2340, 0, 6, 33231, 70, 1 },
+  {384, 2340, 0, 6, 33231, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 385. edge case modular inverse */
-  {2405, 0, 6, 33301, 70, 1 },
+  {385, 2405, 0, 6, 33301, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 386. point at infinity during verify */
-  {2470, 0, 6, 33371, 70, 0 },
+  {386, 2470, 0, 6, 33371, 70, 0, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 387. edge case for signature malleability */
-  {2535, 0, 6, 33441, 70, 1 },
+  {387, 2535, 0, 6, 33441, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 388. edge case for signature malleability */
-  {2600, 0, 6, 33511, 70, 0 },
+  {388, 2600, 0, 6, 33511, 70, 0, WYCHEPROOF_DER_HIGH_S, 4, 32, 38, 32 },
   /* tcId: 389. u1 == 1 */
-  {2665, 0, 6, 33581, 70, 1 },
+  {389, 2665, 0, 6, 33581, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 390. u1 == n - 1 */
-  {2730, 0, 6, 33651, 70, 1 },
+  {390, 2730, 0, 6, 33651, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 391. u2 == 1 */
-  {2795, 0, 6, 33721, 70, 1 },
+  {391, 2795, 0, 6, 33721, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 392. u2 == n - 1 */
-  {2860, 0, 6, 33791, 70, 1 },
+  {392, 2860, 0, 6, 33791, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 393. edge case for u1 */
-  {2925, 0, 6, 33861, 70, 1 },
+  {393, 2925, 0, 6, 33861, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 394. edge case for u1 */
-  {2990, 0, 6, 33931, 70, 1 },
+  {394, 2990, 0, 6, 33931, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 395. edge case for u1 */
-  {3055, 0, 6, 34001, 70, 1 },
+  {395, 3055, 0, 6, 34001, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 396. edge case for u1 */
-  {3120, 0, 6, 34071, 70, 1 },
+  {396, 3120, 0, 6, 34071, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 397. edge case for u1 */
-  {3185, 0, 6, 34141, 70, 1 },
+  {397, 3185, 0, 6, 34141, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 398. edge case for u1 */
-  {3250, 0, 6, 34211, 70, 1 },
+  {398, 3250, 0, 6, 34211, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 399. edge case for u1 */
-  {3315, 0, 6, 34281, 70, 1 },
+  {399, 3315, 0, 6, 34281, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 400. edge case for u1 */
-  {3380, 0, 6, 34351, 70, 1 },
+  {400, 3380, 0, 6, 34351, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 401. edge case for u1 */
-  {3445, 0, 6, 34421, 70, 1 },
+  {401, 3445, 0, 6, 34421, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 402. edge case for u1 */
-  {3510, 0, 6, 34491, 70, 1 },
+  {402, 3510, 0, 6, 34491, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 403. edge case for u1 */
-  {3575, 0, 6, 34561, 70, 1 },
+  {403, 3575, 0, 6, 34561, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 404. edge case for u1 */
-  {3640, 0, 6, 34631, 70, 1 },
+  {404, 3640, 0, 6, 34631, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 405. edge case for u1 */
-  {3705, 0, 6, 34701, 70, 1 },
+  {405, 3705, 0, 6, 34701, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 406. edge case for u1 */
-  {3770, 0, 6, 34771, 70, 1 },
+  {406, 3770, 0, 6, 34771, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 407. edge case for u1 */
-  {3835, 0, 6, 34841, 70, 1 },
+  {407, 3835, 0, 6, 34841, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 408. edge case for u2 */
-  {3900, 0, 6, 34911, 70, 1 },
+  {408, 3900, 0, 6, 34911, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 409. edge case for u2 */
-  {3965, 0, 6, 34981, 70, 1 },
+  {409, 3965, 0, 6, 34981, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 410. edge case for u2 */
-  {4030, 0, 6, 35051, 70, 1 },
+  {410, 4030, 0, 6, 35051, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 411. edge case for u2 */
-  {4095, 0, 6, 35121, 70, 1 },
+  {411, 4095, 0, 6, 35121, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 412. edge case for u2 */
-  {4160, 0, 6, 35191, 70, 1 },
+  {412, 4160, 0, 6, 35191, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 413. edge case for u2 */
-  {4225, 0, 6, 35261, 69, 1 },
+  {413, 4225, 0, 6, 35261, 69, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 31 },
   /* tcId: 414. edge case for u2 */
-  {4290, 0, 6, 35330, 70, 1 },
+  {414, 4290, 0, 6, 35330, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 415. edge case for u2 */
-  {4355, 0, 6, 35400, 70, 1 },
+  {415, 4355, 0, 6, 35400, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 416. edge case for u2 */
-  {4420, 0, 6, 35470, 70, 1 },
+  {416, 4420, 0, 6, 35470, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 417. edge case for u2 */
-  {4485, 0, 6, 35540, 70, 1 },
+  {417, 4485, 0, 6, 35540, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 418. edge case for u2 */
-  {4550, 0, 6, 35610, 70, 1 },
+  {418, 4550, 0, 6, 35610, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 419. edge case for u2 */
-  {4615, 0, 6, 35680, 70, 1 },
+  {419, 4615, 0, 6, 35680, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 420. edge case for u2 */
-  {4680, 0, 6, 35750, 70, 1 },
+  {420, 4680, 0, 6, 35750, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 421. edge case for u2 */
-  {4745, 0, 6, 35820, 70, 1 },
+  {421, 4745, 0, 6, 35820, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 422. edge case for u2 */
-  {4810, 0, 6, 35890, 70, 1 },
+  {422, 4810, 0, 6, 35890, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 423. point duplication during verification */
-  {4875, 0, 6, 35960, 70, 1 },
+  {423, 4875, 0, 6, 35960, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 424. duplication bug */
-  {4940, 0, 6, 36030, 70, 0 },
+  {424, 4940, 0, 6, 36030, 70, 0, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 425. comparison with point at infinity  */
-  {5005, 0, 6, 36100, 70, 0 },
+  {425, 5005, 0, 6, 36100, 70, 0, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 426. extreme value for k and edgecase s */
-  {5070, 0, 6, 36170, 71, 1 },
+  {426, 5070, 0, 6, 36170, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 427. extreme value for k and s^-1 */
-  {5135, 0, 6, 36241, 71, 1 },
+  {427, 5135, 0, 6, 36241, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 428. extreme value for k and s^-1 */
-  {5200, 0, 6, 36312, 71, 1 },
+  {428, 5200, 0, 6, 36312, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 429. extreme value for k and s^-1 */
-  {5265, 0, 6, 36383, 71, 1 },
+  {429, 5265, 0, 6, 36383, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 430. extreme value for k and s^-1 */
-  {5330, 0, 6, 36454, 71, 1 },
+  {430, 5330, 0, 6, 36454, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 431. extreme value for k */
-  {5395, 0, 6, 36525, 71, 1 },
+  {431, 5395, 0, 6, 36525, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 432. extreme value for k and edgecase s */
-  {5460, 0, 6, 36596, 70, 1 },
+  {432, 5460, 0, 6, 36596, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 433. extreme value for k and s^-1 */
-  {5525, 0, 6, 36666, 70, 1 },
+  {433, 5525, 0, 6, 36666, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 434. extreme value for k and s^-1 */
-  {5590, 0, 6, 36736, 70, 1 },
+  {434, 5590, 0, 6, 36736, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 435. extreme value for k and s^-1 */
-  {5655, 0, 6, 36806, 70, 1 },
+  {435, 5655, 0, 6, 36806, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 436. extreme value for k and s^-1 */
-  {5720, 0, 6, 36876, 70, 1 },
+  {436, 5720, 0, 6, 36876, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 437. extreme value for k */
-  {5785, 0, 6, 36946, 70, 1 },
+  {437, 5785, 0, 6, 36946, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 438. public key shares x-coordinate with generator */
-  {5850, 0, 6, 37016, 71, 0 },
+  {438, 5850, 0, 6, 37016, 71, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 439. public key shares x-coordinate with generator */
-  {5850, 0, 6, 37087, 70, 0 },
+  {439, 5850, 0, 6, 37087, 70, 0, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 440. public key shares x-coordinate with generator */
-  {5915, 0, 6, 37157, 71, 0 },
+  {440, 5915, 0, 6, 37157, 71, 0, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 441. public key shares x-coordinate with generator */
-  {5915, 0, 6, 37228, 70, 0 },
+  {441, 5915, 0, 6, 37228, 70, 0, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 442. pseudorandom signature */
-  {5980, 546, 0, 37298, 71, 1 },
+  {442, 5980, 546, 0, 37298, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 443. pseudorandom signature */
-  {5980, 546, 3, 37369, 70, 1 },
+  {443, 5980, 546, 3, 37369, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 444. pseudorandom signature */
-  {5980, 0, 6, 37439, 71, 1 },
+  {444, 5980, 0, 6, 37439, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 445. pseudorandom signature */
-  {5980, 549, 20, 37510, 70, 1 },
+  {445, 5980, 549, 20, 37510, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 446. y-coordinate of the public key is small */
-  {6045, 569, 7, 37580, 70, 1 },
+  {446, 6045, 569, 7, 37580, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 447. y-coordinate of the public key is small */
-  {6045, 569, 7, 37650, 70, 1 },
+  {447, 6045, 569, 7, 37650, 70, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 31 },
   /* tcId: 448. y-coordinate of the public key is small */
-  {6045, 569, 7, 37720, 71, 1 },
+  {448, 6045, 569, 7, 37720, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 449. y-coordinate of the public key is large */
-  {6110, 569, 7, 37791, 70, 1 },
+  {449, 6110, 569, 7, 37791, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 450. y-coordinate of the public key is large */
-  {6110, 569, 7, 37861, 71, 1 },
+  {450, 6110, 569, 7, 37861, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 451. y-coordinate of the public key is large */
-  {6110, 569, 7, 37932, 70, 1 },
+  {451, 6110, 569, 7, 37932, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 452. x-coordinate of the public key is small */
-  {6175, 569, 7, 38002, 70, 1 },
+  {452, 6175, 569, 7, 38002, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 453. x-coordinate of the public key is small */
-  {6175, 569, 7, 38072, 71, 1 },
+  {453, 6175, 569, 7, 38072, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 454. x-coordinate of the public key is small */
-  {6175, 569, 7, 38143, 71, 1 },
+  {454, 6175, 569, 7, 38143, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 455. x-coordinate of the public key has many trailing 1's */
-  {6240, 569, 7, 38214, 70, 1 },
+  {455, 6240, 569, 7, 38214, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 456. x-coordinate of the public key has many trailing 1's */
-  {6240, 569, 7, 38284, 71, 1 },
+  {456, 6240, 569, 7, 38284, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 457. x-coordinate of the public key has many trailing 1's */
-  {6240, 569, 7, 38355, 71, 1 },
+  {457, 6240, 569, 7, 38355, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 458. y-coordinate of the public key has many trailing 1's */
-  {6305, 569, 7, 38426, 70, 1 },
+  {458, 6305, 569, 7, 38426, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 459. y-coordinate of the public key has many trailing 1's */
-  {6305, 569, 7, 38496, 71, 1 },
+  {459, 6305, 569, 7, 38496, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 460. y-coordinate of the public key has many trailing 1's */
-  {6305, 569, 7, 38567, 71, 1 },
+  {460, 6305, 569, 7, 38567, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
   /* tcId: 461. x-coordinate of the public key has many trailing 0's */
-  {6370, 569, 7, 38638, 70, 1 },
+  {461, 6370, 569, 7, 38638, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 462. x-coordinate of the public key has many trailing 0's */
-  {6370, 569, 7, 38708, 70, 1 },
+  {462, 6370, 569, 7, 38708, 70, 1, WYCHEPROOF_DER_VALID, 4, 32, 38, 32 },
   /* tcId: 463. x-coordinate of the public key has many trailing 0's */
-  {6370, 569, 7, 38778, 71, 1 },
+  {463, 6370, 569, 7, 38778, 71, 1, WYCHEPROOF_DER_VALID, 5, 32, 39, 32 },
+
+};
+
+static const wycheproof_ecdsa_key_group wycheproof_ecdsa_key_groups[SECP256K1_ECDSA_WYCHEPROOF_NUMBER_KEY_GROUPS] = {
+  {0, 0, 345 },
+  {65, 345, 2 },
+  {130, 347, 1 },
+  {195, 348, 1 },
+  {260, 349, 1 },
+  {325, 350, 1 },
+  {390, 351, 1 },
+  {455, 352, 1 },
+  {520, 353, 1 },
+  {585, 354, 1 },
+  {650, 355, 2 },
+  {715, 357, 1 },
+  {780, 358, 1 },
+  {845, 359, 1 },
+  {910, 360, 1 },
+  {975, 361, 1 },
+  {1040, 362, 1 },
+  {1105, 363, 1 },
+  {1170, 364, 1 },
+  {1235, 365, 1 },
+  {1300, 366, 1 },
+  {1365, 367, 1 },
+  {1430, 368, 2 },
+  {1495, 370, 1 },
+  {1560, 371, 1 },
+  {1625, 372, 1 },
+  {1690, 373, 1 },
+  {1755, 374, 1 },
+  {1820, 375, 1 },
+  {1885, 376, 1 },
+  {1950, 377, 1 },
+  {2015, 378, 1 },
+  {2080, 379, 1 },
+  {2145, 380, 1 },
+  {2210, 381, 1 },
+  {2275, 382, 1 },
+  {2340, 383, 1 },
+  {2405, 384, 1 },
+  {2470, 385, 1 },
+  {2535, 386, 1 },
+  {2600, 387, 1 },
+  {2665, 388, 1 },
+  {2730, 389, 1 },
+  {2795, 390, 1 },
+  {2860, 391, 1 },
+  {2925, 392, 1 },
+  {2990, 393, 1 },
+  {3055, 394, 1 },
+  {3120, 395, 1 },
+  {3185, 396, 1 },
+  {3250, 397, 1 },
+  {3315, 398, 1 },
+  {3380, 399, 1 },
+  {3445, 400, 1 },
+  {3510, 401, 1 },
+  {3575, 402, 1 },
+  {3640, 403, 1 },
+  {3705, 404, 1 },
+  {3770, 405, 1 },
+  {3835, 406, 1 },
+  {3900, 407, 1 },
+  {3965, 408, 1 },
+  {4030, 409, 1 },
+  {4095, 410, 1 },
+  {4160, 411, 1 },
+  {4225, 412, 1 },
+  {4290, 413, 1 },
+  {4355, 414, 1 },
+  {4420, 415, 1 },
+  {4485, 416, 1 },
+  {4550, 417, 1 },
+  {4615, 418, 1 },
+  {4680, 419, 1 },
+  {4745, 420, 1 },
+  {4810, 421, 1 },
+  {4875, 422, 1 },
+  {4940, 423, 1 },
+  {5005, 424, 1 },
+  {5070, 425, 1 },
+  {5135, 426, 1 },
+  {5200, 427, 1 },
+  {5265, 428, 1 },
+  {5330, 429, 1 },
+  {5395, 430, 1 },
+  {5460, 431, 1 },
+  {5525, 432, 1 },
+  {5590, 433, 1 },
+  {5655, 434, 1 },
+  {5720, 435, 1 },
+  {5785, 436, 1 },
+  {5850, 437, 2 },
+  {5915, 439, 2 },
+  {5980, 441, 4 },
+  {6045, 445, 3 },
+  {6110, 448, 3 },
+  {6175, 451, 3 },
+  {6240, 454, 3 },
+  {6305, 457, 3 },
+  {6370, 460, 3 },
 
 };
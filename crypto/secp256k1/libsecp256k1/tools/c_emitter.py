@@ -0,0 +1,137 @@
+'''
+Helpers shared by the scripts in this directory that turn test vectors into C
+source: a streaming writer, table-driven byte string conversion, declaration
+helpers and an interning pool.
+
+The generator scripts only use this module through plain imports and keep no
+global state, so they can also be driven in-process by calling their main().
+'''
+
+import textwrap
+
+# C literals for every byte value, so that converting a byte string is a
+# single table lookup per byte.
+HEX_UPPER = ["0x%02X" % b for b in range(256)]
+HEX_LOWER = ["0x%02x" % b for b in range(256)]
+
+
+def c_bytes(data, sep=", ", table=HEX_UPPER):
+    """Return the elements of a C initializer for the byte string data,
+    without the surrounding braces."""
+    return sep.join([table[b] for b in data])
+
+
+def hex_to_c(hexstr, sep=", ", table=HEX_UPPER):
+    """Like c_bytes, for a hex encoded byte string."""
+    return c_bytes(bytes.fromhex(hexstr), sep, table)
+
+
+def indent(s, level):
+    return textwrap.indent(s, 4 * level * " ")
+
+
+def struct_decl(name, members, comment=None):
+    """Return the declaration of struct name with the given member
+    declarations, preceded by an empty line."""
+    s = "\n"
+    if comment is not None:
+        s += comment + "\n"
+    s += "struct %s {\n" % name
+    s += "".join("    %s\n" % m for m in members)
+    s += "};\n"
+    return s
+
+
+def typedef_struct(name, members):
+    """Return a typedef of an anonymous struct with the given member
+    declarations, preceded by an empty line."""
+    s = "\ntypedef struct {\n"
+    s += "".join("    %s\n" % m for m in members)
+    s += "} %s;\n" % name
+    return s
+
+
+def array_def(storage, ctype, name, values, length=None):
+    """Return the one-line definition of a C array of integers."""
+    if length is None:
+        length = len(values)
+    return "%s %s %s[%d] = { %s };\n" % (
+        storage,
+        ctype,
+        name,
+        length,
+        ", ".join(map(str, values)),
+    )
+
+
+class Writer:
+    """Streams generated source to a file object piece by piece, instead of
+    building up the whole output as one string first."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, s):
+        self.f.write(s)
+
+    def line(self, s=""):
+        self.f.write(s)
+        self.f.write("\n")
+
+    def join(self, head, elements, sep, tail):
+        """Write head, the elements separated by sep, and tail, consuming
+        elements lazily."""
+        self.f.write(head)
+        first = True
+        for e in elements:
+            if not first:
+                self.f.write(sep)
+            self.f.write(e)
+            first = False
+        self.f.write(tail)
+
+
+class InternPool:
+    """A byte array in which every distinct byte string is stored once.
+    Strings are laid out back to back in the order they were first seen."""
+
+    def __init__(self):
+        self.offsets = {}
+        self.size = 0
+
+    def intern(self, data):
+        """Return the offset of data in the pool, adding it if needed."""
+        offset = self.offsets.get(data)
+        if offset is None:
+            offset = self.offsets[data] = self.size
+            self.size += len(data)
+        return offset
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Iterate over the distinct byte strings in pool order."""
+        return iter(self.offsets)
+
+
+class FlatArray:
+    """A flat array holding variable length runs of values, which are
+    referred to by (len, offset) as in compressed sparse row layouts. A run
+    which already occurs in the array is not stored again."""
+
+    def __init__(self):
+        self.values = []
+
+    def append(self, run):
+        """Return the offset of run in the array, appending it if needed."""
+        run = list(run)
+        n = len(run)
+        for i in range(len(self.values) - n + 1):
+            if self.values[i : i + n] == run:
+                return i
+        self.values.extend(run)
+        return len(self.values) - n
+
+    def __len__(self):
+        return len(self.values)
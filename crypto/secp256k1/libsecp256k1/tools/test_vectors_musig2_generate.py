@@ -1,67 +1,48 @@
 #!/usr/bin/env python3
+"""
+This script converts BIP MuSig2 test vectors in a given directory to a C file
+that can be used in the test framework.
 
-import sys
-import json
-import textwrap
-
-max_pubkeys = 0
-
-if len(sys.argv) < 2:
-    print(
-        "This script converts BIP MuSig2 test vectors in a given directory to a C file that can be used in the test framework."
-    )
-    print("Usage: %s <dir>" % sys.argv[0])
-    sys.exit(1)
-
+The conversion is also available in-process through main(), which takes the
+command line arguments as a list; the script keeps no global state between
+runs.
+"""
 
-def hexstr_to_intarray(str):
-    return ", ".join([f"0x{b:02X}" for b in bytes.fromhex(str)])
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
 
+from c_emitter import FlatArray, InternPool, Writer, array_def, c_bytes, hex_to_c, indent
 
-def create_init(name):
-    return """
-static const struct musig_%s_vector musig_%s_vector = {
-""" % (
-        name,
-        name,
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="This script converts BIP MuSig2 test vectors in a given directory to a C file that can be used in the test framework."
     )
-
-
-def init_array(key):
-    return textwrap.indent("{ %s },\n" % hexstr_to_intarray(data[key]), 4 * " ")
-
-
-def init_arrays(key):
-    s = textwrap.indent("{\n", 4 * " ")
-    s += textwrap.indent(
-        ",\n".join(["{ %s }" % hexstr_to_intarray(x) for x in data[key]]), 8 * " "
+    parser.add_argument("dir", help="directory containing the BIP MuSig2 JSON vector files")
+    parser.add_argument(
+        "--compact-indices",
+        action="store_true",
+        help="store the index lists of all cases of a section in one flat array and refer to them by (len, offset), resolved by the MUSIG_<SECTION>_<FIELD> accessors, instead of padding every case to the maximum length",
     )
-    s += textwrap.indent("\n},\n", 4 * " ")
-    return s
-
-
-def init_indices(array):
-    return " %d, { %s }" % (
-        len(array),
-        ", ".join(map(str, array) if len(array) > 0 else "0"),
+    parser.add_argument(
+        "--pool",
+        action="store_true",
+        help="store every byte string of the vectors and their test cases once in a shared pool and refer to it by offset, resolved by the MUSIG_<SECTION>_<FIELD> accessors",
     )
+    return parser.parse_args(argv)
 
 
-def init_is_xonly(case):
-    if len(case["tweak_indices"]) > 0:
-        return ", ".join(map(lambda x: "1" if x else "0", case["is_xonly"]))
-    return "0"
-
-
-def init_optional_expected(case):
-    return hexstr_to_intarray(case["expected"]) if "expected" in case else 0
+def hexstr_to_intarray(str):
+    return hex_to_c(str)
 
 
 def init_cases(cases, f):
-    s = textwrap.indent("{\n", 4 * " ")
+    s = indent("{\n", 1)
     for (i, case) in enumerate(cases):
-        s += textwrap.indent("%s\n" % f(case), 8 * " ")
-    s += textwrap.indent("},\n", 4 * " ")
+        s += indent("%s\n" % f(case), 2)
+    s += indent("},\n", 1)
     return s
 
 
@@ -69,18 +50,173 @@ def finish_init():
     return "};\n"
 
 
-s = (
-    """/**
+class Generator:
+    """The state of one conversion: the options, the sections generated so
+    far and the byte string pool and flat index arrays they refer to."""
+
+    def __init__(self, args, prog):
+        self.args = args
+        self.prog = prog
+        self.max_pubkeys = 0
+        # (name, decl, init) of every section
+        self.sections = []
+        # Shared pool of byte strings for --pool.
+        self.pool = InternPool()
+        self.begin_section(None)
+
+    def begin_section(self, name):
+        self.section = name
+        # Accessor macros of the section's fields, by macro name.
+        self.accessors = {}
+        # Flat index arrays of the section for --compact-indices.
+        self.flat_indices = FlatArray()
+        self.flat_is_xonly = FlatArray()
+
+    def accessor(self, field, params, expr):
+        """Define MUSIG_<SECTION>_<FIELD>(params) as expr, which is how the
+        tests read the field in any layout."""
+        name = "MUSIG_%s_%s" % (self.section.upper(), field.upper())
+        self.accessors[name] = "#define %s(%s) %s" % (name, params, expr)
+
+    def create_init(self, name):
+        return """
+static const struct musig_%s_vector musig_%s_vector = {
+""" % (
+            name,
+            name,
+        )
+
+    def bytes_member(self, name, size, param="v"):
+        """Declare a byte string member of a vector, or of a test case with
+        param "c"."""
+        if self.args.pool:
+            self.accessor(name, param, "MUSIG_POOL((%s)->%s)" % (param, name))
+            return "size_t %s;" % name
+        self.accessor(name, param, "((%s)->%s)" % (param, name))
+        return "unsigned char %s[%d];" % (name, size)
+
+    def bytes_array_member(self, stats, name, num, size, key=None):
+        if self.args.pool:
+            self.accessor(name, "v, i", "MUSIG_POOL((v)->%s[i])" % name)
+            return "size_t %s[%d];" % (name, num)
+        self.accessor(name, "v, i", "((v)->%s[i])" % name)
+        if self.args.compact_indices:
+            # Do not pad the elements beyond the longest one actually present.
+            size = stats[key or name]
+        return "unsigned char %s[%d][%d];" % (name, num, size)
+
+    def init_bytes(self, value):
+        """Initializer of a byte string member, which is absent and never
+        read if value is None."""
+        if self.args.pool:
+            return "%d" % (0 if value is None else self.pool.intern(bytes.fromhex(value)))
+        return "{ %s }" % (0 if value is None else hexstr_to_intarray(value))
+
+    def init_array(self, data, key):
+        if self.args.pool:
+            return indent("%d,\n" % self.pool.intern(bytes.fromhex(data[key])), 1)
+        return indent("{ %s },\n" % hexstr_to_intarray(data[key]), 1)
+
+    def init_arrays(self, data, key):
+        if self.args.pool:
+            offsets = ", ".join(str(self.pool.intern(bytes.fromhex(x))) for x in data[key])
+            return indent("{ %s },\n" % offsets, 1)
+        s = indent("{\n", 1)
+        s += indent(",\n".join(["{ %s }" % hexstr_to_intarray(x) for x in data[key]]), 2)
+        s += indent("\n},\n", 1)
+        return s
+
+    def indices_member(self, name, max_len):
+        if self.args.compact_indices:
+            self.accessor(name, "c", "(&musig_%s_indices[(c)->%s_offset])" % (self.section, name))
+            return "size_t %s_offset;" % name
+        self.accessor(name, "c", "((c)->%s)" % name)
+        return "size_t %s[%d];" % (name, max_len)
+
+    def is_xonly_member(self, max_len):
+        if self.args.compact_indices:
+            self.accessor("is_xonly", "c", "(&musig_%s_is_xonly[(c)->is_xonly_offset])" % self.section)
+            return "size_t is_xonly_offset;"
+        self.accessor("is_xonly", "c", "((c)->is_xonly)")
+        return "int is_xonly[%d];" % max_len
+
+    def init_indices(self, array):
+        if self.args.compact_indices:
+            return " %d, %d" % (len(array), self.flat_indices.append(array))
+        return " %d, { %s }" % (
+            len(array),
+            ", ".join(map(str, array) if len(array) > 0 else "0"),
+        )
+
+    def init_is_xonly(self, case):
+        is_xonly = [1 if x else 0 for x in case["is_xonly"]]
+        if self.args.compact_indices:
+            return "%d" % self.flat_is_xonly.append(is_xonly)
+        if len(case["tweak_indices"]) > 0:
+            return "{ %s }" % ", ".join(map(str, is_xonly))
+        return "{ 0 }"
+
+    def flat_arrays(self, name):
+        """The flat index arrays of a section which its accessors refer to,
+        with their values. C arrays cannot be empty, so an array with only
+        empty runs holds a single unused 0."""
+        arrays = []
+        for (field, array, ctype, flat) in (
+            ("indices", "musig_%s_indices" % name, "size_t", self.flat_indices),
+            ("is_xonly", "musig_%s_is_xonly" % name, "int", self.flat_is_xonly),
+        ):
+            if any("musig_%s_%s[" % (name, field) in d for d in self.accessors.values()):
+                arrays.append((array, ctype, flat.values or [0]))
+        return arrays
+
+    def init_flat_arrays(self, name):
+        """Definitions of the flat index arrays of a section for
+        --compact-indices. The cases of the section refer to runs in these
+        arrays by (len, offset)."""
+        s = ""
+        for (array, ctype, values) in self.flat_arrays(name):
+            s += "\n" + array_def("static const", ctype, array, values)
+        return s
+
+    def add_section(self, name, decl, init):
+        if self.args.compact_indices:
+            init = self.init_flat_arrays(name) + init
+        if self.accessors:
+            decl += "\n/* Accessors for the fields of musig_%s_vector, which resolve\n * correctly in every layout of this file. */\n" % name
+            decl += "".join(d + "\n" for d in self.accessors.values())
+        self.sections.append((name, decl, init))
+
+    def preamble(self):
+        return (
+            """/**
  * Automatically generated by %s.
  *
  * The test vectors for the KeySort function are included in this file. They can
  * be found in src/modules/extrakeys/tests_impl.h. */
 """
-    % sys.argv[0]
-)
-
+            % self.prog
+        )
 
-s += """
+    def init_pool(self):
+        s = "\nstatic const unsigned char musig_pool[%d] = {\n" % len(self.pool)
+        s += ",\n".join(indent(c_bytes(x), 1) for x in self.pool)
+        s += "\n};\n"
+        return s
+
+    def write_header(self, out):
+        w = Writer(out)
+        w.write(self.preamble())
+        w.write(error_enum)
+        if self.args.pool:
+            w.write(pool_accessor)
+            w.write(self.init_pool())
+        for (name, decl, init) in self.sections:
+            w.write(decl)
+            w.write(init)
+        w.line("enum { MUSIG_VECTORS_MAX_PUBKEYS = %d };" % self.max_pubkeys)
+
+
+error_enum = """
 enum MUSIG_ERROR {
     MUSIG_PUBKEY,
     MUSIG_TWEAK,
@@ -93,127 +229,510 @@ enum MUSIG_ERROR {
 };
 """
 
-# key agg vectors
-with open(sys.argv[1] + "/key_agg_vectors.json", "r") as f:
-    data = json.load(f)
+pool_accessor = """
+/* The byte strings of all vectors are stored once in musig_pool and the
+ * vectors refer to them by offset, which the MUSIG_<SECTION>_<FIELD>
+ * accessors below resolve. */
+#define MUSIG_POOL(offset) (&musig_pool[offset])
+"""
 
-    max_key_indices = max(
-        len(test_case["key_indices"]) for test_case in data["valid_test_cases"]
-    )
-    max_tweak_indices = max(
-        len(test_case["tweak_indices"]) for test_case in data["error_test_cases"]
-    )
+
+# The following map the comment of an error test case to the expected error,
+# returning None for unknown comments.
+
+
+def key_agg_error(comment):
+    if "public key" in comment.lower():
+        return "MUSIG_PUBKEY"
+    elif "tweak" in comment.lower():
+        return "MUSIG_TWEAK"
+
+
+def sign_error(comment):
+    if "pubkey" in comment or "public key" in comment:
+        return "MUSIG_PUBKEY"
+    elif "Aggregate nonce" in comment:
+        return "MUSIG_AGGNONCE"
+    elif "Secnonce" in comment:
+        return "MUSIG_SECNONCE"
+
+
+def verify_error(comment):
+    if "exceeds" in comment:
+        return "MUSIG_SIG"
+    elif "Wrong signer" in comment or "Wrong signature" in comment:
+        return "MUSIG_SIG_VERIFY"
+    elif "pubnonce" in comment:
+        return "MUSIG_PUBNONCE"
+    elif "pubkey" in comment:
+        return "MUSIG_PUBKEY"
+
+
+class VectorError(Exception):
+    """Raised by load_sections with all problems found in the vector files."""
+
+    def __init__(self, errors):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+# Field types of the vector schemas below. Each checks a value found at where
+# in the top level object data (and in case, for fields of test cases),
+# appends a message to errors if it does not conform, and returns its length
+# for the max-length statistics (or None).
+
+
+class Hex:
+    """A hex encoded byte string of at most (or, if exact, exactly) size
+    bytes, or of any length if size is None."""
+
+    def __init__(self, size, nullable=False, exact=False):
+        self.size = size
+        self.nullable = nullable
+        self.exact = exact
+
+    def check(self, value, where, errors, data, case):
+        if value is None and self.nullable:
+            return None
+        try:
+            n = len(bytes.fromhex(value))
+        except (TypeError, ValueError):
+            errors.append("%s: not a hex string" % where)
+            return None
+        if self.size is not None and (n > self.size or (self.exact and n != self.size)):
+            errors.append("%s: %d bytes, %s %d allowed" % (where, n, "exactly" if self.exact else "at most", self.size))
+        return n
+
+
+class HexList:
+    """A list of byte strings as checked by Hex. Only the first limit
+    elements are kept, if given."""
+
+    def __init__(self, size, limit=None, exact=False):
+        self.elem = Hex(size, exact=exact)
+        self.limit = limit
+
+    def check(self, value, where, errors, data, case):
+        if not isinstance(value, list):
+            errors.append("%s: not a list" % where)
+            return None
+        lens = [
+            self.elem.check(x, "%s[%d]" % (where, i), errors, data, case)
+            for (i, x) in enumerate(value[: self.limit])
+        ]
+        return max((n for n in lens if n is not None), default=0)
+
+
+class Index:
+    """An index into the list called array at the top level of the file, or
+    a plain integer if array is None."""
+
+    def __init__(self, array):
+        self.array = array
+
+    def check(self, value, where, errors, data, case):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            errors.append("%s: not a non-negative integer" % where)
+        elif self.array is not None and value >= len(data.get(self.array) or ()):
+            errors.append("%s: index %d out of range of %s" % (where, value, self.array))
+        return None
+
+
+class Indices:
+    """A list of indices into the list called array at the top level of the
+    file. If length is given, the list must have exactly that length."""
+
+    def __init__(self, array, length=None):
+        self.elem = Index(array)
+        self.length = length
+
+    def check(self, value, where, errors, data, case):
+        if not isinstance(value, list):
+            errors.append("%s: not a list" % where)
+            return None
+        if self.length is not None and len(value) != self.length:
+            errors.append("%s: %d indices, expected %d" % (where, len(value), self.length))
+        for (i, x) in enumerate(value):
+            self.elem.check(x, "%s[%d]" % (where, i), errors, data, case)
+        return len(value)
+
+
+class Flags:
+    """A list of booleans with one entry per element of the list field
+    other (e.g. is_xonly for tweak_indices)."""
+
+    def __init__(self, other):
+        self.other = other
+
+    def check(self, value, where, errors, data, case):
+        if not isinstance(value, list) or not all(isinstance(x, bool) for x in value):
+            errors.append("%s: not a list of booleans" % where)
+        elif isinstance(case.get(self.other), list) and len(value) != len(case[self.other]):
+            errors.append("%s: length differs from %s" % (where, self.other))
+        return None
+
+
+class Comment:
+    """A comment from which the expected error is derived by classify."""
+
+    def __init__(self, classify):
+        self.classify = classify
+
+    def check(self, value, where, errors, data, case):
+        if not isinstance(value, str) or self.classify(value) is None:
+            errors.append("%s: unknown error %r" % (where, value))
+        return None
+
+
+class Signer:
+    """An error object naming the index of the offending signer."""
+
+    def check(self, value, where, errors, data, case):
+        if not isinstance(value, dict) or not isinstance(value.get("signer"), int):
+            errors.append("%s: no signer index" % where)
+        return None
+
+
+class Cases:
+    """A list of test cases with the given fields. Only the cases for which
+    keep returns true are kept."""
+
+    def __init__(self, keep=None, **fields):
+        self.keep = keep
+        self.fields = fields
+
+
+# The parts of the vector files used by the sections below. The sizes of the
+# byte strings are those of the corresponding C arrays.
+SCHEMAS = {
+    "key_agg": {
+        "pubkeys": HexList(33),
+        "tweaks": HexList(32),
+        "valid_test_cases": Cases(key_indices=Indices("pubkeys"), expected=Hex(32)),
+        "error_test_cases": Cases(
+            key_indices=Indices("pubkeys"),
+            tweak_indices=Indices("tweaks"),
+            is_xonly=Flags("tweak_indices"),
+            comment=Comment(key_agg_error),
+        ),
+    },
+    "nonce_gen": {
+        "test_cases": Cases(
+            # The MuSig2 implementation only allows messages of length 32
+            keep=lambda c: c["msg"] is None or len(c["msg"]) == 64,
+            rand_=Hex(32),
+            sk=Hex(32, nullable=True),
+            pk=Hex(33),
+            aggpk=Hex(32, nullable=True),
+            msg=Hex(None, nullable=True),
+            extra_in=Hex(32, nullable=True),
+            expected_secnonce=Hex(97),
+            expected_pubnonce=Hex(66),
+        ),
+    },
+    "nonce_agg": {
+        "pnonces": HexList(66),
+        "valid_test_cases": Cases(pnonce_indices=Indices("pnonces", 2), expected=Hex(66)),
+        "error_test_cases": Cases(pnonce_indices=Indices("pnonces", 2), error=Signer()),
+    },
+    "sign_verify": {
+        "sk": Hex(32),
+        "pubkeys": HexList(33),
+        "secnonces": HexList(194),
+        "pnonces": HexList(194),
+        "aggnonces": HexList(66),
+        # The MuSig2 implementation only allows messages of length 32, which
+        # only the first one has.
+        "msgs": HexList(32, limit=1, exact=True),
+        "valid_test_cases": Cases(
+            keep=lambda c: c["msg_index"] == 0,
+            key_indices=Indices("pubkeys"),
+            nonce_indices=Indices("pnonces"),
+            aggnonce_index=Index("aggnonces"),
+            msg_index=Index("msgs"),
+            signer_index=Index(None),
+            expected=Hex(32),
+        ),
+        "sign_error_test_cases": Cases(
+            keep=lambda c: c["msg_index"] == 0,
+            key_indices=Indices("pubkeys"),
+            aggnonce_index=Index("aggnonces"),
+            msg_index=Index("msgs"),
+            secnonce_index=Index("secnonces"),
+            comment=Comment(sign_error),
+        ),
+        "verify_fail_test_cases": Cases(
+            keep=lambda c: c["msg_index"] == 0,
+            sig=Hex(32),
+            key_indices=Indices("pubkeys"),
+            nonce_indices=Indices("pnonces"),
+            msg_index=Index("msgs"),
+            signer_index=Index(None),
+            comment=Comment(verify_error),
+        ),
+        "verify_error_test_cases": Cases(
+            keep=lambda c: c["msg_index"] == 0,
+            sig=Hex(32),
+            key_indices=Indices("pubkeys"),
+            nonce_indices=Indices("pnonces"),
+            msg_index=Index("msgs"),
+            signer_index=Index(None),
+            comment=Comment(verify_error),
+        ),
+    },
+    "tweak": {
+        "sk": Hex(32),
+        "secnonce": Hex(97),
+        "aggnonce": Hex(66),
+        "msg": Hex(32),
+        "pubkeys": HexList(33),
+        "pnonces": HexList(194),
+        "tweaks": HexList(32),
+        "valid_test_cases": Cases(
+            key_indices=Indices("pubkeys"),
+            nonce_indices=Indices("pnonces"),
+            tweak_indices=Indices("tweaks"),
+            is_xonly=Flags("tweak_indices"),
+            signer_index=Index(None),
+            expected=Hex(32),
+        ),
+        "error_test_cases": Cases(
+            key_indices=Indices("pubkeys"),
+            nonce_indices=Indices("pnonces"),
+            tweak_indices=Indices("tweaks"),
+            is_xonly=Flags("tweak_indices"),
+            signer_index=Index(None),
+        ),
+    },
+    "sig_agg": {
+        "pubkeys": HexList(33),
+        "tweaks": HexList(32),
+        "psigs": HexList(32),
+        "msg": Hex(32),
+        "valid_test_cases": Cases(
+            key_indices=Indices("pubkeys"),
+            tweak_indices=Indices("tweaks"),
+            is_xonly=Flags("tweak_indices"),
+            aggnonce=Hex(66),
+            psig_indices=Indices("psigs"),
+            expected=Hex(64),
+        ),
+        "error_test_cases": Cases(
+            key_indices=Indices("pubkeys"),
+            tweak_indices=Indices("tweaks"),
+            is_xonly=Flags("tweak_indices"),
+            aggnonce=Hex(66),
+            psig_indices=Indices("psigs"),
+            error=Signer(),
+        ),
+    },
+}
+
+
+def validate(name, data, errors):
+    """Check data against the schema of section name in a single pass over
+    all of its test cases, dropping the cases and byte strings the schema
+    does not keep. Returns the statistics the section needs: for every list
+    of byte strings its longest element in bytes, and for every list of
+    indices its longest length over all kept cases."""
+    schema = SCHEMAS[name]
+    prefix = name + "_vectors.json: "
+    stats = {}
+    if not isinstance(data, dict):
+        errors.append(prefix + "not an object")
+        return stats
+    # Check the byte strings first, since the cases are checked against them.
+    for (key, kind) in schema.items():
+        if isinstance(kind, Cases):
+            continue
+        if key not in data:
+            errors.append(prefix + "missing %s" % key)
+            continue
+        n = kind.check(data[key], prefix + key, errors, data, None)
+        if isinstance(kind, HexList):
+            stats[key] = n or 0
+    for (key, kind) in schema.items():
+        if not isinstance(kind, Cases):
+            continue
+        for (field, ftype) in kind.fields.items():
+            if isinstance(ftype, Indices):
+                stats.setdefault(field, 0)
+        cases = data.get(key)
+        if not isinstance(cases, list):
+            errors.append(prefix + "missing list %s" % key)
+            continue
+        kept = []
+        for (i, case) in enumerate(cases):
+            where = "%s%s[%d]" % (prefix, key, i)
+            if not isinstance(case, dict):
+                errors.append(where + ": not an object")
+                continue
+            missing = [f for f in kind.fields if f not in case]
+            if missing:
+                errors.append(where + ": missing " + ", ".join(missing))
+                continue
+            num_errors = len(errors)
+            lens = [
+                (field, ftype.check(case[field], where + "." + field, errors, data, case))
+                for (field, ftype) in kind.fields.items()
+            ]
+            if len(errors) > num_errors or (kind.keep is not None and not kind.keep(case)):
+                continue
+            kept.append(case)
+            for (field, n) in lens:
+                if isinstance(kind.fields[field], Indices):
+                    stats[field] = max(stats[field], n)
+        data[key] = kept
+    for (key, kind) in schema.items():
+        if isinstance(kind, HexList) and kind.limit is not None and isinstance(data.get(key), list):
+            data[key] = data[key][: kind.limit]
+    return stats
+
+
+def load_section(directory, name):
+    """Read, parse and validate one vector file. Returns (data, stats,
+    errors)."""
+    errors = []
+    path = os.path.join(directory, name + "_vectors.json")
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        return None, {}, ["%s_vectors.json: %s" % (name, e)]
+    stats = validate(name, data, errors)
+    return data, stats, errors
+
+
+def load_sections(directory):
+    """Load the vector files of all sections concurrently. Returns a list of
+    (data, stats) in the order of SECTIONS, or raises VectorError with the
+    problems found in all files."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=NUM_SECTIONS) as executor:
+        results = list(
+            executor.map(lambda section: load_section(directory, section[0]), SECTIONS)
+        )
+    errors = [e for (data, stats, errs) in results for e in errs]
+    if errors:
+        raise VectorError(errors)
+    return [(data, stats) for (data, stats, errs) in results]
+
+
+def key_agg(g, data, stats):
+    """Add the section for the key aggregation vectors."""
+    decl = ""
+    init = ""
+
+    max_key_indices = stats["key_indices"]
+    max_tweak_indices = stats["tweak_indices"]
     num_pubkeys = len(data["pubkeys"])
-    max_pubkeys = max(num_pubkeys, max_pubkeys)
+    g.max_pubkeys = max(num_pubkeys, g.max_pubkeys)
     num_tweaks = len(data["tweaks"])
     num_valid_cases = len(data["valid_test_cases"])
     num_error_cases = len(data["error_test_cases"])
 
     # Add structures for valid and error cases
-    s += (
+    decl += (
         """
 struct musig_key_agg_valid_test_case {
     size_t key_indices_len;
-    size_t key_indices[%d];
-    unsigned char expected[32];
+    %s
+    %s
 };
 """
-        % max_key_indices
+        % (g.indices_member("key_indices", max_key_indices), g.bytes_member("expected", 32, "c"))
     )
-    s += """
+    decl += """
 struct musig_key_agg_error_test_case {
     size_t key_indices_len;
-    size_t key_indices[%d];
+    %s
     size_t tweak_indices_len;
-    size_t tweak_indices[%d];
-    int is_xonly[%d];
+    %s
+    %s
     enum MUSIG_ERROR error;
 };
 """ % (
-        max_key_indices,
-        max_tweak_indices,
-        max_tweak_indices,
+        g.indices_member("key_indices", max_key_indices),
+        g.indices_member("tweak_indices", max_tweak_indices),
+        g.is_xonly_member(max_tweak_indices),
     )
 
     # Add structure for entire vector
-    s += """
+    decl += """
 struct musig_key_agg_vector {
-    unsigned char pubkeys[%d][33];
-    unsigned char tweaks[%d][32];
+    %s
+    %s
     struct musig_key_agg_valid_test_case valid_case[%d];
     struct musig_key_agg_error_test_case error_case[%d];
 };
 """ % (
-        num_pubkeys,
-        num_tweaks,
+        g.bytes_array_member(stats, "pubkeys", num_pubkeys, 33),
+        g.bytes_array_member(stats, "tweaks", num_tweaks, 32),
         num_valid_cases,
         num_error_cases,
     )
 
-    s += create_init("key_agg")
+    init += g.create_init("key_agg")
     # Add pubkeys and tweaks to the vector
-    s += init_arrays("pubkeys")
-    s += init_arrays("tweaks")
+    init += g.init_arrays(data, "pubkeys")
+    init += g.init_arrays(data, "tweaks")
 
     # Add valid cases to the vector
-    s += init_cases(
+    init += init_cases(
         data["valid_test_cases"],
-        lambda case: "{ %s, { %s }},"
-        % (init_indices(case["key_indices"]), hexstr_to_intarray(case["expected"])),
+        lambda case: "{ %s, %s},"
+        % (g.init_indices(case["key_indices"]), g.init_bytes(case["expected"])),
     )
 
-    def comment_to_error(case):
-        comment = case["comment"]
-        if "public key" in comment.lower():
-            return "MUSIG_PUBKEY"
-        elif "tweak" in comment.lower():
-            return "MUSIG_TWEAK"
-        else:
-            sys.exit("Unknown error")
-
     # Add error cases to the vector
-    s += init_cases(
+    init += init_cases(
         data["error_test_cases"],
-        lambda case: "{ %s, %s, { %s }, %s },"
+        lambda case: "{ %s, %s, %s, %s },"
         % (
-            init_indices(case["key_indices"]),
-            init_indices(case["tweak_indices"]),
-            init_is_xonly(case),
-            comment_to_error(case),
+            g.init_indices(case["key_indices"]),
+            g.init_indices(case["tweak_indices"]),
+            g.init_is_xonly(case),
+            key_agg_error(case["comment"]),
         ),
     )
 
-    s += finish_init()
+    init += finish_init()
+    g.add_section("key_agg", decl, init)
 
-# nonce gen vectors
-with open(sys.argv[1] + "/nonce_gen_vectors.json", "r") as f:
-    data = json.load(f)
 
-    # The MuSig2 implementation only allows messages of length 32
-    data["test_cases"] = list(
-        filter(lambda c: c["msg"] is None or len(c["msg"]) == 64, data["test_cases"])
-    )
+def nonce_gen(g, data, stats):
+    """Add the section for the nonce generation vectors."""
+    decl = ""
+    init = ""
 
     num_tests = len(data["test_cases"])
 
-    s += """
+    decl += """
 struct musig_nonce_gen_test_case {
-    unsigned char rand_[32];
+    %s
     int has_sk;
-    unsigned char sk[32];
-    unsigned char pk[33];
+    %s
+    %s
     int has_aggpk;
-    unsigned char aggpk[32];
+    %s
     int has_msg;
-    unsigned char msg[32];
+    %s
     int has_extra_in;
-    unsigned char extra_in[32];
-    unsigned char expected_secnonce[97];
-    unsigned char expected_pubnonce[66];
+    %s
+    %s
+    %s
 };
-"""
+""" % (
+        g.bytes_member("rand_", 32, "c"),
+        g.bytes_member("sk", 32, "c"),
+        g.bytes_member("pk", 33, "c"),
+        g.bytes_member("aggpk", 32, "c"),
+        g.bytes_member("msg", 32, "c"),
+        g.bytes_member("extra_in", 32, "c"),
+        g.bytes_member("expected_secnonce", 97, "c"),
+        g.bytes_member("expected_pubnonce", 66, "c"),
+    )
 
-    s += (
+    decl += (
         """
 struct musig_nonce_gen_vector {
     struct musig_nonce_gen_test_case test_case[%d];
@@ -222,99 +741,86 @@ struct musig_nonce_gen_vector {
         % num_tests
     )
 
-    s += create_init("nonce_gen")
+    init += g.create_init("nonce_gen")
 
     def init_array_maybe(array):
-        return "%d , { %s }" % (
-            0 if array is None else 1,
-            hexstr_to_intarray(array) if array is not None else 0,
-        )
+        return "%d , %s" % (0 if array is None else 1, g.init_bytes(array))
 
-    s += init_cases(
+    init += init_cases(
         data["test_cases"],
-        lambda case: "{ { %s },  %s, { %s }, %s, %s, %s, { %s }, { %s } },"
+        lambda case: "{ %s,  %s, %s, %s, %s, %s, %s, %s },"
         % (
-            hexstr_to_intarray(case["rand_"]),
+            g.init_bytes(case["rand_"]),
             init_array_maybe(case["sk"]),
-            hexstr_to_intarray(case["pk"]),
+            g.init_bytes(case["pk"]),
             init_array_maybe(case["aggpk"]),
             init_array_maybe(case["msg"]),
             init_array_maybe(case["extra_in"]),
-            hexstr_to_intarray(case["expected_secnonce"]),
-            hexstr_to_intarray(case["expected_pubnonce"]),
+            g.init_bytes(case["expected_secnonce"]),
+            g.init_bytes(case["expected_pubnonce"]),
         ),
     )
 
-    s += finish_init()
+    init += finish_init()
+    g.add_section("nonce_gen", decl, init)
+
 
-# nonce agg vectors
-with open(sys.argv[1] + "/nonce_agg_vectors.json", "r") as f:
-    data = json.load(f)
+def nonce_agg(g, data, stats):
+    """Add the section for the nonce aggregation vectors."""
+    decl = ""
+    init = ""
 
     num_pnonces = len(data["pnonces"])
     num_valid_cases = len(data["valid_test_cases"])
     num_error_cases = len(data["error_test_cases"])
 
-    pnonce_indices_len = 2
-    for case in data["valid_test_cases"] + data["error_test_cases"]:
-        assert len(case["pnonce_indices"]) == pnonce_indices_len
-
     # Add structures for valid and error cases
-    s += """
+    decl += """
 struct musig_nonce_agg_test_case {
     size_t pnonce_indices[2];
     /* if valid case */
-    unsigned char expected[66];
+    %s
     /* if error case */
     int invalid_nonce_idx;
 };
-"""
+""" % g.bytes_member("expected", 66, "c")
     # Add structure for entire vector
-    s += """
+    decl += """
 struct musig_nonce_agg_vector {
-    unsigned char pnonces[%d][66];
+    %s
     struct musig_nonce_agg_test_case valid_case[%d];
     struct musig_nonce_agg_test_case error_case[%d];
 };
 """ % (
-        num_pnonces,
+        g.bytes_array_member(stats, "pnonces", num_pnonces, 66),
         num_valid_cases,
         num_error_cases,
     )
 
-    s += create_init("nonce_agg")
-    s += init_arrays("pnonces")
+    init += g.create_init("nonce_agg")
+    init += g.init_arrays(data, "pnonces")
 
     for cases in (data["valid_test_cases"], data["error_test_cases"]):
-        s += init_cases(
+        init += init_cases(
             cases,
-            lambda case: "{ { %s }, { %s }, %d },"
+            lambda case: "{ { %s }, %s, %d },"
             % (
                 ", ".join(map(str, case["pnonce_indices"])),
-                init_optional_expected(case),
+                g.init_bytes(case.get("expected")),
                 case["error"]["signer"] if "error" in case else 0,
             ),
         )
-    s += finish_init()
-
-# sign/verify vectors
-with open(sys.argv[1] + "/sign_verify_vectors.json", "r") as f:
-    data = json.load(f)
+    init += finish_init()
+    g.add_section("nonce_agg", decl, init)
 
-    # The MuSig2 implementation only allows messages of length 32
-    assert list(filter(lambda x: len(x) == 64, data["msgs"]))[0] == data["msgs"][0]
-    data["msgs"] = [data["msgs"][0]]
 
-    def filter_msg32(k):
-        return list(filter(lambda x: x["msg_index"] == 0, data[k]))
-
-    data["valid_test_cases"] = filter_msg32("valid_test_cases")
-    data["sign_error_test_cases"] = filter_msg32("sign_error_test_cases")
-    data["verify_error_test_cases"] = filter_msg32("verify_error_test_cases")
-    data["verify_fail_test_cases"] = filter_msg32("verify_fail_test_cases")
+def sign_verify(g, data, stats):
+    """Add the section for the partial signing and verification vectors."""
+    decl = ""
+    init = ""
 
     num_pubkeys = len(data["pubkeys"])
-    max_pubkeys = max(num_pubkeys, max_pubkeys)
+    g.max_pubkeys = max(num_pubkeys, g.max_pubkeys)
     num_secnonces = len(data["secnonces"])
     num_pubnonces = len(data["pnonces"])
     num_aggnonces = len(data["aggnonces"])
@@ -323,334 +829,344 @@ with open(sys.argv[1] + "/sign_verify_vectors.json", "r") as f:
     num_sign_error_cases = len(data["sign_error_test_cases"])
     num_verify_fail_cases = len(data["verify_fail_test_cases"])
     num_verify_error_cases = len(data["verify_error_test_cases"])
-
-    all_cases = (
-        data["valid_test_cases"]
-        + data["sign_error_test_cases"]
-        + data["verify_error_test_cases"]
-        + data["verify_fail_test_cases"]
-    )
-    max_key_indices = max(len(test_case["key_indices"]) for test_case in all_cases)
-    max_nonce_indices = max(
-        len(test_case["nonce_indices"]) if "nonce_indices" in test_case else 0
-        for test_case in all_cases
-    )
+    max_key_indices = stats["key_indices"]
+    max_nonce_indices = stats["nonce_indices"]
     # Add structures for valid and error cases
-    s += (
+    decl += (
         """
 /* Omit pubnonces in the test vectors because our partial signature verification
  * implementation is able to accept the aggnonce directly. */
 struct musig_valid_case {
     size_t key_indices_len;
-    size_t key_indices[%d];
+    %s
     size_t aggnonce_index;
     size_t msg_index;
     size_t signer_index;
-    unsigned char expected[32];
+    %s
 };
 """
-        % max_key_indices
+        % (g.indices_member("key_indices", max_key_indices), g.bytes_member("expected", 32, "c"))
     )
 
-    s += (
+    decl += (
         """
 struct musig_sign_error_case {
     size_t key_indices_len;
-    size_t key_indices[%d];
+    %s
     size_t aggnonce_index;
     size_t msg_index;
     size_t secnonce_index;
     enum MUSIG_ERROR error;
 };
 """
-        % max_key_indices
+        % g.indices_member("key_indices", max_key_indices)
     )
 
-    s += """
+    decl += """
 struct musig_verify_fail_error_case {
-    unsigned char sig[32];
+    %s
     size_t key_indices_len;
-    size_t key_indices[%d];
+    %s
     size_t nonce_indices_len;
-    size_t nonce_indices[%d];
+    %s
     size_t msg_index;
     size_t signer_index;
     enum MUSIG_ERROR error;
 };
 """ % (
-        max_key_indices,
-        max_nonce_indices,
+        g.bytes_member("sig", 32, "c"),
+        g.indices_member("key_indices", max_key_indices),
+        g.indices_member("nonce_indices", max_nonce_indices),
     )
 
     # Add structure for entire vector
-    s += """
+    decl += """
 struct musig_sign_verify_vector {
-    unsigned char sk[32];
-    unsigned char pubkeys[%d][33];
-    unsigned char secnonces[%d][194];
-    unsigned char pubnonces[%d][194];
-    unsigned char aggnonces[%d][66];
-    unsigned char msgs[%d][32];
+    %s
+    %s
+    %s
+    %s
+    %s
+    %s
     struct musig_valid_case valid_case[%d];
     struct musig_sign_error_case sign_error_case[%d];
     struct musig_verify_fail_error_case verify_fail_case[%d];
     struct musig_verify_fail_error_case verify_error_case[%d];
 };
 """ % (
-        num_pubkeys,
-        num_secnonces,
-        num_pubnonces,
-        num_aggnonces,
-        num_msgs,
+        g.bytes_member("sk", 32),
+        g.bytes_array_member(stats, "pubkeys", num_pubkeys, 33),
+        g.bytes_array_member(stats, "secnonces", num_secnonces, 194),
+        g.bytes_array_member(stats, "pubnonces", num_pubnonces, 194, "pnonces"),
+        g.bytes_array_member(stats, "aggnonces", num_aggnonces, 66),
+        g.bytes_array_member(stats, "msgs", num_msgs, 32),
         num_valid_cases,
         num_sign_error_cases,
         num_verify_fail_cases,
         num_verify_error_cases,
     )
 
-    s += create_init("sign_verify")
-    s += init_array("sk")
-    s += init_arrays("pubkeys")
-    s += init_arrays("secnonces")
-    s += init_arrays("pnonces")
-    s += init_arrays("aggnonces")
-    s += init_arrays("msgs")
+    init += g.create_init("sign_verify")
+    init += g.init_array(data, "sk")
+    init += g.init_arrays(data, "pubkeys")
+    init += g.init_arrays(data, "secnonces")
+    init += g.init_arrays(data, "pnonces")
+    init += g.init_arrays(data, "aggnonces")
+    init += g.init_arrays(data, "msgs")
 
-    s += init_cases(
+    init += init_cases(
         data["valid_test_cases"],
-        lambda case: "{ %s, %d, %d, %d, { %s }},"
+        lambda case: "{ %s, %d, %d, %d, %s},"
         % (
-            init_indices(case["key_indices"]),
+            g.init_indices(case["key_indices"]),
             case["aggnonce_index"],
             case["msg_index"],
             case["signer_index"],
-            init_optional_expected(case),
+            g.init_bytes(case.get("expected")),
         ),
     )
 
-    def sign_error(case):
-        comment = case["comment"]
-        if "pubkey" in comment or "public key" in comment:
-            return "MUSIG_PUBKEY"
-        elif "Aggregate nonce" in comment:
-            return "MUSIG_AGGNONCE"
-        elif "Secnonce" in comment:
-            return "MUSIG_SECNONCE"
-        else:
-            sys.exit("Unknown sign error")
-
-    s += init_cases(
+    init += init_cases(
         data["sign_error_test_cases"],
         lambda case: "{ %s, %d, %d, %d, %s },"
         % (
-            init_indices(case["key_indices"]),
+            g.init_indices(case["key_indices"]),
             case["aggnonce_index"],
             case["msg_index"],
             case["secnonce_index"],
-            sign_error(case),
+            sign_error(case["comment"]),
         ),
     )
 
-    def verify_error(case):
-        comment = case["comment"]
-        if "exceeds" in comment:
-            return "MUSIG_SIG"
-        elif "Wrong signer" in comment or "Wrong signature" in comment:
-            return "MUSIG_SIG_VERIFY"
-        elif "pubnonce" in comment:
-            return "MUSIG_PUBNONCE"
-        elif "pubkey" in comment:
-            return "MUSIG_PUBKEY"
-        else:
-            sys.exit("Unknown verify error")
-
     for cases in ("verify_fail_test_cases", "verify_error_test_cases"):
-        s += init_cases(
+        init += init_cases(
             data[cases],
-            lambda case: "{ { %s }, %s, %s, %d, %d, %s },"
+            lambda case: "{ %s, %s, %s, %d, %d, %s },"
             % (
-                hexstr_to_intarray(case["sig"]),
-                init_indices(case["key_indices"]),
-                init_indices(case["nonce_indices"]),
+                g.init_bytes(case["sig"]),
+                g.init_indices(case["key_indices"]),
+                g.init_indices(case["nonce_indices"]),
                 case["msg_index"],
                 case["signer_index"],
-                verify_error(case),
+                verify_error(case["comment"]),
             ),
         )
 
-    s += finish_init()
+    init += finish_init()
+    g.add_section("sign_verify", decl, init)
+
 
-# tweak vectors
-with open(sys.argv[1] + "/tweak_vectors.json", "r") as f:
-    data = json.load(f)
+def tweak(g, data, stats):
+    """Add the section for the tweaking vectors."""
+    decl = ""
+    init = ""
 
     num_pubkeys = len(data["pubkeys"])
-    max_pubkeys = max(num_pubkeys, max_pubkeys)
+    g.max_pubkeys = max(num_pubkeys, g.max_pubkeys)
     num_pubnonces = len(data["pnonces"])
     num_tweaks = len(data["tweaks"])
     num_valid_cases = len(data["valid_test_cases"])
     num_error_cases = len(data["error_test_cases"])
-
-    all_cases = data["valid_test_cases"] + data["error_test_cases"]
-    max_key_indices = max(len(test_case["key_indices"]) for test_case in all_cases)
-    max_tweak_indices = max(len(test_case["tweak_indices"]) for test_case in all_cases)
-    max_nonce_indices = max(len(test_case["nonce_indices"]) for test_case in all_cases)
+    max_key_indices = stats["key_indices"]
+    max_tweak_indices = stats["tweak_indices"]
+    max_nonce_indices = stats["nonce_indices"]
     # Add structures for valid and error cases
-    s += """
+    decl += """
 struct musig_tweak_case {
     size_t key_indices_len;
-    size_t key_indices[%d];
+    %s
     size_t nonce_indices_len;
-    size_t nonce_indices[%d];
+    %s
     size_t tweak_indices_len;
-    size_t tweak_indices[%d];
-    int is_xonly[%d];
+    %s
+    %s
     size_t signer_index;
-    unsigned char expected[32];
+    %s
 };
 """ % (
-        max_key_indices,
-        max_nonce_indices,
-        max_tweak_indices,
-        max_tweak_indices,
+        g.indices_member("key_indices", max_key_indices),
+        g.indices_member("nonce_indices", max_nonce_indices),
+        g.indices_member("tweak_indices", max_tweak_indices),
+        g.is_xonly_member(max_tweak_indices),
+        g.bytes_member("expected", 32, "c"),
     )
 
     # Add structure for entire vector
-    s += """
+    decl += """
 struct musig_tweak_vector {
-    unsigned char sk[32];
-    unsigned char secnonce[97];
-    unsigned char aggnonce[66];
-    unsigned char msg[32];
-    unsigned char pubkeys[%d][33];
-    unsigned char pubnonces[%d][194];
-    unsigned char tweaks[%d][32];
+    %s
+    %s
+    %s
+    %s
+    %s
+    %s
+    %s
     struct musig_tweak_case valid_case[%d];
     struct musig_tweak_case error_case[%d];
 };
 """ % (
-        num_pubkeys,
-        num_pubnonces,
-        num_tweaks,
+        g.bytes_member("sk", 32),
+        g.bytes_member("secnonce", 97),
+        g.bytes_member("aggnonce", 66),
+        g.bytes_member("msg", 32),
+        g.bytes_array_member(stats, "pubkeys", num_pubkeys, 33),
+        g.bytes_array_member(stats, "pubnonces", num_pubnonces, 194, "pnonces"),
+        g.bytes_array_member(stats, "tweaks", num_tweaks, 32),
         num_valid_cases,
         num_error_cases,
     )
-    s += create_init("tweak")
-    s += init_array("sk")
-    s += init_array("secnonce")
-    s += init_array("aggnonce")
-    s += init_array("msg")
-    s += init_arrays("pubkeys")
-    s += init_arrays("pnonces")
-    s += init_arrays("tweaks")
-
-    s += init_cases(
+    init += g.create_init("tweak")
+    init += g.init_array(data, "sk")
+    init += g.init_array(data, "secnonce")
+    init += g.init_array(data, "aggnonce")
+    init += g.init_array(data, "msg")
+    init += g.init_arrays(data, "pubkeys")
+    init += g.init_arrays(data, "pnonces")
+    init += g.init_arrays(data, "tweaks")
+
+    init += init_cases(
         data["valid_test_cases"],
-        lambda case: "{ %s, %s, %s, { %s }, %d, { %s }},"
+        lambda case: "{ %s, %s, %s, %s, %d, %s},"
         % (
-            init_indices(case["key_indices"]),
-            init_indices(case["nonce_indices"]),
-            init_indices(case["tweak_indices"]),
-            init_is_xonly(case),
+            g.init_indices(case["key_indices"]),
+            g.init_indices(case["nonce_indices"]),
+            g.init_indices(case["tweak_indices"]),
+            g.init_is_xonly(case),
             case["signer_index"],
-            init_optional_expected(case),
+            g.init_bytes(case.get("expected")),
         ),
     )
 
-    s += init_cases(
+    init += init_cases(
         data["error_test_cases"],
-        lambda case: "{ %s, %s, %s, { %s }, %d, { %s }},"
+        lambda case: "{ %s, %s, %s, %s, %d, %s},"
         % (
-            init_indices(case["key_indices"]),
-            init_indices(case["nonce_indices"]),
-            init_indices(case["tweak_indices"]),
-            init_is_xonly(case),
+            g.init_indices(case["key_indices"]),
+            g.init_indices(case["nonce_indices"]),
+            g.init_indices(case["tweak_indices"]),
+            g.init_is_xonly(case),
             case["signer_index"],
-            init_optional_expected(case),
+            g.init_bytes(case.get("expected")),
         ),
     )
 
-    s += finish_init()
+    init += finish_init()
+    g.add_section("tweak", decl, init)
+
 
-# sigagg vectors
-with open(sys.argv[1] + "/sig_agg_vectors.json", "r") as f:
-    data = json.load(f)
+def sig_agg(g, data, stats):
+    """Add the section for the signature aggregation vectors."""
+    decl = ""
+    init = ""
 
     num_pubkeys = len(data["pubkeys"])
-    max_pubkeys = max(num_pubkeys, max_pubkeys)
+    g.max_pubkeys = max(num_pubkeys, g.max_pubkeys)
     num_tweaks = len(data["tweaks"])
     num_psigs = len(data["psigs"])
     num_valid_cases = len(data["valid_test_cases"])
     num_error_cases = len(data["error_test_cases"])
-
-    all_cases = data["valid_test_cases"] + data["error_test_cases"]
-    max_key_indices = max(len(test_case["key_indices"]) for test_case in all_cases)
-    max_tweak_indices = max(len(test_case["tweak_indices"]) for test_case in all_cases)
-    max_psig_indices = max(len(test_case["psig_indices"]) for test_case in all_cases)
+    max_key_indices = stats["key_indices"]
+    max_tweak_indices = stats["tweak_indices"]
+    max_psig_indices = stats["psig_indices"]
 
     # Add structures for valid and error cases
-    s += """
+    decl += """
 /* Omit pubnonces in the test vectors because they're only needed for
  * implementations that do not directly accept an aggnonce. */
 struct musig_sig_agg_case {
     size_t key_indices_len;
-    size_t key_indices[%d];
+    %s
     size_t tweak_indices_len;
-    size_t tweak_indices[%d];
-    int is_xonly[%d];
-    unsigned char aggnonce[66];
+    %s
+    %s
+    %s
     size_t psig_indices_len;
-    size_t psig_indices[%d];
+    %s
     /* if valid case */
-    unsigned char expected[64];
+    %s
     /* if error case */
     int invalid_sig_idx;
 };
 """ % (
-        max_key_indices,
-        max_tweak_indices,
-        max_tweak_indices,
-        max_psig_indices,
+        g.indices_member("key_indices", max_key_indices),
+        g.indices_member("tweak_indices", max_tweak_indices),
+        g.is_xonly_member(max_tweak_indices),
+        g.bytes_member("aggnonce", 66, "c"),
+        g.indices_member("psig_indices", max_psig_indices),
+        g.bytes_member("expected", 64, "c"),
     )
 
     # Add structure for entire vector
-    s += """
+    decl += """
 struct musig_sig_agg_vector {
-    unsigned char pubkeys[%d][33];
-    unsigned char tweaks[%d][32];
-    unsigned char psigs[%d][32];
-    unsigned char msg[32];
+    %s
+    %s
+    %s
+    %s
     struct musig_sig_agg_case valid_case[%d];
     struct musig_sig_agg_case error_case[%d];
 };
 """ % (
-        num_pubkeys,
-        num_tweaks,
-        num_psigs,
+        g.bytes_array_member(stats, "pubkeys", num_pubkeys, 33),
+        g.bytes_array_member(stats, "tweaks", num_tweaks, 32),
+        g.bytes_array_member(stats, "psigs", num_psigs, 32),
+        g.bytes_member("msg", 32),
         num_valid_cases,
         num_error_cases,
     )
 
-    s += create_init("sig_agg")
-    s += init_arrays("pubkeys")
-    s += init_arrays("tweaks")
-    s += init_arrays("psigs")
-    s += init_array("msg")
+    init += g.create_init("sig_agg")
+    init += g.init_arrays(data, "pubkeys")
+    init += g.init_arrays(data, "tweaks")
+    init += g.init_arrays(data, "psigs")
+    init += g.init_array(data, "msg")
 
     for cases in (data["valid_test_cases"], data["error_test_cases"]):
-        s += init_cases(
+        init += init_cases(
             cases,
-            lambda case: "{ %s, %s, { %s }, { %s }, %s, { %s }, %d },"
+            lambda case: "{ %s, %s, %s, %s, %s, %s, %d },"
             % (
-                init_indices(case["key_indices"]),
-                init_indices(case["tweak_indices"]),
-                init_is_xonly(case),
-                hexstr_to_intarray(case["aggnonce"]),
-                init_indices(case["psig_indices"]),
-                init_optional_expected(case),
+                g.init_indices(case["key_indices"]),
+                g.init_indices(case["tweak_indices"]),
+                g.init_is_xonly(case),
+                g.init_bytes(case["aggnonce"]),
+                g.init_indices(case["psig_indices"]),
+                g.init_bytes(case.get("expected")),
                 case["error"]["signer"] if "error" in case else 0,
             ),
         )
-    s += finish_init()
-s += "enum { MUSIG_VECTORS_MAX_PUBKEYS = %d };" % max_pubkeys
-print(s)
+    init += finish_init()
+    g.add_section("sig_agg", decl, init)
+
+
+# The vector sections, emitted in this order, each from the JSON file
+# <name>_vectors.json.
+SECTIONS = [
+    ("key_agg", key_agg),
+    ("nonce_gen", nonce_gen),
+    ("nonce_agg", nonce_agg),
+    ("sign_verify", sign_verify),
+    ("tweak", tweak),
+    ("sig_agg", sig_agg),
+]
+NUM_SECTIONS = len(SECTIONS)
+
+
+def main(argv=None, out=None, prog=None):
+    """Run the conversion with the given command line arguments. The header
+    goes to out, which defaults to stdout. prog is the name
+    recorded in the generated files and defaults to sys.argv[0]."""
+    args = parse_args(argv)
+    g = Generator(args, sys.argv[0] if prog is None else prog)
+    try:
+        loaded = load_sections(args.dir)
+    except VectorError as e:
+        sys.exit(str(e))
+    for ((name, section), (data, stats)) in zip(SECTIONS, loaded):
+        g.begin_section(name)
+        section(g, data, stats)
+    g.write_header(out or sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,112 +4,356 @@
 # file COPYING or https://www.opensource.org/licenses/mit-license.php.
 '''
 Generate a C file with ECDSA testvectors from the Wycheproof project.
+
+The header is written to stdout.
+
+With --group-by-key all vectors for the same public key are made contiguous
+(keeping their original tcId) and a table of these key groups is emitted, so
+that a harness can parse each public key once. With --der-metadata the DER
+class and the position of r and s are precomputed for every signature.
+
+With --bench a dataset for src/bench.c is written instead: every vector whose
+signature parses and is in range, i.e. which secp256k1_ecdsa_verify has to
+work on, grouped by public key, with the message already hashed and the
+signature in compact form.
 '''
 
+import argparse
+import hashlib
 import json
 import sys
 
-filename_input = sys.argv[1]
+from c_emitter import HEX_LOWER, InternPool, Writer, c_bytes, typedef_struct
+
 
-with open(filename_input) as f:
-    doc = json.load(f)
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", help="Wycheproof ECDSA JSON file")
+    parser.add_argument("--group-by-key", action="store_true",
+                        help="make vectors sharing a public key contiguous and emit a key group table")
+    parser.add_argument("--der-metadata", action="store_true",
+                        help="emit the DER class and r/s offsets and lengths of every signature")
+    parser.add_argument("--bench", action="store_true",
+                        help="write the benchmark dataset instead of the testvectors")
+    args = parser.parse_args(argv)
+    if args.bench:
+        args.group_by_key = args.der_metadata = True
+    return args
 
-num_groups = len(doc['testGroups'])
 
 def to_c_array(x):
-    if x == "":
-        return ""
-    s = ',0x'.join(a+b for a,b in zip(x[::2], x[1::2]))
-    return "0x" + s
-
-
-num_vectors = 0
-offset_msg_running, offset_pk_running, offset_sig = 0, 0, 0
-out = ""
-messages = ""
-signatures = ""
-public_keys = ""
-cache_msgs = {}
-cache_public_keys = {}
-
-for i in range(num_groups):
-    group = doc['testGroups'][i]
-    num_tests = len(group['tests'])
-    public_key = group['publicKey']
-    for j in range(num_tests):
-        test_vector = group['tests'][j]
-        # // 2 to convert hex to byte length
-        sig_size = len(test_vector['sig']) // 2
-        msg_size = len(test_vector['msg']) // 2
-
-        if test_vector['result'] == "invalid":
-            expected_verify = 0
-        elif test_vector['result'] == "valid":
-            expected_verify = 1
-        else:
-            raise ValueError("invalid result field")
-
-        if num_vectors != 0 and sig_size != 0:
-            signatures += ",\n  "
-
-        new_msg = False
-        msg = to_c_array(test_vector['msg'])
-        msg_offset = offset_msg_running
-        # check for repeated msg
-        if msg not in cache_msgs:
-            if num_vectors != 0 and msg_size != 0:
-                messages += ",\n  "
-            cache_msgs[msg] = offset_msg_running
-            messages += msg
-            new_msg = True
-        else:
-            msg_offset = cache_msgs[msg]
-
-        new_pk = False
-        pk = to_c_array(public_key['uncompressed'])
-        pk_offset = offset_pk_running
-        # check for repeated pk
-        if pk not in cache_public_keys:
-            if num_vectors != 0:
-                public_keys += ",\n  "
-            cache_public_keys[pk] = offset_pk_running
-            public_keys += pk
-            new_pk = True
-        else:
-            pk_offset = cache_public_keys[pk]
+    return c_bytes(x, ",", HEX_LOWER)
+
+
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+def der_read_len(sig, pos):
+    """Port of secp256k1_der_read_len. Returns (len, pos) or None."""
+    if pos >= len(sig):
+        return None
+    b1 = sig[pos]
+    pos += 1
+    if b1 == 0xFF:
+        return None
+    if b1 & 0x80 == 0:
+        return b1, pos
+    if b1 == 0x80:
+        return None
+    lenleft = b1 & 0x7F
+    if lenleft > len(sig) - pos:
+        return None
+    if sig[pos] == 0:
+        return None
+    length = int.from_bytes(sig[pos:pos + lenleft], 'big')
+    pos += lenleft
+    if length > len(sig) - pos:
+        return None
+    if length < 128:
+        return None
+    return length, pos
+
+
+def der_parse_integer(sig, pos):
+    """Port of secp256k1_der_parse_integer. Returns (value, offset, len, pos)
+    or None, where value is None if the integer overflows a scalar."""
+    if pos == len(sig) or sig[pos] != 0x02:
+        return None
+    res = der_read_len(sig, pos + 1)
+    if res is None:
+        return None
+    rlen, pos = res
+    if rlen == 0 or rlen > len(sig) - pos:
+        return None
+    if sig[pos] == 0x00 and rlen > 1 and sig[pos + 1] & 0x80 == 0x00:
+        return None
+    if sig[pos] == 0xFF and rlen > 1 and sig[pos + 1] & 0x80 == 0x80:
+        return None
+    overflow = sig[pos] & 0x80 == 0x80
+    if sig[pos] == 0:
+        rlen -= 1
+        pos += 1
+    value = int.from_bytes(sig[pos:pos + rlen], 'big')
+    if rlen > 32 or value >= SECP256K1_N:
+        overflow = True
+    return None if overflow else value, pos, rlen, pos + rlen
+
+
+def der_classify(sig):
+    """Classify a signature the way secp256k1_ecdsa_signature_parse_der and
+    secp256k1_ecdsa_verify see it. Returns (class, r_offset, r_len, s_offset,
+    s_len); offsets are relative to the start of the signature."""
+    if len(sig) == 0 or sig[0] != 0x30:
+        return "WYCHEPROOF_DER_INVALID", 0, 0, 0, 0
+    res = der_read_len(sig, 1)
+    if res is None or res[0] != len(sig) - res[1]:
+        return "WYCHEPROOF_DER_INVALID", 0, 0, 0, 0
+    r = der_parse_integer(sig, res[1])
+    if r is None:
+        return "WYCHEPROOF_DER_INVALID", 0, 0, 0, 0
+    s = der_parse_integer(sig, r[3])
+    if s is None or s[3] != len(sig):
+        return "WYCHEPROOF_DER_INVALID", 0, 0, 0, 0
+    if not r[0] or not s[0]:
+        der_class = "WYCHEPROOF_DER_OUT_OF_RANGE"
+    elif s[0] > SECP256K1_N // 2:
+        der_class = "WYCHEPROOF_DER_HIGH_S"
+    else:
+        der_class = "WYCHEPROOF_DER_VALID"
+    return der_class, r[1], r[2], s[1], s[2]
+
+
+def load_vectors(doc, args):
+    """Flatten the test groups of a Wycheproof document into a list of
+    vectors, ordered and annotated as requested by args."""
+    vectors = []
+    for group in doc['testGroups']:
+        public_key = bytes.fromhex(group['publicKey']['uncompressed'])
+        for test_vector in group['tests']:
+            if test_vector['result'] == "invalid":
+                expected_verify = 0
+            elif test_vector['result'] == "valid":
+                expected_verify = 1
+            else:
+                raise ValueError("invalid result field")
+            vectors.append({
+                'tcId': test_vector['tcId'],
+                'comment': test_vector['comment'],
+                'pk': public_key,
+                'msg': bytes.fromhex(test_vector['msg']),
+                'sig': bytes.fromhex(test_vector['sig']),
+                'expected_verify': expected_verify,
+            })
+
+    if args.group_by_key:
+        # Stable sort by the first appearance of each public key.
+        first_seen = {}
+        for test_vector in vectors:
+            first_seen.setdefault(test_vector['pk'], len(first_seen))
+        vectors.sort(key=lambda v: first_seen[v['pk']])
+
+    if args.der_metadata:
+        for test_vector in vectors:
+            test_vector['der'] = der_classify(test_vector['sig'])
+            # Only signatures which parse and are in range can ever verify.
+            if test_vector['der'][0] != "WYCHEPROOF_DER_VALID" and test_vector['expected_verify'] != 0:
+                raise ValueError("tcId %d: valid vector with DER class %s" % (test_vector['tcId'], test_vector['der'][0]))
+
+    return vectors
+
+
+class VectorData:
+    """The C arrays for a list of vectors. Repeated messages and public keys
+    are stored only once; all offsets are relative to these arrays."""
+
+    def __init__(self, vectors, args):
+        self.messages = InternPool()
+        self.public_keys = InternPool()
+        self.signatures = []
+        self.rows = []
+        # (pk_offset, first_testvector, num_testvectors) of each run of
+        # vectors with the same public key
+        self.key_groups = []
+
+        offset_sig = 0
+        for i, test_vector in enumerate(vectors):
+            msg_offset = self.messages.intern(test_vector['msg'])
+            pk_offset = self.public_keys.intern(test_vector['pk'])
+            if self.key_groups and self.key_groups[-1][0] == pk_offset:
+                self.key_groups[-1][2] += 1
+            else:
+                self.key_groups.append([pk_offset, i, 1])
+
+            sig_size = len(test_vector['sig'])
+            self.signatures.append(test_vector['sig'])
+
+            fields = [pk_offset, msg_offset, len(test_vector['msg']), offset_sig, sig_size, test_vector['expected_verify']]
+            if args.group_by_key:
+                fields.insert(0, test_vector['tcId'])
+            if args.der_metadata:
+                fields.extend(test_vector['der'])
+            self.rows.append((test_vector['tcId'], test_vector['comment'], fields))
+            offset_sig += sig_size
 
-        signatures += to_c_array(test_vector['sig'])
+    def write_arrays(self, w):
+        """Write the message, public key and signature arrays."""
+        for (decl, strings) in (
+            ("static const unsigned char wycheproof_ecdsa_messages[]    = { ", self.messages),
+            ("static const unsigned char wycheproof_ecdsa_public_keys[] = { ", self.public_keys),
+            ("static const unsigned char wycheproof_ecdsa_signatures[]  = { ", self.signatures),
+        ):
+            elements = [to_c_array(x) for x in strings if len(x) > 0]
+            w.join(decl, elements, ",\n  ", "};\n\n")
 
-        out += "  /" + "* tcId: " + str(test_vector['tcId']) + ". " + test_vector['comment'] + " *" + "/\n"
-        out += f"  {{{pk_offset}, {msg_offset}, {msg_size}, {offset_sig}, {sig_size}, {expected_verify} }},\n"
-        if new_msg:
-            offset_msg_running += msg_size
-        if new_pk:
-            offset_pk_running += 65
-        offset_sig += sig_size
-        num_vectors += 1
+    def table_lines(self):
+        for (tc_id, comment, fields) in self.rows:
+            yield "  /" + "* tcId: " + str(tc_id) + ". " + comment + " *" + "/\n"
+            yield "  {" + ", ".join(map(str, fields)) + " },\n"
 
-struct_definition = """
+    def key_group_lines(self):
+        for (pk_offset, first, num) in self.key_groups:
+            yield f"  {{{pk_offset}, {first}, {num} }},\n"
+
+
+def testvector_struct_definition(args):
+    fields = [
+        "size_t pk_offset;",
+        "size_t msg_offset;",
+        "size_t msg_len;",
+        "size_t sig_offset;",
+        "size_t sig_len;",
+        "int expected_verify;",
+    ]
+    if args.group_by_key:
+        fields.insert(0, "size_t tc_id;")
+    if args.der_metadata:
+        fields.extend([
+            "wycheproof_der_class der_class;",
+            "/* position of r and s within the signature, without leading zero byte */",
+            "size_t r_offset;",
+            "size_t r_len;",
+            "size_t s_offset;",
+            "size_t s_len;",
+        ])
+    s = ""
+    if args.der_metadata:
+        s += DER_CLASS_DEFINITION
+    s += typedef_struct("wycheproof_ecdsa_testvector", fields)
+    return s
+
+
+DER_CLASS_DEFINITION = """
+typedef enum {
+    /* rejected by secp256k1_ecdsa_signature_parse_der */
+    WYCHEPROOF_DER_INVALID,
+    /* parses, but r or s is zero, negative or not less than the group order */
+    WYCHEPROOF_DER_OUT_OF_RANGE,
+    /* parses and is in range, but rejected by secp256k1_ecdsa_verify for its high s */
+    WYCHEPROOF_DER_HIGH_S,
+    /* parses and is in range; needs an actual verification */
+    WYCHEPROOF_DER_VALID
+} wycheproof_der_class;
+"""
+
+key_group_struct_definition = """
+/* A run of testvectors which all use the public key at pk_offset. */
 typedef struct {
     size_t pk_offset;
-    size_t msg_offset;
-    size_t msg_len;
-    size_t sig_offset;
-    size_t sig_len;
+    size_t first_testvector;
+    size_t num_testvectors;
+} wycheproof_ecdsa_key_group;
+"""
+
+
+note = "/* Note: this file was autogenerated using tests_wycheproof_generate.py. Do not edit. */"
+
+
+def write_header(vectors, args, out):
+    data = VectorData(vectors, args)
+    w = Writer(out)
+
+    w.line(note)
+    w.line(f"#define SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS ({len(vectors)})")
+    if args.group_by_key:
+        w.line(f"#define SECP256K1_ECDSA_WYCHEPROOF_NUMBER_KEY_GROUPS ({len(data.key_groups)})")
+
+    w.line(testvector_struct_definition(args))
+    if args.group_by_key:
+        w.line(key_group_struct_definition)
+
+    data.write_arrays(w)
+
+    w.join("static const wycheproof_ecdsa_testvector testvectors[SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS] = {\n",
+           data.table_lines(), "", "\n};\n")
+    if args.group_by_key:
+        w.join("\nstatic const wycheproof_ecdsa_key_group wycheproof_ecdsa_key_groups[SECP256K1_ECDSA_WYCHEPROOF_NUMBER_KEY_GROUPS] = {\n",
+               data.key_group_lines(), "", "\n};\n")
+
+
+BENCH_DEFINITIONS = """
+typedef struct {
+    unsigned char msghash[32];
+    unsigned char sig[64];
+    int high_s;
     int expected_verify;
-} wycheproof_ecdsa_testvector;
+} wycheproof_ecdsa_bench_vector;
+
+typedef struct {
+    unsigned char pk[65];
+    size_t num_vectors;
+} wycheproof_ecdsa_bench_key;
 """
 
 
-print("/* Note: this file was autogenerated using tests_wycheproof_generate.py. Do not edit. */")
-print(f"#define SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS ({num_vectors})")
+def compact_signature(sig, der):
+    """Return r and s of a DER signature as 64 bytes, given its der_classify
+    result."""
+    _, r_offset, r_len, s_offset, s_len = der
+    return (sig[r_offset:r_offset + r_len].rjust(32, b'\0') +
+            sig[s_offset:s_offset + s_len].rjust(32, b'\0'))
+
+
+def write_bench(vectors, out):
+    """Write the benchmark dataset for vectors loaded with group_by_key and
+    der_metadata."""
+    keys = []
+    rows = []
+    for test_vector in vectors:
+        der_class = test_vector['der'][0]
+        if der_class not in ("WYCHEPROOF_DER_VALID", "WYCHEPROOF_DER_HIGH_S"):
+            continue
+        if keys and keys[-1][0] == test_vector['pk']:
+            keys[-1][1] += 1
+        else:
+            keys.append([test_vector['pk'], 1])
+        rows.append((hashlib.sha256(test_vector['msg']).digest(),
+                     compact_signature(test_vector['sig'], test_vector['der']),
+                     int(der_class == "WYCHEPROOF_DER_HIGH_S"),
+                     test_vector['expected_verify']))
+
+    w = Writer(out)
+    w.line(note)
+    w.line(f"#define SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_VECTORS ({len(rows)})")
+    w.line(f"#define SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_KEYS ({len(keys)})")
+    w.line(BENCH_DEFINITIONS)
+    w.join("static const wycheproof_ecdsa_bench_key wycheproof_ecdsa_bench_keys[SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_KEYS] = {\n",
+           (f"  {{ {{{to_c_array(pk)}}}, {num} }},\n" for (pk, num) in keys), "", "};\n\n")
+    w.join("static const wycheproof_ecdsa_bench_vector wycheproof_ecdsa_bench_vectors[SECP256K1_ECDSA_WYCHEPROOF_BENCH_NUMBER_VECTORS] = {\n",
+           (f"  {{ {{{to_c_array(msghash)}}}, {{{to_c_array(sig)}}}, {high_s}, {expected} }},\n"
+            for (msghash, sig, high_s, expected) in rows), "", "};\n")
+
 
-print(struct_definition)
+def main(argv=None, out=None):
+    """Run the generator with the given command line arguments. The output
+    goes to out, which defaults to stdout."""
+    args = parse_args(argv)
+    with open(args.input) as f:
+        doc = json.load(f)
+    vectors = load_vectors(doc, args)
+    if args.bench:
+        write_bench(vectors, out or sys.stdout)
+    else:
+        write_header(vectors, args, out or sys.stdout)
 
-print("static const unsigned char wycheproof_ecdsa_messages[]    = { " + messages + "};\n")
-print("static const unsigned char wycheproof_ecdsa_public_keys[] = { " + public_keys + "};\n")
-print("static const unsigned char wycheproof_ecdsa_signatures[]  = { " + signatures + "};\n")
 
-print("static const wycheproof_ecdsa_testvector testvectors[SECP256K1_ECDSA_WYCHEPROOF_NUMBER_TESTVECTORS] = {")
-print(out)
-print("};")
+if __name__ == "__main__":
+    main()